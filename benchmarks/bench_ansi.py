@@ -0,0 +1,48 @@
+"""
+Decoding ANSI SGR output, such as that relayed from another game or a bridged chat, with the
+ansi codec against rich's Text.from_ansi, both in one call and fed in network sized chunks.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_ansi.py
+"""
+import timeit
+
+from rich.text import Text
+
+from mudstring.encodings import ansi
+
+ROWS = "".join(
+    f"\x1b[1;36m{name:<16}\x1b[0m \x1b[33m{idle:>4}m\x1b[0m \x1b[38;5;208m{doing}\x1b[0m\n"
+    for name, idle, doing in (("Volund", 3, "Coding"), ("Ashe", 12, "Idle"), ("Kaine", 0, "RP"))
+)
+ROOM = (
+    "\x1b[1m\x1b[32mThe Plaza\x1b[0m\n"
+    "\x1b[37mA wide square paved in \x1b[38;2;180;160;120msandstone\x1b[37m, "
+    "where \x1b[1;4mmerchants\x1b[22;24m gather.\x1b[0m\n"
+    "\x1b[1;33mObvious exits:\x1b[0m \x1b[36mnorth\x1b[0m, \x1b[36msouth\x1b[0m\n"
+)
+CORPUS = (ROWS * 20, ROOM * 20)
+
+
+def chunked(src: str, size: int = 512):
+    decoder = ansi.IncrementalDecoder()
+    out = [decoder.feed(src[i : i + size]) for i in range(0, len(src), size)]
+    out.append(decoder.flush())
+    return out
+
+
+def main():
+    number = 200
+    print(f"{'corpus':>8} {'from_ansi':>10} {'decode':>10} {'chunked':>10}  us")
+    for label, src in zip(("who", "room"), CORPUS):
+        results = [
+            min(timeit.repeat(lambda: Text.from_ansi(src), number=number, repeat=3)),
+            min(timeit.repeat(lambda: ansi.decode(src), number=number, repeat=3)),
+            min(timeit.repeat(lambda: chunked(src), number=number, repeat=3)),
+        ]
+        per = [r / number * 1e6 for r in results]
+        print(f"{label:>8} {per[0]:10.1f} {per[1]:10.1f} {per[2]:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Micro-benchmark for PennMUSH ansi() style compilation, memoized vs. uncached.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_ansi_fun.py
+"""
+import timeit
+
+from mudstring.encodings import pennmush
+from mudstring.encodings.base import ProtoStyle
+
+
+CODES = ("hr", "+orange/+black", "<255 0 0>", "hu#00ff00", "123/45", "n")
+
+
+def uncached(code: str):
+    mark = ProtoStyle()
+    pennmush.apply_rules(mark, code.strip())
+    return mark.convert()
+
+
+def main():
+    number = 20_000
+    print(f"{'code':>16} {'uncached (us)':>14} {'cached (us)':>12}")
+    for code in CODES:
+        slow = min(timeit.repeat(lambda: uncached(code), number=number, repeat=3))
+        fast = min(timeit.repeat(lambda: pennmush.ansi_fun_style(code), number=number, repeat=3))
+        print(f"{code:>16} {slow / number * 1e6:>14.2f} {fast / number * 1e6:>12.2f}")
+    print(pennmush.compile_ansi.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Cost of the PennMUSH color name table: importing it, building the index on first use, the memory
+it holds, and looking names up and completing them.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_colors.py
+"""
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    # Each import has to happen in a fresh interpreter; rich is imported first so that only the
+    # colors module itself is measured.
+    script = (
+        "import time, rich.color\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    times = [
+        float(subprocess.check_output([sys.executable, "-c", script], text=True))
+        for _ in range(repeat)
+    ]
+    return min(times)
+
+
+def main():
+    module = import_time("import mudstring.encodings.colors")
+    built = import_time("import mudstring.encodings.colors as c; c.color_index()")
+    print(f"import colors:         {module * 1e3:8.3f} ms")
+    print(f"import + color_index:  {built * 1e3:8.3f} ms")
+
+    from mudstring.encodings import colors
+
+    tracemalloc.start()
+    index = colors.ColorIndex()
+    index_size, _ = tracemalloc.get_traced_memory()
+    legacy = colors.COLORS
+    legacy_size = tracemalloc.get_traced_memory()[0] - index_size
+    tracemalloc.stop()
+    print(f"ColorIndex memory:     {index_size / 1024:8.1f} KiB")
+    print(f"COLORS dicts memory:   {legacy_size / 1024:8.1f} KiB")
+
+    names = list(index.names)
+    number = 20
+    lookup = min(timeit.repeat(lambda: [index.color(n) for n in names], number=number, repeat=3))
+    legacy_lookup = min(
+        timeit.repeat(
+            lambda: [colors.Color.from_ansi(legacy[n]["xterm"]) for n in names],
+            number=number,
+            repeat=3,
+        )
+    )
+    per = number * len(names)
+    print(f"COLORS + from_ansi:    {legacy_lookup / per * 1e6:8.3f} us/name")
+    print(f"ColorIndex.color:      {lookup / per * 1e6:8.3f} us/name")
+
+    prefixes = sorted({n[:3] for n in names})
+    complete = min(
+        timeit.repeat(lambda: [index.complete(p) for p in prefixes], number=number, repeat=3)
+    )
+    print(f"ColorIndex.complete:   {complete / number / len(prefixes) * 1e6:8.3f} us/prefix")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Per-item cost of decoding many short strings, such as the rows of a WHO list: calling decode()
+once per row, against one decode_many() call for the whole list, with and without joining the
+rows into a single Text.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_decode_many.py
+"""
+import timeit
+
+from rich.text import Text
+
+from mudstring.encodings import decode_many, get_codec
+
+
+def who_rows(codec: str, rows: int = 200):
+    names = ("Volund", "Ashe", "Kaine", "Rook", "Ilsa")
+    found = list()
+    for i in range(rows):
+        name = names[i % len(names)]
+        idle = f"{i % 60}m"
+        if codec == "pennmush":
+            found.append(f"\002chc\003{name:<16}\002c/\003 \002cy\003{idle:>5}\002c/\003 On duty")
+        elif codec == "evennia":
+            found.append(f"|c{name:<16}|n |Y{idle:>5}|n On duty")
+        else:
+            found.append(f"&C{name:<16}&d &Y{idle:>5}&d On duty")
+    return found
+
+
+def main():
+    number = 50
+    print(f"{'codec':>10} {'decode':>10} {'many':>10} {'joined':>10} {'decode+join':>12}  us/row")
+    for codec in ("pennmush", "evennia", "circle"):
+        rows = who_rows(codec)
+        decode = get_codec(codec).decode
+        newline = Text("\n")
+
+        def single():
+            return [decode(row) for row in rows]
+
+        results = [
+            min(timeit.repeat(single, number=number, repeat=3)),
+            min(timeit.repeat(lambda: decode_many(rows, codec), number=number, repeat=3)),
+            min(
+                timeit.repeat(
+                    lambda: decode_many(rows, codec, separator="\n"), number=number, repeat=3
+                )
+            ),
+            min(timeit.repeat(lambda: newline.join(single()), number=number, repeat=3)),
+        ]
+        per = [r / number / len(rows) * 1e6 for r in results]
+        print(f"{codec:>10} {per[0]:10.2f} {per[1]:10.2f} {per[2]:10.2f} {per[3]:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
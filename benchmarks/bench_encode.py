@@ -0,0 +1,54 @@
+"""
+Size and speed of the Evennia and Circle encoders, compared against naively resetting and
+fully restyling every run of text.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_encode.py
+"""
+import random
+import timeit
+
+from mudstring.encodings import circle, evennia
+from mudstring.encodings.base import style_runs
+
+
+def naive_encode(codec, reset: str, escape, text) -> str:
+    output = list()
+    for start, end, style in style_runs(text):
+        output.append(reset + codec.style_codes(codec.style_state(style), dict()))
+        output.append(escape(text.plain[start:end]))
+    return "".join(output)
+
+
+def evennia_sample(codes: int) -> str:
+    rng = random.Random(1)
+    choices = ["|r", "|R", "|h", "|H", "|u", "|[B", "|n", "|500", "|g", "|*"]
+    return "".join(f"{rng.choice(choices)}word{i} " for i in range(codes))
+
+
+def circle_sample(codes: int) -> str:
+    rng = random.Random(1)
+    choices = ["&r", "&R", "&u", "^b", "&d", "`[F500]", "&g", "&v", "}Y"]
+    return "".join(f"{rng.choice(choices)}word{i} " for i in range(codes))
+
+
+def main():
+    print(f"{'codec':>8} {'codes':>6} {'minimal B':>10} {'naive B':>10} {'encode (ms)':>12}")
+    for name, codec, reset, escape, sample in (
+        ("evennia", evennia, "|n", lambda t: t.replace("|", "||"), evennia_sample),
+        ("circle", circle, "&d", lambda t: t.translate(circle.ESCAPES), circle_sample),
+    ):
+        for codes in (100, 1_000, 10_000):
+            text = codec.decode(sample(codes))
+            minimal = codec.encode(text)
+            naive = naive_encode(codec, reset, escape, text)
+            number = 5
+            elapsed = min(timeit.repeat(lambda: codec.encode(text), number=number, repeat=3))
+            print(
+                f"{name:>8} {codes:>6} {len(minimal.encode()):>10} {len(naive.encode()):>10} "
+                f"{elapsed / number * 1e3:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
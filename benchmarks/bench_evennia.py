@@ -0,0 +1,109 @@
+"""
+Benchmark for the Evennia |-code decoder, compared against the previous implementation
+which re-sliced the remaining string after every character it consumed.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_evennia.py
+"""
+import re
+import timeit
+from typing import List, Tuple
+
+from rich.style import Style
+from rich.text import Text
+
+from mudstring.encodings import evennia
+from mudstring.encodings.base import ProtoStyle
+
+
+LEGACY_REGEX = {
+    "fg_ansi_bold": re.compile(r"^(r|g|y|b|m|c|x|w)"),
+    "fg_ansi_normal": re.compile(r"^(R|G|Y|B|M|C|X|W)"),
+    "bg_ansi_bold": re.compile(r"^\[(r|g|y|b|m|c|x|w)"),
+    "bg_ansi_normal": re.compile(r"^\[(R|G|Y|B|M|C|X|W)"),
+    "fg_xterm": re.compile(r"^[0-5]{3}"),
+    "bg_xterm": re.compile(r"^\[([0-5]{3})"),
+}
+
+
+def legacy_decode(src: str) -> Text:
+    current = ProtoStyle()
+    segment: str = ""
+
+    remaining = src
+    escaped: bool = False
+    segments: List[Tuple[str, Style]] = list()
+
+    while len(remaining):
+        if escaped:
+            if (sub_char := evennia.CHAR_SUBS.get(remaining[0], None)) :
+                segment += sub_char
+                remaining = remaining[1:]
+            elif remaining[0] in ("n", "N"):
+                if segment:
+                    segments.append((segment, current.convert()))
+                    segment = ""
+                current = ProtoStyle()
+                remaining = remaining[1:]
+            elif remaining[0] in ("h", "H", "*", "u", "^"):
+                if segment:
+                    segments.append((segment, current.convert()))
+                    segment = ""
+                current = current.copy()
+                evennia.apply_ansi_style(current, remaining[0])
+                remaining = remaining[1:]
+            else:
+                for name, pattern in LEGACY_REGEX.items():
+                    if (match := pattern.match(remaining)) :
+                        if segment:
+                            segments.append((segment, current.convert()))
+                            segment = ""
+                        current = current.copy()
+                        evennia.EV_APPLY[name](current, match.group(match.lastindex or 0))
+                        remaining = remaining[match.end(0) :]
+                        break
+            escaped = False
+        else:
+            loc = remaining.find("|")
+            if loc != -1:
+                segment += remaining[:loc]
+                remaining = remaining[loc + 1 :]
+                escaped = True
+            else:
+                segment += remaining
+                remaining = ""
+
+    if segment:
+        segments.append((segment, current.convert()))
+
+    return Text.assemble(*segments)
+
+
+HELP_ENTRY = (
+    "|c--------------------------------------------------------------------|n|/"
+    "|wHelp for |ylook|n (aliases: |gl|n, |gls|n)|/|/"
+    "|-Usage:|/|_|_|_|_|Clook|n|/|_|_|_|_|Clook |[B<obj>|n|/|/"
+    "Observes your location or objects in your vicinity. Objects, |hexits|H and "
+    "characters are shown with |*reversed|n names, |ublinking|n warnings and "
+    "|511xterm|n highlights. Use ||n to reset colors.|/"
+)
+
+
+def make_help_file(size: int) -> str:
+    return (HELP_ENTRY * (size // len(HELP_ENTRY) + 1))[:size]
+
+
+def main():
+    print(f"{'size':>8} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>8}")
+    for size in (1_000, 10_000, 50_000):
+        src = make_help_file(size)
+        number = 3
+        legacy = min(timeit.repeat(lambda: legacy_decode(src), number=number, repeat=3))
+        current = min(timeit.repeat(lambda: evennia.decode(src), number=number, repeat=3))
+        print(
+            f"{size:>8} {legacy / number:>12.4f} {current / number:>12.4f} {legacy / current:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Import time of each mudstring module, measured with `python -X importtime`, checked against a
+budget. rich is imported before timing, since every module needs it anyway and it dwarfs
+mudstring itself; what is measured is what mudstring adds on top.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_import.py [--scale 1.5]
+
+Exits with status 1 if any module takes longer than its budget, multiplied by --scale for
+slower machines.
+"""
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+
+import mudstring
+
+# Module -> budget in milliseconds.
+BUDGETS = {
+    "mudstring.encodings": 1.5,
+    "mudstring.encodings.pennmush": 6.0,
+    "mudstring.encodings.evennia": 4.0,
+    "mudstring.encodings.circle": 4.0,
+    "mudstring.encodings.ansi": 5.0,
+    "mudstring.encodings.cache": 2.5,
+    "mudstring.encodings.lazy": 3.5,
+    "mudstring.render": 3.5,
+    "mudstring.util": 1.0,
+}
+
+PRELOAD = "import rich.text, rich.style, rich.color"
+
+
+def import_time(module: str) -> float:
+    """
+    Milliseconds spent importing a module and everything it imports, in a fresh interpreter.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{PRELOAD}; import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    # Measure loading bytecode, as in production, rather than compiling the source every time.
+    compileall.compile_dir(os.path.dirname(mudstring.__file__), quiet=1)
+
+    over = list()
+    print(f"{'module':<30} {'ms':>8} {'budget':>8}")
+    for module, budget in BUDGETS.items():
+        elapsed = min(import_time(module) for _ in range(args.repeat))
+        budget *= args.scale
+        flag = "" if elapsed <= budget else "  OVER"
+        print(f"{module:<30} {elapsed:8.2f} {budget:8.2f}{flag}")
+        if flag:
+            over.append(module)
+    if over:
+        print(f"over budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
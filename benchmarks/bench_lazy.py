@@ -0,0 +1,58 @@
+"""
+A channel pipeline which drops most messages before they are shown: messages from ignored
+players and those failing a spam check are filtered out on their plain text, and only the rest
+are rendered. Decoding every message up front is compared with wrapping them in LazyText.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_lazy.py
+"""
+import timeit
+
+from mudstring.encodings import get_codec
+from mudstring.encodings.lazy import LazyText
+from mudstring.render import render_ansi
+
+IGNORED = ("Kaine", "Rook")
+SPAM = "buy gold"
+
+
+def messages(codec: str, count: int = 1000):
+    names = ("Volund", "Ashe", "Kaine", "Rook", "Ilsa")
+    found = list()
+    for i in range(count):
+        name = names[i % len(names)]
+        said = SPAM if i % 3 else f"the plaza at {i % 24}:00"
+        if codec == "pennmush":
+            found.append(
+                f'\002chc\003{name}\002c/\003 says, "Meet at \002chy\003{said}\002c/\003."'
+            )
+        else:
+            found.append(f'|c{name}|n says, "Meet at |y{said}|n."')
+    return found
+
+
+def shown(texts):
+    return [
+        render_ansi(text, "256")
+        for text in texts
+        if not text.plain.startswith(IGNORED) and SPAM not in text.plain
+    ]
+
+
+def main():
+    number = 10
+    print(f"{'codec':>10} {'eager':>10} {'lazy':>10}  ms per 1000 messages")
+    for codec in ("pennmush", "evennia"):
+        decode = get_codec(codec).decode
+        sources = messages(codec)
+        eager = lambda: shown([decode(src) for src in sources])
+        lazy = lambda: shown([LazyText(src, codec) for src in sources])
+        assert eager() == lazy()
+        results = [
+            min(timeit.repeat(run, number=number, repeat=3)) / number * 1e3 for run in (eager, lazy)
+        ]
+        print(f"{codec:>10} {results[0]:10.2f} {results[1]:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measuring the rows of a WHO list for column layout: decoding each row and asking the Text for
+its length and cell width, against each codec's plain_len() and cell_len() on the markup.
+Half of the names are ASCII; the rest have accents or are double width.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_measure.py
+"""
+import timeit
+
+from mudstring.encodings import get_codec
+
+NAMES = ("Volund", "Ashe", "Kaine", "Zoë", "Ilsa", "Renée", "李小龍", "Rook")
+
+
+def who_rows(codec: str, rows: int = 300):
+    found = list()
+    for i in range(rows):
+        name = NAMES[i % len(NAMES)]
+        idle = f"{i % 60}m"
+        if codec == "pennmush":
+            found.append(f"\002chc\003{name}\002c/\003 \002cy\003{idle:>5}\002c/\003 On duty")
+        elif codec == "evennia":
+            found.append(f"|c{name}|n |Y{idle:>5}|n On duty")
+        elif codec == "circle":
+            found.append(f"&C{name}&d &Y{idle:>5}&d On duty")
+        else:
+            found.append(f"\x1b[1;36m{name}\x1b[0m \x1b[33m{idle:>5}\x1b[0m On duty")
+    return found
+
+
+def main():
+    number = 20
+    print(
+        f"{'codec':>10} {'decode len':>11} {'plain_len':>10} {'decode cells':>13} {'cell_len':>9}"
+    )
+    for codec in ("pennmush", "evennia", "circle", "ansi"):
+        module = get_codec(codec)
+        rows = who_rows(codec)
+        for row in rows:
+            assert module.cell_len(row) == module.decode(row).cell_len
+
+        def run(func):
+            elapsed = min(
+                timeit.repeat(lambda: [func(row) for row in rows], number=number, repeat=3)
+            )
+            return elapsed / number / len(rows) * 1e6
+
+        results = (
+            run(lambda row: len(module.decode(row).plain)),
+            run(module.plain_len),
+            run(lambda row: module.decode(row).cell_len),
+            run(module.cell_len),
+        )
+        print(
+            f"{codec:>10} {results[0]:11.2f} {results[1]:10.2f}"
+            f" {results[2]:13.2f} {results[3]:9.2f}"
+        )
+    print("us per row")
+
+
+if __name__ == "__main__":
+    main()
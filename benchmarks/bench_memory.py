@@ -0,0 +1,50 @@
+"""
+Peak memory used while decoding, per tag, measured with tracemalloc.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_memory.py
+"""
+import tracemalloc
+
+from mudstring.encodings import circle, evennia, pennmush
+
+
+def pennmush_markup(tags: int) -> str:
+    # Nest half of the tags so that the decoder has to keep a stack of styles around.
+    half = tags // 2
+    opening = "".join(f"\002c{'hr' if i % 2 else '+orange'}\003x" for i in range(half))
+    closing = "\002c/\003y" * half
+    return opening + closing
+
+
+def evennia_markup(tags: int) -> str:
+    return "".join(f"|{'rgbRGB'[i % 6]}x" for i in range(tags))
+
+
+def circle_markup(tags: int) -> str:
+    return "".join(f"&{'rgbRGB'[i % 6]}x" for i in range(tags))
+
+
+def peak_per_tag(decode, src: str, tags: int) -> float:
+    decode(src)  # warm caches so they don't count against the decode itself.
+    tracemalloc.start()
+    result = decode(src)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / tags
+
+
+def main():
+    print(f"{'codec':>10} {'tags':>8} {'peak bytes/tag':>16}")
+    for name, decode, make in (
+        ("pennmush", pennmush.decode, pennmush_markup),
+        ("evennia", evennia.decode, evennia_markup),
+        ("circle", circle.decode, circle_markup),
+    ):
+        for tags in (200, 2_000, 20_000):
+            print(f"{name:>10} {tags:>8} {peak_per_tag(decode, make(tags), tags):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
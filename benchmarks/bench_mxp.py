@@ -0,0 +1,55 @@
+"""
+Benchmark for decoding MXP-heavy PennMUSH output (clickable exits and send_menu lists),
+comparing the cached MXP attribute parser against the previous ElementTree round-trip.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_mxp.py
+"""
+import timeit
+from xml.etree import ElementTree
+
+from mudstring.encodings import pennmush
+
+
+def elementtree_apply_mxp(mark, rules: str):
+    if " " in rules:
+        before, after = rules.split(" ", 1)
+        x = f"<{before} {after}></{before}>"
+    else:
+        x = f"<{rules}></{rules}>"
+    elem = ElementTree.fromstring(x)
+    mark.tag = elem.tag
+    mark.xml_attr = elem.attrib
+
+
+def menu_screen(items: int = 40) -> str:
+    lines = ["\002chw\003Obvious exits:\002c/\003\n"]
+    for i in range(items):
+        name = f"Exit {i}"
+        lines.append(
+            f'\002psend href="{name}|look {name}" hint="Go {name}|Look at {name}"\003'
+            f"\002cc\003<{i:02}> {name}\002c/\003\002p/\003\n"
+        )
+    return "".join(lines)
+
+
+def main():
+    src = menu_screen()
+    number = 200
+
+    current = min(timeit.repeat(lambda: pennmush.decode(src), number=number, repeat=3))
+
+    apply_mxp = pennmush.apply_mxp
+    pennmush.apply_mxp = elementtree_apply_mxp
+    try:
+        legacy = min(timeit.repeat(lambda: pennmush.decode(src), number=number, repeat=3))
+    finally:
+        pennmush.apply_mxp = apply_mxp
+
+    print(f"ElementTree: {legacy / number * 1e3:8.3f} ms/screen")
+    print(f"parse_mxp:   {current / number * 1e3:8.3f} ms/screen")
+    print(pennmush.parse_mxp.cache_info())
+
+
+if __name__ == "__main__":
+    main()
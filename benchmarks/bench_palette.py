@@ -0,0 +1,117 @@
+"""
+Benchmark for downgrading RGB colors to xterm 256 and ANSI 16 colors, comparing the palette
+lookup tables against rich's Color.downgrade. Before timing anything, it checks that both give
+the same xterm color numbers for a sample of colors, and that the NumPy variant agrees with the
+plain one when NumPy is installed.
+
+The repository has no test suite, so this check is how the tables are tested: --check runs only
+the check, for CI, and exits with status 1 on any mismatch.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_palette.py [--check]
+"""
+import argparse
+import random
+import sys
+import timeit
+
+from rich.color import Color, ColorSystem
+
+from mudstring.encodings import palette
+from mudstring.encodings.colors import FG_DOWNGRADE
+
+
+def sample_colors(count: int = 50000):
+    rng = random.Random(16)
+    colors = [(v, v, v) for v in range(256)]
+    # Either side of every cube level boundary.
+    edges = (0, 1, 47, 48, 94, 95, 96, 114, 115, 134, 135, 154, 155)
+    edges += (174, 175, 194, 195, 214, 215, 234, 235, 254, 255)
+    colors.extend((r, g, b) for r in edges for g in edges for b in edges)
+    for _ in range(count):
+        base = rng.randrange(256)
+        # Plenty of nearly gray colors, to exercise the saturation threshold.
+        spread = rng.choice((4, 16, 256))
+        colors.append(
+            tuple(min(255, max(0, base + rng.randrange(-spread, spread))) for _ in range(3))
+        )
+    return colors
+
+
+def rich_xterm(rgb) -> int:
+    # Bypass the lru_cache on downgrade, which would otherwise only be timing dict lookups.
+    return Color.downgrade.__wrapped__(Color.from_rgb(*rgb), ColorSystem.EIGHT_BIT).number
+
+
+def check(colors) -> int:
+    """
+    Check the lookup tables against Color.downgrade, printing each mismatch.
+
+    Returns:
+        mismatches (int): How many colors didn't match.
+    """
+    mismatches = 0
+    for rgb in colors:
+        expected = rich_xterm(rgb)
+        found = palette.rgb_to_xterm(*rgb)
+        ansi = palette.rgb_to_ansi(*rgb)
+        if found != expected or ansi != FG_DOWNGRADE[expected]:
+            print(f"rgb_to_xterm{rgb} = {found}, expected {expected}")
+            mismatches += 1
+    print(f"rgb_to_xterm checked against Color.downgrade for {len(colors)} colors")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not installed, skipping rgb_to_xterm_array")
+        return mismatches
+
+    cube = np.stack(np.meshgrid(*(np.arange(256),) * 3, indexing="ij"), axis=-1)
+    found = palette.rgb_to_xterm_array(cube)
+    rng = random.Random(256)
+    extra = [(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(50000)]
+    for rgb in colors + extra:
+        if found[rgb] != palette.rgb_to_xterm(*rgb):
+            print(f"rgb_to_xterm_array{rgb} = {found[rgb]}, expected {palette.rgb_to_xterm(*rgb)}")
+            mismatches += 1
+    print("rgb_to_xterm_array checked against rgb_to_xterm")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="only check, without timing")
+    args = parser.parse_args()
+
+    colors = sample_colors()
+    if (mismatches := check(colors)) :
+        print(f"{mismatches} mismatches")
+        sys.exit(1)
+    if args.check:
+        return
+    sample = colors[:20000]
+    number = 5
+
+    legacy = min(
+        timeit.repeat(lambda: [rich_xterm(rgb) for rgb in sample], number=number, repeat=3)
+    )
+    current = min(
+        timeit.repeat(
+            lambda: [palette.rgb_to_xterm(*rgb) for rgb in sample], number=number, repeat=3
+        )
+    )
+    per = number * len(sample)
+    print(f"Color.downgrade: {legacy / per * 1e6:8.3f} us/color")
+    print(f"rgb_to_xterm:    {current / per * 1e6:8.3f} us/color")
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    array = np.array(sample)
+    bulk = min(timeit.repeat(lambda: palette.rgb_to_ansi_array(array), number=number, repeat=3))
+    print(f"rgb_to_ansi_array: {bulk / per * 1e6:6.3f} us/color")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Throughput benchmarks for the PennMUSH markup decoder, and for a decode -> encode round-trip.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_pennmush.py
+"""
+import timeit
+
+from mudstring.encodings import pennmush
+
+
+def make_markup(size: int, density: float) -> str:
+    """
+    Build roughly `size` characters of PennMUSH markup where `density` is the fraction of
+    plain-text words which are wrapped in a color tag.
+    """
+    colors = ["hr", "hg", "+orange", "123/45", "u", "#ff00ff"]
+    words = list()
+    length = 0
+    i = 0
+    step = max(1, int(1 / density)) if density else 0
+    while length < size:
+        word = f"word{i} "
+        if step and not i % step:
+            code = colors[i % len(colors)]
+            word = f"\002c{code}\003{word}\002c/\003"
+        words.append(word)
+        length += len(word)
+        i += 1
+    return "".join(words)
+
+
+def bench(size: int, density: float, number: int = 5) -> float:
+    src = make_markup(size, density)
+    elapsed = min(timeit.repeat(lambda: pennmush.decode(src), number=number, repeat=3))
+    return len(src) * number / elapsed
+
+
+def bench_round_trip(size: int, density: float, number: int = 5) -> float:
+    src = make_markup(size, density)
+    elapsed = min(
+        timeit.repeat(lambda: pennmush.encode(pennmush.decode(src)), number=number, repeat=3)
+    )
+    return len(src) * number / elapsed
+
+
+def main():
+    print("decode")
+    print(f"{'size':>8} {'density':>8} {'chars/sec':>14}")
+    for size in (1_000, 10_000, 100_000):
+        for density in (0.0, 0.1, 0.5, 1.0):
+            rate = bench(size, density)
+            print(f"{size:>8} {density:>8} {rate:>14,.0f}")
+
+    print("decode -> encode")
+    print(f"{'size':>8} {'density':>8} {'chars/sec':>14}")
+    for size in (1_000, 10_000, 100_000):
+        for density in (0.1, 1.0):
+            rate = bench_round_trip(size, density)
+            print(f"{size:>8} {density:>8} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Rendering a Text to ANSI bytes with render_ansi, compared against printing it through a rich
+Console into an OutBuffer; and broadcasting one Text to many clients with render_profiles.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_render.py
+"""
+import timeit
+
+from rich.console import Console
+from rich.text import Text
+
+from mudstring.encodings import pennmush
+from mudstring.render import render_ansi, render_profiles, ClientProfile
+from mudstring.util import OutBuffer
+
+
+def one_line() -> Text:
+    return pennmush.decode(
+        '\002chr\003[OOC]\002c/\003 \002cc\003Volund\002c/\003 says, "Hello, \002cu\003world\002c/\003!"'
+    )
+
+
+def screen() -> Text:
+    lines = list()
+    for row in range(24):
+        cells = "".join(
+            f"\002c{(row * 10 + col) % 216 + 16}/{col % 8}\003{row:02}x{col:02}\002c/\003 "
+            for col in range(13)
+        )
+        lines.append(cells[:-1])
+    return pennmush.decode("\n".join(lines))
+
+
+def main():
+    number = 500
+    print(f"{'payload':>8} {'system':>10} {'Console (us)':>13} {'render_ansi (us)':>17}")
+    for name, text in (("line", one_line()), ("80x24", screen())):
+        for system in ("standard", "256", "truecolor"):
+            buffer = bytearray()
+            console = Console(
+                file=OutBuffer(buffer),
+                color_system=system,
+                force_terminal=True,
+                width=80,
+                soft_wrap=True,
+            )
+
+            def via_console():
+                buffer.clear()
+                console.print(text)
+
+            out = bytearray()
+
+            def direct():
+                out.clear()
+                render_ansi(text, system, buffer=out)
+
+            slow = min(timeit.repeat(via_console, number=number, repeat=3))
+            fast = min(timeit.repeat(direct, number=number, repeat=3))
+            print(
+                f"{name:>8} {system:>10} {slow / number * 1e6:>13.1f} {fast / number * 1e6:>17.1f}"
+            )
+
+    # A channel message sent to 300 players spread over a handful of client capabilities.
+    profiles = [
+        ClientProfile(None),
+        ClientProfile("standard"),
+        ClientProfile("256"),
+        ClientProfile("truecolor"),
+        ClientProfile("256", mxp=True),
+    ]
+    recipients = [profiles[i % len(profiles)] for i in range(300)]
+    text = one_line()
+    consoles = [
+        Console(
+            file=OutBuffer(bytearray()),
+            color_system=p.color_system,
+            force_terminal=True,
+            width=80,
+            soft_wrap=True,
+        )
+        for p in recipients
+    ]
+
+    def per_recipient():
+        for console in consoles:
+            console.print(text)
+
+    def fan_out():
+        rendered = render_profiles(text, recipients)
+        return [rendered[p] for p in recipients]
+
+    number = 20
+    slow = min(timeit.repeat(per_recipient, number=number, repeat=3))
+    fast = min(timeit.repeat(fan_out, number=number, repeat=3))
+    print(
+        f"broadcast to {len(recipients)}: Console per recipient {slow / number * 1e3:.2f} ms, "
+        f"render_profiles {fast / number * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+How many spans decoded markup carries, with and without coalescing adjacent equal-style
+segments, and what that does to a downstream operation (wrapping to 78 columns).
+
+The corpus is typical game output for each codec: softcoded WHO lists and room descriptions
+that nest tags freely, help files, and prompts.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_spans.py
+"""
+import timeit
+
+from rich.console import Console
+from rich.text import Text
+
+from mudstring.encodings import get_codec
+
+PENNMUSH = [
+    # A softcoded WHO row: every field wrapped in its own tag, the name nested inside a
+    # highlight which a zone color sits around.
+    "".join(
+        f"\002chc\003\002ch\003{name:<16}\002c/\003\002c/\003"
+        f"\002chc\003 \002c/\003\002cy\003{idle:>4}\002c/\003\002cy\003m\002c/\003 "
+        f"\002chw\003\002ch\003{doing}\002c/\003\002c/\003\n"
+        for name, idle, doing in (
+            ("Volund", 3, "Coding things"),
+            ("Ashe", 12, "Idle"),
+            ("Kaine", 0, "Scene in the Plaza"),
+        )
+    )
+    * 20,
+    # A room description where @desc code re-applies the room color around each sentence.
+    (
+        "\002cg\003The Plaza\002c/\003\n"
+        + "".join(
+            f"\002cw\003Sentence {i} of the description. \002c/\003"
+            f"\002cw\003\002ch\003Important\002c/\003 detail.\002c/\003 "
+            for i in range(30)
+        )
+        + "\n\002chy\003Obvious exits:\002c/\003 "
+        + "".join(
+            f"\002chy\003<\002c/\003\002chy\003E{i}\002c/\003\002chy\003>\002c/\003 "
+            for i in range(8)
+        )
+    ),
+]
+
+EVENNIA = [
+    (
+        "|c--------------------------------------------------------------------|n|/"
+        "|wHelp for |ylook|n (aliases: |gl|n, |gls|n)|/|/"
+        "|-Usage:|/|_|_|_|_|Clook|n|/|_|_|_|_|Clook |[B<obj>|n|/|/"
+        "Observes your location or objects in your vicinity. Objects, |hexits|H and "
+        "characters are shown with |*reversed|n names, |ublinking|n warnings and "
+        "|511xterm|n highlights. Use ||n to reset colors.|/"
+    )
+    * 10,
+    "".join(f"|w|w{name:<16}|n|w|n |y{idle:>4}|y m|n\n" for name, idle in (("Ash", 3), ("Rook", 9)))
+    * 30,
+]
+
+CIRCLE = [
+    "".join(f"&C&C<{hp}hp &C{mp}m &C{mv}mv>&d &W\n" for hp, mp, mv in ((10, 20, 30), (9, 20, 31)))
+    * 30,
+    "&GThe Temple&d\n&w&wA large temple. &w&WThe altar&w glows.&d\n&c[ Exits: n e s w ]&d\n" * 20,
+]
+
+
+def count(codec: str, corpus):
+    module = get_codec(codec)
+    plain_spans = 0
+    coalesced_spans = 0
+    for src in corpus:
+        segments, _ = module.IncrementalDecoder().decode_segments(src, True)
+        plain_spans += len(Text.assemble(*segments).spans)
+        coalesced_spans += len(module.decode(src).spans)
+    return plain_spans, coalesced_spans
+
+
+def wrap_time(codec: str, corpus, coalesce: bool, number: int = 20) -> float:
+    module = get_codec(codec)
+    console = Console(width=78)
+    if coalesce:
+        texts = [module.decode(src) for src in corpus]
+    else:
+        texts = [
+            Text.assemble(*module.IncrementalDecoder().decode_segments(src, True)[0])
+            for src in corpus
+        ]
+    elapsed = timeit.repeat(lambda: [t.wrap(console, 78) for t in texts], number=number, repeat=3)
+    return min(elapsed) / number
+
+
+def main():
+    print(
+        f"{'codec':>10} {'spans before':>13} {'after':>8} {'reduction':>10}"
+        f" {'wrap before':>12} {'after':>8}"
+    )
+    for codec, corpus in (("pennmush", PENNMUSH), ("evennia", EVENNIA), ("circle", CIRCLE)):
+        before, after = count(codec, corpus)
+        reduction = 1 - after / before
+        slow = wrap_time(codec, corpus, False) * 1e3
+        fast = wrap_time(codec, corpus, True) * 1e3
+        print(f"{codec:>10} {before:13} {after:8} {reduction:10.1%} {slow:10.2f}ms {fast:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Getting only the plain text of markup, as logging, searching and name matching do: each codec's
+strip() against decode(src).plain, on a short name, a WHO row and a long room description.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_strip.py
+"""
+import timeit
+
+from mudstring.encodings import get_codec
+
+SAMPLES = {
+    "pennmush": (
+        "\002chc\003Volund\002c/\003",
+        "\002chc\003Volund          \002c/\003 \002cy\003  3m\002c/\003 "
+        "\002c+orange\003Coding\002c/\003",
+        "".join(
+            f'\002cw\003Sentence {i} of the description, with \002psend href="look {i}"\003a '
+            f"link\002p/\003 and \002chr\003important\002c/\003 words.\002c/\003 "
+            for i in range(40)
+        ),
+    ),
+    "evennia": (
+        "|cVolund|n",
+        "|cVolund          |n |y   3m|n |511Coding|n",
+        "".join(
+            f"|wSentence {i} of the description,|_with |[ba|n |link and |rimportant|n words.|/"
+            for i in range(40)
+        ),
+    ),
+    "circle": (
+        "&CVolund&d",
+        "&CVolund          &d &Y   3m&d `[F511]Coding&d",
+        "".join(
+            f"&wSentence {i} of the description, with &&amps, ^ba&d link and &Rimportant&d words.\n"
+            for i in range(40)
+        ),
+    ),
+    "ansi": (
+        "\x1b[1;36mVolund\x1b[0m",
+        "\x1b[1;36mVolund          \x1b[0m \x1b[33m   3m\x1b[0m \x1b[38;5;208mCoding\x1b[0m",
+        "".join(
+            f"\x1b[37mSentence {i} of the description, with \x1b[44ma\x1b[49m link and "
+            f"\x1b[1;31mimportant\x1b[0m words.\n"
+            for i in range(40)
+        ),
+    ),
+}
+
+
+def main():
+    number = 2000
+    print(f"{'codec':>10} {'sample':>8} {'decode':>10} {'strip':>10} {'speedup':>8}  us")
+    for codec, samples in SAMPLES.items():
+        module = get_codec(codec)
+        for label, src in zip(("name", "row", "room"), samples):
+            assert module.strip(src) == module.decode(src).plain
+            slow = min(timeit.repeat(lambda: module.decode(src).plain, number=number, repeat=3))
+            fast = min(timeit.repeat(lambda: module.strip(src), number=number, repeat=3))
+            print(
+                f"{codec:>10} {label:>8} {slow / number * 1e6:10.2f} {fast / number * 1e6:10.2f}"
+                f" {slow / fast:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+from enum import IntFlag
+from functools import partial
+from importlib import import_module
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+
+class Capability(IntFlag):
+    # Has an IncrementalDecoder, for input arriving in chunks.
+    STREAMING = 1
+    # Has decode_many, for decoding many strings in one call.
+    BATCH = 2
+    # decode is served through the shared DecodeCache.
+    CACHED = 4
+
+
+class Codec(NamedTuple):
+    name: str
+    encode: Callable[..., str]
+    decode: Callable[..., "Text"]
+    incremental_decoder: Optional[type]
+    capabilities: Capability
+    module: ModuleType
+    strip: Callable[..., str]
+
+
+# Codec name -> the module implementing it, relative to this package. Codec modules are only
+# imported when first asked for, so a process which never touches a codec doesn't pay for it.
+CODECS: Dict[str, str] = {
+    "pennmush": ".pennmush",
+    "evennia": ".evennia",
+    "circle": ".circle",
+    "ansi": ".ansi",
+}
+
+# Codecs whose decode goes through the shared DecodeCache.
+CACHED_CODECS: Set[str] = set()
+
+_loaded: Dict[str, Codec] = dict()
+_shared_cache = None
+
+
+def register_codec(name: str, module: str, cached: bool = False):
+    """
+    Make a codec available by name. The module, absolute or relative to this package, must
+    provide encode() and decode() like the built-in codecs, and may provide an
+    IncrementalDecoder, decode_many(), strip() and warmup(). It is not imported until used.
+
+    Args:
+        name (str): The codec name.
+        module (str): The module implementing it.
+        cached (bool): Whether to serve decode() through the shared DecodeCache, for codecs
+            whose markup repeats a lot. Built-in codecs can be re-registered to turn this on.
+    """
+    CODECS[name] = module
+    if cached:
+        CACHED_CODECS.add(name)
+    else:
+        CACHED_CODECS.discard(name)
+    _loaded.pop(name, None)
+
+
+def codec_names() -> Tuple[str, ...]:
+    return tuple(CODECS)
+
+
+def get_codec(name: str) -> ModuleType:
+    """
+    The module implementing a codec, importing it on first use.
+
+    Raises:
+        LookupError: If there is no codec by that name.
+    """
+    if (module := CODECS.get(name, None)) is None:
+        raise LookupError(f"unknown codec: {name}")
+    return import_module(module, __name__)
+
+
+def shared_cache():
+    """
+    The DecodeCache used by codecs registered with cached=True, created on first use.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        from .cache import DecodeCache
+
+        _shared_cache = DecodeCache()
+    return _shared_cache
+
+
+def _strip_by_decoding(decode: Callable[..., "Text"], src: str, errors: str = "strict") -> str:
+    return decode(src, errors=errors).plain
+
+
+def lookup(name: str) -> Codec:
+    """
+    The encoder, decoder and incremental decoder of a codec, along with what it is capable of.
+    decode is the fastest way to decode one string with it, and strip the fastest way to get
+    only its plain text.
+
+    Raises:
+        LookupError: If there is no codec by that name.
+    """
+    if (codec := _loaded.get(name, None)) is not None:
+        return codec
+    module = get_codec(name)
+    capabilities = Capability(0)
+    if (incremental := getattr(module, "IncrementalDecoder", None)) is not None:
+        capabilities |= Capability.STREAMING
+    if hasattr(module, "decode_many"):
+        capabilities |= Capability.BATCH
+    decode = module.decode
+    if name in CACHED_CODECS:
+        capabilities |= Capability.CACHED
+        decode = partial(shared_cache().decode, name)
+    if (strip_plain := getattr(module, "strip", None)) is None:
+        strip_plain = partial(_strip_by_decoding, decode)
+    codec = Codec(name, module.encode, decode, incremental, capabilities, module, strip_plain)
+    _loaded[name] = codec
+    return codec
+
+
+def decode_many(
+    sources: Iterable[str],
+    codec: str = "pennmush",
+    errors: str = "strict",
+    separator: Optional[str] = None,
+) -> Union[List["Text"], "Text"]:
+    """
+    Decode many pieces of markup with one codec, such as the rows of a WHO list or the contents
+    of a room. Codecs capable of batches share one decoder between all of them; cached codecs
+    go through their cache one piece at a time instead.
+
+    Args:
+        sources (Iterable[str]): The markup to decode.
+        codec (str): The codec to decode with.
+        errors (str): The error handling scheme, as for decode.
+        separator (str): If given, return a single Text of all the decoded pieces joined by
+            this plain separator, instead of a list with a Text for each.
+
+    Returns:
+        decoded (Union[List[Text], Text]): The decoded Texts, or their join.
+    """
+    found = lookup(codec)
+    capabilities = found.capabilities
+    if Capability.BATCH in capabilities and Capability.CACHED not in capabilities:
+        return found.module.decode_many(sources, errors=errors, separator=separator)
+    texts = [found.decode(src, errors=errors) for src in sources]
+    if separator is None:
+        return texts
+    from rich.text import Text
+
+    return Text(separator).join(texts)
+
+
+def strip(src: str, codec: str = "pennmush", errors: str = "strict") -> str:
+    """
+    The plain text of markup, without building any styles, for when only the text is wanted:
+    logging, searching, matching names. Codecs without a strip() of their own fall back to
+    decoding.
+
+    Args:
+        src (str): The markup.
+        codec (str): The codec it is in.
+        errors (str): The error handling scheme, as for decode.
+
+    Returns:
+        plain (str): The text decode(src).plain would give.
+    """
+    return lookup(codec).strip(src, errors=errors)
+
+
+def warmup(
+    names: Optional[Iterable[str]] = None,
+    samples: Optional[Dict[str, Iterable[str]]] = None,
+):
+    """
+    Do the one-off work of the codecs before it is needed, such as when a server starts and
+    before it accepts connections: import them, which compiles their regexes, and let each fill
+    its caches with the most common codes.
+
+    Args:
+        names (Iterable[str]): The codecs to warm up. All registered codecs by default.
+        samples (dict): Codec name -> markup typical of the game, such as room names and
+            channel prefixes, which is decoded to fill the style caches (and the DecodeCache,
+            for cached codecs).
+    """
+    if names is None:
+        names = CODECS
+    if samples is None:
+        samples = dict()
+    for name in names:
+        codec = lookup(name)
+        if (module_warmup := getattr(codec.module, "warmup", None)) is not None:
+            module_warmup()
+        for src in samples.get(name, ()):
+            codec.decode(src)
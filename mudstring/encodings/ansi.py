@@ -0,0 +1,229 @@
+import re
+from functools import lru_cache
+from rich.text import Text
+from rich.style import Style
+from rich.color import Color
+from rich.control import strip_control_codes
+from .base import ProtoStyle, BaseIncrementalDecoder, measurers
+from ..render import SGR_ATTRS, render_ansi
+from typing import Union, List, Tuple, Dict, Optional, Iterable
+
+
+# SGR sequences, which set the style, are told apart from all other control sequences, control
+# strings and escapes, which are dropped. Control strings (OSC, DCS, SOS, PM and APC, such as
+# those setting the window title) run up to BEL or ST; one cut short by another sequence or by
+# the end of the output ends there.
+ANSI_TOKEN = re.compile(
+    r"\x1b(?:"
+    r"\[(?P<sgr>[0-?]*)m"
+    r"|(?P<csi>\[[0-?]*[ -/]*[@-~])"
+    r"|(?P<string>[\]PX^_][^\x07\x1b]*(?:\x07|\x1b\\|(?=\x1b)|\Z))"
+    r"|(?P<escape>[ -/]*[0-Z\\-~])"
+    r")?"
+)
+
+# The longest partial sequence held back for the rest of it to arrive. Past that, it is decoded
+# with what there is, so that a runaway control string can't hold up the output.
+MAX_SEQUENCE_LENGTH = 4096
+
+# An ESC at the end of a chunk which could still turn into a longer sequence.
+ANSI_PARTIAL = re.compile(
+    r"\x1b(?:\[[0-?]{0,%d}[ -/]{0,%d}|[ -/]{0,%d}|[\]PX^_][^\x07\x1b]{0,%d})"
+    % ((MAX_SEQUENCE_LENGTH,) * 4)
+)
+
+# Each piece of ANSI_TOKEN.split(): the text before a sequence, then each of its groups.
+SPLIT_STRIDE = ANSI_TOKEN.groups + 1
+
+# SGR code -> the attributes it turns on or off.
+SGR_ON = {int(on): attr for attr, on, _ in SGR_ATTRS}
+SGR_OFF = {
+    int(off): tuple(attr for attr, _, other in SGR_ATTRS if other == off) for _, _, off in SGR_ATTRS
+}
+
+# A change parse_sgr found: a ProtoStyle field and its new value, or a field of None to reset.
+SGROp = Tuple[Optional[str], object]
+
+
+def extended_color(args: List[str]) -> Tuple[Optional[Color], int]:
+    """
+    Parse the color following a 38 or 48 code: 5;n for an xterm color, or 2;r;g;b for RGB.
+
+    Returns:
+        color, consumed (Tuple[Optional[Color], int]): The color, if it was valid, and how many
+            of args it used up.
+    """
+    if not args:
+        return None, 0
+    if args[0] == "5":
+        if len(args) >= 2 and args[1].isdigit() and int(args[1]) < 256:
+            return Color.from_ansi(int(args[1])), 2
+        return None, min(2, len(args))
+    if args[0] == "2":
+        rgb = args[1:4]
+        if len(rgb) == 3 and all(c.isdigit() and int(c) < 256 for c in rgb):
+            return Color.from_rgb(*(int(c) for c in rgb)), 4
+        return None, min(4, len(args))
+    return None, 1
+
+
+@lru_cache(maxsize=1024)
+def parse_sgr(params: str) -> Tuple[SGROp, ...]:
+    """
+    Parse the parameters of an SGR sequence, such as '1;38;5;208', into the changes it makes
+    to a ProtoStyle, in order. Relayed output only ever uses a handful of distinct sequences,
+    so results are memoized. Unknown codes are ignored.
+    """
+    ops: List[SGROp] = list()
+    codes = params.split(";")
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        i += 1
+        args = None
+        if ":" in code:
+            # ITU style sub-parameters, as in 38:2::255:0:0 or 4:3.
+            code, *args = code.split(":")
+        if not code:
+            number = 0
+        elif code.isdigit():
+            number = int(code)
+        else:
+            continue
+
+        if number == 0:
+            ops.append((None, None))
+        elif number in SGR_ON:
+            ops.append((SGR_ON[number], True))
+        elif number in SGR_OFF:
+            ops.extend((attr, None) for attr in SGR_OFF[number])
+        elif 30 <= number <= 37:
+            ops.append(("color", Color.from_ansi(number - 30)))
+        elif 90 <= number <= 97:
+            ops.append(("color", Color.from_ansi(number - 82)))
+        elif 40 <= number <= 47:
+            ops.append(("bgcolor", Color.from_ansi(number - 40)))
+        elif 100 <= number <= 107:
+            ops.append(("bgcolor", Color.from_ansi(number - 92)))
+        elif number == 39:
+            ops.append(("color", None))
+        elif number == 49:
+            ops.append(("bgcolor", None))
+        elif number in (38, 48):
+            if args is None:
+                color, consumed = extended_color(codes[i:])
+                i += consumed
+            elif args[:1] == ["2"] and len(args) >= 5:
+                # 38:2:colorspace:r:g:b
+                color, _ = extended_color(["2"] + args[2:5])
+            else:
+                color, _ = extended_color(args)
+            if color is not None:
+                ops.append(("color" if number == 38 else "bgcolor", color))
+    return tuple(ops)
+
+
+def apply_sgr(current: ProtoStyle, ops: Tuple[SGROp, ...]) -> ProtoStyle:
+    """
+    A new ProtoStyle with the changes of parse_sgr applied to current.
+    """
+    proto = current.copy()
+    for field, value in ops:
+        if field is None:
+            proto = ProtoStyle()
+        else:
+            setattr(proto, field, value)
+    return proto
+
+
+# (Style, SGR parameters) -> the ProtoStyle and Style they lead to. Relayed output moves between
+# the same few styles over and over, so most sequences are a lookup here instead of a copy of the
+# ProtoStyle. The ProtoStyles are never mutated, only copied, so they can be shared.
+TRANSITIONS: Dict[Tuple[Style, str], Tuple[ProtoStyle, Style]] = dict()
+TRANSITIONS_MAX = 4096
+
+
+def transition(current: ProtoStyle, style: Style, params: str) -> Tuple[ProtoStyle, Style]:
+    if (found := TRANSITIONS.get((style, params), None)) is not None:
+        return found
+    if ops := parse_sgr(params):
+        current = apply_sgr(current, ops)
+        found = current, current.convert()
+    else:
+        found = current, style
+    if len(TRANSITIONS) >= TRANSITIONS_MAX:
+        TRANSITIONS.clear()
+    TRANSITIONS[(style, params)] = found
+    return found
+
+
+class IncrementalDecoder(BaseIncrementalDecoder):
+    def decode_segments(self, src: str, final: bool) -> Tuple[List[Tuple[str, Style]], int]:
+        current = self.current
+        style = current.convert()
+        segments: List[Tuple[str, Style]] = list()
+        end = len(src)
+
+        if not final and (last := src.rfind("\x1b")) >= 0 and ANSI_PARTIAL.fullmatch(src, last):
+            # This might be the start of a sequence which was cut off, so wait for the rest.
+            end = last
+            src = src[:end]
+
+        # The text between sequences alternates with the groups of each sequence, sgr first.
+        # Anything other than SGR, such as cursor movement, can't be kept and is dropped.
+        parts = ANSI_TOKEN.split(src)
+        for text, params in zip(parts[::SPLIT_STRIDE], parts[1::SPLIT_STRIDE]):
+            if text:
+                segments.append((text, style))
+            if params is not None:
+                if (found := TRANSITIONS.get((style, params), None)) is None:
+                    found = transition(current, style, params)
+                current, style = found
+        if text := parts[-1]:
+            segments.append((text, style))
+
+        self.current = current
+        return segments, end
+
+
+def decode(src: str, errors: str = "strict") -> Text:
+    return IncrementalDecoder(errors).decode(src, final=True)
+
+
+def decode_many(
+    sources: Iterable[str], errors: str = "strict", separator: Optional[str] = None
+) -> Union[List[Text], Text]:
+    """
+    Decode many pieces of markup at once, sharing one decoder between them. See
+    BaseIncrementalDecoder.decode_many.
+    """
+    return IncrementalDecoder(errors).decode_many(sources, separator)
+
+
+def strip(src: str, errors: str = "strict") -> str:
+    """
+    decode(src).plain, by removing escape sequences and control codes.
+    """
+    if "\x1b" in src:
+        src = ANSI_TOKEN.sub("", src)
+    return strip_control_codes(src)
+
+
+plain_len, cell_len = measurers(strip)
+
+
+# The basic colors and attributes, each reset straight away, so that their Styles get interned.
+WARMUP = "".join(f"\x1b[{code}mx\x1b[0m" for code in (*range(30, 38), *range(40, 48)))
+WARMUP += "".join(f"\x1b[1;{code}mx\x1b[0m" for code in range(30, 38))
+WARMUP += "".join(f"\x1b[{on}mx\x1b[0m" for _, on, _ in SGR_ATTRS)
+
+
+def warmup():
+    decode(WARMUP)
+
+
+def encode(src: Text, errors: str = "strict", color_system: Optional[str] = "truecolor") -> str:
+    """
+    Encode a Text as ANSI SGR sequences for the given color system. See render.render_ansi.
+    """
+    return render_ansi(src, color_system).decode("utf-8")
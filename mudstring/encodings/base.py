@@ -1,12 +1,134 @@
-from typing import Optional, Union, Dict
+from collections import OrderedDict, namedtuple
+from _thread import allocate_lock as Lock  # threading.Lock, without the rest of threading
+from operator import attrgetter, itemgetter
+from typing import Callable, Optional, Union, Dict, Tuple, List, Iterable
+from rich.cells import cell_len
 from rich.color import Color
+from rich.control import strip_control_codes
 from rich.style import Style
+from rich.text import Text, Span
+
+
+def escape_mxp(s: str, quote: bool = True) -> str:
+    """
+    Escape text for MXP, exactly as html.escape does. Importing html would also load its large
+    table of entities, which only unescaping needs.
+    """
+    s = s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if quote:
+        s = s.replace('"', "&quot;").replace("'", "&#x27;")
+    return s
+
+
+def cell_width(plain: str) -> int:
+    """
+    The number of terminal cells decoded text takes up, as Text.cell_len, for lining up the
+    columns of WHO lists and tables. Printable ASCII is one cell a character, so most text is
+    measured by its length alone; anything else goes through rich, which caches the width of
+    each character it has seen.
+    """
+    if plain.isascii() and plain.isprintable():
+        return len(plain)
+    return cell_len(plain)
+
+
+def measurers(strip: Callable[[str, str], str]) -> Tuple[Callable[..., int], Callable[..., int]]:
+    """
+    A codec's plain_len() and cell_len(): the length and cell width of decode(src), measured
+    from what its strip() leaves.
+    """
+
+    def plain_len(src: str, errors: str = "strict") -> int:
+        return len(strip(src, errors))
+
+    def cell_len(src: str, errors: str = "strict") -> int:
+        return cell_width(strip(src, errors))
+
+    return plain_len, cell_len
+
+
+StyleCacheInfo = namedtuple("StyleCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class StyleCache:
+    """
+    Bounded LRU which interns rich Styles by the flattened state of the ProtoStyle that
+    produced them, so that identical states share a single Style object.
+
+    Decoders in any thread share it, so lookups and evictions happen under a lock. Styles are
+    built outside of it; if two threads build the same one, the first to be stored wins.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.styles: "OrderedDict[Tuple, Style]" = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, proto: "ProtoStyle") -> Style:
+        key = proto.key()
+        styles = self.styles
+        with self.lock:
+            if (style := styles.get(key, None)) is not None:
+                self.hits += 1
+                styles.move_to_end(key)
+                return style
+            self.misses += 1
+        style = Style(**proto.export())
+        with self.lock:
+            if (found := styles.get(key, None)) is not None:
+                return found
+            styles[key] = style
+            if len(styles) > self.maxsize:
+                styles.popitem(last=False)
+        return style
+
+    def info(self) -> StyleCacheInfo:
+        with self.lock:
+            return StyleCacheInfo(self.hits, self.misses, self.maxsize, len(self.styles))
+
+    def clear(self):
+        with self.lock:
+            self.styles.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+STYLE_CACHE = StyleCache()
 
 
 class ProtoStyle:
+    """
+    A flat, mutable bundle of style state used by the decoders while they walk their markup.
+    Decoders copy() the current state when a code opens and keep the copies on a stack (or
+    just replace the current one), so no tree of styles is retained while decoding.
+    """
+
+    FIELDS = (
+        "color",
+        "bgcolor",
+        "bold",
+        "dim",
+        "italic",
+        "underline",
+        "blink",
+        "blink2",
+        "reverse",
+        "conceal",
+        "strike",
+        "underline2",
+        "frame",
+        "encircle",
+        "overline",
+        "link",
+        "tag",
+    )
+
+    __slots__ = FIELDS + ("xml_attr",)
+
     def __init__(
         self,
-        parent: Optional["ProtoStyle"] = None,
         color: Optional[Union[Color, str]] = None,
         bgcolor: Optional[Union[Color, str]] = None,
         bold: Optional[bool] = None,
@@ -26,10 +148,6 @@ class ProtoStyle:
         tag: Optional[str] = None,
         xml_attr: Optional[Dict[str, str]] = None,
     ):
-        self.parent = parent
-        self.children = list()
-        if parent:
-            self.parent.children.append(self)
         self.color = color
         self.bgcolor = bgcolor
         self.bold = bold
@@ -49,58 +167,274 @@ class ProtoStyle:
         self.tag = tag
         self.xml_attr = xml_attr
 
-    def ancestors(self, reversed=False):
+    def copy(self) -> "ProtoStyle":
         """
-        Retrieve all ancestors and return it as a list, ordered from outside-to-in.
-
-        Returns:
-            ancestors (List[Markup])
+        Create a new ProtoStyle carrying this one's state. xml_attr is shared rather than copied,
+        as it is always replaced wholesale and never mutated in place.
         """
-        out = list()
-        if self.parent:
-            parent = self.parent
-            out.append(parent)
-            while (parent := parent.parent) :
-                out.append(parent)
-        if reversed:
-            out.reverse()
+        out = _new_proto(ProtoStyle)
+        for f in self.__slots__:
+            setattr(out, f, getattr(self, f))
         return out
 
     def export(self):
-        data = self.__dict__.copy()
-        data.pop("parent", None)
-        data.pop("children", None)
-        x = data.pop("xml_attr", None)
-        if x:
-            data["xml_attr"] = x.copy()
-        else:
-            data["xml_attr"] = None
+        data = dict(zip(self.FIELDS, _get_fields(self)))
+        data["xml_attr"] = self.xml_attr.copy() if self.xml_attr else None
         return data
 
-    def inherit_ansi(self):
-        for a in self.ancestors():
-            self.__dict__.update(a.export())
-            return
+    def key(self) -> Tuple:
+        """
+        Flatten this style's state into a hashable tuple, used to intern converted Styles.
+        """
+        x = self.xml_attr
+        return _get_fields(self) + (tuple(sorted(x.items())) if x else None,)
 
     def convert(self) -> Style:
-        return Style(**self.export())
+        return STYLE_CACHE.get(self)
 
     def do_reset(self):
-        self.color = None
-        self.bgcolor = None
-        self.bold = None
-        self.dim = None
-        self.italic = None
-        self.underline = None
-        self.blink = None
-        self.blink2 = None
-        self.reverse = None
-        self.conceal = None
-        self.strike = None
-        self.underline2 = None
-        self.frame = None
-        self.encircle = None
-        self.overline = None
-        self.link = None
-        self.tag = None
-        self.xml_attr = None
+        for f in self.__slots__:
+            setattr(self, f, None)
+
+
+_new_proto = object.__new__
+# Span's generated __new__ is slow for how many of them decoding makes.
+_new_span = tuple.__new__
+_get_fields = attrgetter(*ProtoStyle.FIELDS)
+
+
+def append_segments(
+    segments: Iterable[Tuple[str, Style]], plain: List[str], spans: List[Span], offset: int
+) -> int:
+    """
+    Add decoded (text, style) segments to the pieces of a Text being built, without making a
+    Text for them. Segments left empty are dropped, and a segment continuing the previous
+    span's style extends that span instead of starting another; tags which change nothing,
+    such as a nested h inside hr, would otherwise leave every later operation on the Text
+    with more spans to get through.
+
+    Returns:
+        offset (int): The length of the Text built so far.
+    """
+    last = spans[-1] if spans else None
+    for text, style in segments:
+        # Most text has no control codes to strip, and isprintable() is much cheaper to check.
+        if not text or not (text.isprintable() or (text := strip_control_codes(text))):
+            continue
+        end = offset + len(text)
+        if style:
+            # Decoded Styles are interned, so equal styles are almost always the same object.
+            if last is not None and last.end == offset and last.style is style:
+                last = spans[-1] = _new_span(Span, (last.start, end, style))
+            else:
+                last = _new_span(Span, (offset, end, style))
+                spans.append(last)
+        plain.append(text)
+        offset = end
+    return offset
+
+
+def build_text(segments: Iterable[Tuple[str, Style]]) -> Text:
+    """
+    A Text of decoded (text, style) segments, as Text.assemble(*segments) would make but with
+    fewer spans, and cheaper.
+    """
+    plain = list()
+    spans = list()
+    append_segments(segments, plain, spans, 0)
+    return Text("".join(plain), spans=spans)
+
+
+class BaseIncrementalDecoder:
+    """
+    Decodes markup which arrives in arbitrary chunks, such as from a network connection. Each
+    call to feed() returns a Text of everything which could be decoded so far; a code split
+    across two chunks is carried over until the rest of it arrives. The style in effect at the
+    end of one chunk carries over to the next.
+
+    Subclasses implement decode_segments().
+    """
+
+    def __init__(self, errors: str = "strict"):
+        self.errors = errors
+        self.pending = ""
+        self.reset()
+
+    def reset(self):
+        self.pending = ""
+        self.current = ProtoStyle()
+
+    def decode_segments(self, src: str, final: bool) -> Tuple[List[Tuple[str, Style]], int]:
+        """
+        Decode as much of src as possible.
+
+        Args:
+            src (str): The markup to decode, including anything carried over from last time.
+            final (bool): If True, no more data is coming and incomplete codes are dropped.
+
+        Returns:
+            segments, consumed (Tuple[List[Tuple[str, Style]], int]): The decoded text segments,
+                and how much of src was used up.
+        """
+        raise NotImplementedError()
+
+    def decode(self, src: str, final: bool = False) -> Text:
+        if self.pending:
+            src = self.pending + src
+        segments, consumed = self.decode_segments(src, final)
+        self.pending = "" if final else src[consumed:]
+        return build_text(segments)
+
+    def feed(self, chunk: str) -> Text:
+        return self.decode(chunk)
+
+    def flush(self) -> Text:
+        return self.decode("", final=True)
+
+    def decode_many(
+        self, sources: Iterable[str], separator: Optional[str] = None
+    ) -> Union[List[Text], Text]:
+        """
+        Decode many complete pieces of markup, such as the rows of a WHO list, reusing this
+        decoder for all of them. Each piece starts over with no style, and anything already
+        pending is discarded.
+
+        Args:
+            sources (Iterable[str]): The markup to decode.
+            separator (str): If given, return a single Text of all the decoded pieces joined by
+                this plain separator, instead of a list with a Text for each.
+
+        Returns:
+            decoded (Union[List[Text], Text]): The decoded Texts, or their join.
+        """
+        decode_segments = self.decode_segments
+        if separator is None:
+            texts = list()
+            for src in sources:
+                self.reset()
+                texts.append(build_text(decode_segments(src, True)[0]))
+            self.reset()
+            return texts
+
+        separator = strip_control_codes(separator)
+        plain = list()
+        spans = list()
+        offset = 0
+        for i, src in enumerate(sources):
+            if i:
+                plain.append(separator)
+                offset += len(separator)
+            self.reset()
+            offset = append_segments(decode_segments(src, True)[0], plain, spans, offset)
+        self.reset()
+        return Text("".join(plain), spans=spans)
+
+
+def style_runs(mstring: Text) -> Iterable[Tuple[int, int, Optional[Style]]]:
+    """
+    Yield (start, end, style) for each run of text, combining overlapping spans the same way
+    rich does when rendering.
+    """
+    spans = mstring.spans
+    end = len(mstring.plain)
+    if not mstring.style and all(a.end <= b.start for a, b in zip(spans, spans[1:])):
+        # The usual case for decoded markup: nothing overlaps, so there is nothing to combine.
+        pos = 0
+        for span in spans:
+            if span.start > pos:
+                yield pos, span.start, None
+            if span.end > span.start:
+                style = span.style
+                if isinstance(style, str):
+                    style = Style.parse(style)
+                yield span.start, span.end, style
+            pos = span.end
+        if pos < end:
+            yield pos, end, None
+        return
+
+    styles = [mstring.style] + [span.style for span in mstring.spans]
+    styles = [Style.parse(s) if isinstance(s, str) else s for s in styles]
+    events = [(0, False, 0)]
+    for i, span in enumerate(mstring.spans, 1):
+        events.append((span.start, False, i))
+        events.append((span.end, True, i))
+    events.append((end, True, 0))
+    events.sort(key=itemgetter(0, 1))
+
+    stack: List[int] = list()
+    combined: Dict[Tuple[int, ...], Optional[Style]] = dict()
+    for (offset, leaving, index), (next_offset, _, _) in zip(events, events[1:]):
+        if leaving:
+            stack.remove(index)
+        else:
+            stack.append(index)
+        if next_offset > offset:
+            key = tuple(sorted(stack))
+            if (style := combined.get(key, False)) is False:
+                present = [styles[i] for i in key if styles[i]]
+                if len(present) > 1:
+                    style = Style.combine(present)
+                else:
+                    style = present[0] if present else None
+                combined[key] = style
+            yield offset, next_offset, style
+
+
+def xterm_color(code: str) -> Color:
+    """
+    The color of three 0-5 digits giving the levels of red, green and blue in xterm's 6x6x6
+    color cube, as Evennia and Circle codes write them.
+    """
+    return Color.from_ansi(16 + 36 * int(code[0]) + 6 * int(code[1]) + int(code[2]))
+
+
+def xterm_digits(number: int) -> str:
+    """
+    The three cube digits of an xterm color number in the 16-231 range of the color cube.
+    """
+    number -= 16
+    return f"{number // 36}{number // 6 % 6}{number % 6}"
+
+
+def encode_runs(
+    src: Text,
+    style_state: Callable[[Optional[Style]], Dict[str, object]],
+    transition: Callable[[Dict[str, object], Dict[str, object]], str],
+    escape: Callable[[str], str],
+    reset: str,
+) -> str:
+    """
+    Encode a Text for codecs which reduce each Style to a flat state, such as Evennia and
+    Circle: every run of text is preceded by the codes leading to its state from the one
+    before, and the output ends by resetting whatever is still on.
+
+    Args:
+        src (Text): The Text to encode.
+        style_state (Callable): Reduces a Style, or None, to the state the codec can express.
+        transition (Callable): The codes leading from one state to another.
+        escape (Callable): Escapes the codec's special characters in plain text.
+        reset (str): The code resetting everything.
+    """
+    output: List[str] = list()
+    plain = src.plain
+    current: Dict[str, object] = dict()
+    # Keyed on id(), so the states are kept alive here for the whole call. Runs without a style
+    # are in the starting state.
+    states: Dict[int, Dict[str, object]] = {id(None): current}
+    transitions: Dict[Tuple[int, int], str] = dict()
+
+    for start, end, style in style_runs(src):
+        if (state := states.get(id(style), None)) is None:
+            state = states[id(style)] = style_state(style)
+        if state != current:
+            key = (id(current), id(state))
+            if (codes := transitions.get(key, None)) is None:
+                codes = transitions[key] = transition(current, state)
+            output.append(codes)
+            current = state
+        output.append(escape(plain[start:end]))
+
+    if current:
+        output.append(reset)
+    return "".join(output)
@@ -0,0 +1,101 @@
+import sys
+from collections import OrderedDict, namedtuple
+from _thread import allocate_lock as Lock  # threading.Lock, without the rest of threading
+from typing import Callable, Dict, Tuple
+from rich.text import Text, Span
+
+from . import get_codec
+
+
+DecodeCacheInfo = namedtuple(
+    "DecodeCacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize", "maxbytes", "currbytes"],
+)
+
+
+SPAN_COST = sys.getsizeof(Span(0, 0, ""))
+
+
+def estimate_size(src: str, text: Text) -> int:
+    """
+    Rough number of bytes kept alive by caching `text` under `src`. Styles are interned by
+    the decoders and shared between entries, so they aren't counted.
+    """
+    return sys.getsizeof(src) + sys.getsizeof(text.plain) + SPAN_COST * len(text.spans)
+
+
+class DecodeCache:
+    """
+    Opt-in LRU around the codec decoders, for markup that is decoded over and over again such
+    as room names, channel prefixes and WHO headers.
+
+    Entries are keyed on (codec, source, errors) and bounded both by count and by estimated size in
+    bytes. Text is mutable, so every call returns a copy of the cached result.
+
+    It may be shared between threads: the entries are only looked at and changed under a lock,
+    while decoding happens outside of it.
+    """
+
+    def __init__(self, maxsize: int = 4096, maxbytes: int = 4 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.currbytes = 0
+        self.entries: "OrderedDict[Tuple[str, str, str], Tuple[Text, int]]" = OrderedDict()
+        self.decoders: Dict[str, Callable[..., Text]] = dict()
+        self.lock = Lock()
+
+    def get_decoder(self, codec: str) -> Callable[..., Text]:
+        if (decoder := self.decoders.get(codec, None)) is None:
+            decoder = get_codec(codec).decode
+            self.decoders[codec] = decoder
+        return decoder
+
+    def decode(self, codec: str, src: str, errors: str = "strict") -> Text:
+        key = (codec, src, errors)
+        entries = self.entries
+        with self.lock:
+            if (found := entries.get(key, None)) is not None:
+                self.hits += 1
+                entries.move_to_end(key)
+                return found[0].copy()
+            self.misses += 1
+
+        text = self.get_decoder(codec)(src, errors=errors)
+        size = estimate_size(src, text)
+        if size > self.maxbytes:
+            # Too big to ever fit; don't flush everything else out for it.
+            return text
+        with self.lock:
+            if key in entries:
+                # Another thread decoded it meanwhile, so this one isn't kept.
+                return text
+            entries[key] = (text, size)
+            self.currbytes += size
+            while len(entries) > self.maxsize or self.currbytes > self.maxbytes:
+                _, (_, evicted) = entries.popitem(last=False)
+                self.currbytes -= evicted
+                self.evictions += 1
+        return text.copy()
+
+    def info(self) -> DecodeCacheInfo:
+        with self.lock:
+            return DecodeCacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self.entries),
+                self.maxbytes,
+                self.currbytes,
+            )
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -1,111 +1,257 @@
 import re
-from ..patches.style import MudStyle, ProtoStyle
+from rich.style import Style
 from rich.text import Text
-from typing import Union, List, Tuple, Iterable, Optional
-from collections import defaultdict
-
-
-CIRCLE_REGEX = {
-    "fg_ansi": re.compile(r"^[xrgObpcwzRGYBPCWvVuUiIsSdD]"),
-    "blink_fg_ansi": re.compile(r"^[xrgObpcwzRGYBPCW]"),
-    "bg_ansi": re.compile(r"^[xrgObpcWwY]"),
-    "xterm_number": re.compile(r"^\[(F|B)[0-5]{3}\]", flags=re.IGNORECASE),
-    "xterm_predef": re.compile(r"^[rRgGbByYmMcCwWaAjJlLoOpPtTvV]"),
-}
-
-
-def find_first(within: str, chars: Iterable[str]):
-    results = list()
-    for c in chars:
-        f = within.find(c)
-        if f != -1:
-            results.append(f)
-    if results:
-        return min(results)
-    else:
-        return -1
+from rich.color import Color, ColorSystem, ColorType
+from rich.control import strip_control_codes
+from .base import ProtoStyle, BaseIncrementalDecoder, measurers
+from .base import encode_runs, xterm_color, xterm_digits
+from typing import Union, List, Tuple, Dict, Optional, Iterable
+
+
+CIRCLE_TOKEN = re.compile(
+    r"(?P<literal>&&|``|\}\}|\^\^)"
+    r"|&(?P<fg_ansi>[xrgObpcwzRGYBPCWvVuUiIsSdD])"
+    r"|`(?P<xterm_number>\[[FfBb][0-5]{3}\])"
+    r"|`(?P<xterm_predef>[rRgGbByYmMcCwWaAjJlLoOpPtTvV])"
+    r"|\}(?P<blink_fg_ansi>[xrgObpcwzRGYBPCW])"
+    r"|\^(?P<bg_ansi>[xrgObpcWwY])"
+    r"|[&`}^]"
+)
+
+# An escape character at the end of a chunk which could still turn into a longer code.
+CIRCLE_PARTIAL = re.compile(r"[&}^]|`(?:\[(?:[FfBb][0-5]{0,3})?)?")
+
+# The same codes as CIRCLE_TOKEN, capturing only the character a doubled escape stands for.
+CIRCLE_STRIP = re.compile(
+    r"([&`}^])\1"
+    r"|&[xrgObpcwzRGYBPCWvVuUiIsSdD]"
+    r"|`\[[FfBb][0-5]{3}\]"
+    r"|`[rRgGbByYmMcCwWaAjJlLoOpPtTvV]"
+    r"|\}[xrgObpcwzRGYBPCW]"
+    r"|\^[xrgObpcWwY]"
+    r"|[&`}^]"
+)
+
+
+# The dark colors are plain ANSI colors, the bright ones add bold.
+DARK_COLORS = "xrgObpcw"
+BRIGHT_COLORS = "zRGYBPCW"
+FG_COLORS = {c: (i, False) for i, c in enumerate(DARK_COLORS)}
+FG_COLORS.update({c: (i, True) for i, c in enumerate(BRIGHT_COLORS)})
+BG_COLORS = {c: i for i, c in enumerate(DARK_COLORS)}
+BG_COLORS.update({"W": 7, "Y": 3})
+FLAGS = {"v": "reverse", "u": "underline", "i": "italic", "s": "strike"}
+
+
+def apply_fg(proto: ProtoStyle, rule: str):
+    number, bright = FG_COLORS[rule]
+    proto.color = Color.from_ansi(number)
+    proto.bold = True if bright else None
 
 
 def apply_ansi_rule(proto: ProtoStyle, mode: str, rule: str):
-    pass
+    if mode == "fg_ansi":
+        if rule in FG_COLORS:
+            apply_fg(proto, rule)
+        else:
+            setattr(proto, FLAGS[rule.lower()], True)
+    elif mode == "blink_fg_ansi":
+        apply_fg(proto, rule)
+        proto.blink = True
+    elif mode == "bg_ansi":
+        proto.bgcolor = Color.from_ansi(BG_COLORS[rule])
+    elif mode == "xterm_number":
+        # looks like [F123] or [B123]
+        if rule[1] in ("F", "f"):
+            proto.color = xterm_color(rule[2:5])
+        else:
+            proto.bgcolor = xterm_color(rule[2:5])
+    # xterm_predef codes refer to a server-defined palette, so there is nothing to apply here.
+
+
+class IncrementalDecoder(BaseIncrementalDecoder):
+    def decode_segments(self, src: str, final: bool) -> Tuple[List[Tuple[str, Style]], int]:
+        current = self.current
+        segment: List[str] = list()
+        segments: List[Tuple[str, Style]] = list()
+        pos = 0
+        end = len(src)
+
+        for match in CIRCLE_TOKEN.finditer(src):
+            if (
+                not final
+                and match.lastgroup is None
+                and CIRCLE_PARTIAL.fullmatch(src, match.start())
+            ):
+                # This might be the start of a code which was cut off, so wait for the rest of it.
+                end = match.start()
+                break
+            segment.append(src[pos : match.start()])
+            pos = match.end()
+            mode = match.lastgroup
+            if mode is None:
+                # An escape character followed by nothing we understand is dropped.
+                continue
+            code = match.group(mode)
+            if mode == "literal":
+                # A doubled escape character is just that character.
+                segment.append(code[0])
+                continue
+
+            text = "".join(segment)
+            if text:
+                segments.append((text, current.convert()))
+            segment.clear()
+            if mode == "fg_ansi" and code.upper() == "D":
+                # &D resets to default.
+                current = ProtoStyle()
+            else:
+                current = current.copy()
+                apply_ansi_rule(current, mode, code)
+
+        segment.append(src[pos:end])
+        text = "".join(segment)
+        if text:
+            segments.append((text, current.convert()))
+
+        self.current = current
+        return segments, end
 
 
 def decode(src: str, errors: str = "strict") -> Text:
-    current = ProtoStyle()
-    segment: str = ""
-
-    remaining = src
-    escaped: Optional[str] = None
-    segments: List[Tuple[str, MudStyle]] = list()
-
-    while len(remaining):
-        if escaped:
-            if escaped == remaining[0]:
-                segment += remaining[0]
-                remaining = remaining[1:]
-            elif escaped == "&":
-                if (match := CIRCLE_REGEX["fg_ansi"].match(remaining)) :
-                    if segment:
-                        segments.append((segment, current.convert()))
-                        segment = ""
-                    current = ProtoStyle(current)
-                    if remaining[0].upper() != "D":
-                        current.inherit_ansi()
-                        apply_ansi_rule(current, "fg_ansi", remaining[0])
-                    else:
-                        current.reset = True
-                    remaining = remaining[1:]
-            elif escaped == "`":
-                if (match := CIRCLE_REGEX["xterm_number"].match(remaining)) :
-                    if segment:
-                        segments.append((segment, current.convert()))
-                        segment = ""
-                    current = ProtoStyle(current)
-                    apply_ansi_rule(current, "xterm_number", match.group(0))
-                    remaining = remaining[match.end(0) :]
-                elif (match := CIRCLE_REGEX["xterm_predef"].match(remaining)) :
-                    if segment:
-                        segments.append((segment, current.convert()))
-                        segment = ""
-                    current = ProtoStyle(current)
-                    apply_ansi_rule(current, "xterm_predef", match.group(0))
-                    remaining = remaining[match.end(0) :]
-            elif escaped == "}":
-                if (match := CIRCLE_REGEX["blink_fg_ansi"].match(remaining)) :
-                    if segment:
-                        segments.append((segment, current.convert()))
-                        segment = ""
-                    current = ProtoStyle(current)
-                    apply_ansi_rule(current, "blink_fg_ansi", remaining[0])
-                    remaining = remaining[1:]
-            elif escaped == "^":
-                if (match := CIRCLE_REGEX["bg_ansi"].match(remaining)) :
-                    if segment:
-                        segments.append((segment, current.convert()))
-                        segment = ""
-                    current = ProtoStyle(current)
-                    apply_ansi_rule(current, "bg_ansi", remaining[0])
-                    remaining = remaining[1:]
-            escaped = None
+    return IncrementalDecoder(errors).decode(src, final=True)
+
+
+def decode_many(
+    sources: Iterable[str], errors: str = "strict", separator: Optional[str] = None
+) -> Union[List[Text], Text]:
+    """
+    Decode many pieces of markup at once, sharing one decoder between them. See
+    BaseIncrementalDecoder.decode_many.
+    """
+    return IncrementalDecoder(errors).decode_many(sources, separator)
+
+
+def strip(src: str, errors: str = "strict") -> str:
+    """
+    decode(src).plain, by removing codes and undoubling escaped characters.
+    """
+    # The text between codes alternates with the character of each doubled escape, None for
+    # the rest.
+    return strip_control_codes("".join(filter(None, CIRCLE_STRIP.split(src))))
+
+
+plain_len, cell_len = measurers(strip)
+
+
+# Every color code and flag, each reset straight away, so that their Styles get interned.
+WARMUP = "".join(f"&{c}x&d" for c in DARK_COLORS + BRIGHT_COLORS + "vuis")
+WARMUP += "".join(f"^{c}x&d" for c in BG_COLORS)
+
+
+def warmup():
+    decode(WARMUP)
+
+
+FLAG_CODES = {flag: f"&{c}" for c, flag in FLAGS.items()}
+ESCAPES = str.maketrans({c: c * 2 for c in "&`}^"})
+
+
+def xterm_code(color: Color) -> str:
+    """
+    The three cube digits of an xterm color, downgrading colors which aren't in the cube.
+    """
+    if color.triplet is not None:
+        from .palette import rgb_to_xterm
+
+        color = Color.from_ansi(rgb_to_xterm(*color.triplet))
+    elif color.type != ColorType.EIGHT_BIT:
+        color = color.downgrade(ColorSystem.EIGHT_BIT)
+    number = color.number
+    if number < 16 or number > 231:
+        from .palette import CUBE_LEVELS
+
+        return "".join(str(CUBE_LEVELS[c]) for c in color.get_truecolor())
+    return xterm_digits(number)
+
+
+def style_state(style: Optional[Style]) -> Dict[str, object]:
+    """
+    Reduce a Style to what Circle codes can express: codes for the colors and the enabled flags.
+    Bold and blinking only come with a foreground color, so they are lost on text without one.
+    """
+    state = dict()
+    if not style:
+        return state
+    color = style.color
+    if color is not None and color.type != ColorType.DEFAULT:
+        if color.type in (ColorType.STANDARD, ColorType.EIGHT_BIT) and color.number < 16:
+            # The bright colors 8-15 are the bold letters, like bold with a dark color.
+            bright = style.bold or color.number >= 8
+            state["color"] = (BRIGHT_COLORS if bright else DARK_COLORS)[color.number % 8]
         else:
-            loc = find_first(remaining, ("&", "`", "}", "^"))
-            if loc != -1:
-                escaped = remaining[loc]
-                segment += remaining[:loc]
-                remaining = remaining[loc + 1 :]
-            else:
-                segment += remaining
-                remaining = ""
+            bright = style.bold
+            state["color"] = f"[F{xterm_code(color)}]"
+        if bright:
+            state["bold"] = True
+    color = style.bgcolor
+    if color is not None and color.type != ColorType.DEFAULT:
+        if color.type == ColorType.STANDARD and color.number < 8:
+            state["bgcolor"] = DARK_COLORS[color.number]
+        else:
+            state["bgcolor"] = f"[B{xterm_code(color)}]"
+    if style.blink and "color" in state:
+        state["blink"] = True
+    for flag in FLAG_CODES:
+        if getattr(style, flag):
+            state[flag] = True
+    return state
 
-    if segment:
-        segments.append((segment, current.convert()))
 
-    return Text.assemble(*[(t, s) for t, s in segments])
+def style_codes(state: Dict[str, object], base: Dict[str, object]) -> str:
+    """
+    The codes needed to get from the base state to the target state by only adding to it.
+    """
+    out = list()
+    fg = state.get("color", None)
+    bold = state.get("bold", False)
+    if fg is None or len(fg) == 1:
+        letter, xterm = fg, ""
+    else:
+        # Blinking and bold only come with a letter color, which the xterm color then replaces.
+        letter, xterm = ("z" if bold else "w"), f"`{fg}"
+    if state.get("blink", False) and not base.get("blink", False):
+        out.append(f"}}{letter}{xterm}")
+    elif fg is not None and (fg != base.get("color", None) or bold and "bold" not in base):
+        out.append(f"&{letter}{xterm}" if bold or not xterm else xterm)
+    if (bg := state.get("bgcolor", None)) and bg != base.get("bgcolor", None):
+        out.append(f"^{bg}" if len(bg) == 1 else f"`{bg}")
+    for flag, code in FLAG_CODES.items():
+        if flag in state and flag not in base:
+            out.append(code)
+    return "".join(out)
 
 
-def encode(src: Text) -> str:
-    return ""
+def transition(base: Dict[str, object], state: Dict[str, object]) -> str:
+    # Nothing can be turned off without resetting everything with &d, except bold, which a dark
+    # letter color turns off by itself.
+    removed = [k for k in base if k not in state]
+    if not removed or removed == ["bold"] and len(state.get("color", "")) == 1:
+        return style_codes(state, base)
+    return "&d" + style_codes(state, dict())
+
+
+def escape(text: str) -> str:
+    return text.translate(ESCAPES)
+
+
+def encode(src: Text, errors: str = "strict") -> str:
+    return encode_runs(src, style_state, transition, escape, "&d")
 
 
 def install():
-    Text.install_codec("circle", encode, decode)
+    # Text never grew an install_codec; codecs are registered with mudstring.encodings instead,
+    # which already knows about this one. Kept so that existing callers don't break.
+    from . import register_codec
+
+    register_codec("circle", __name__)
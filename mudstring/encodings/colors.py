@@ -1,932 +1,1020 @@
-COLORS = {
-    "aliceblue": {"ansi": 263, "rgb": "0xf0f8ff", "xterm": 15},
-    "antiquewhite": {"ansi": 263, "rgb": "0xfaebd7", "xterm": 224},
-    "antiquewhite1": {"ansi": 263, "rgb": "0xffefdb", "xterm": 230},
-    "antiquewhite2": {"ansi": 263, "rgb": "0xeedfcc", "xterm": 224},
-    "antiquewhite3": {"ansi": 261, "rgb": "0xcdc0b0", "xterm": 181},
-    "antiquewhite4": {"ansi": 256, "rgb": "0x8b8378", "xterm": 8},
-    "aqua": {"ansi": 262, "rgb": "0x00ffff", "xterm": 14},
-    "aquamarine": {"ansi": 263, "rgb": "0x7fffd4", "xterm": 122},
-    "aquamarine1": {"ansi": 263, "rgb": "0x7fffd4", "xterm": 122},
-    "aquamarine2": {"ansi": 263, "rgb": "0x76eec6", "xterm": 122},
-    "aquamarine3": {"ansi": 262, "rgb": "0x66cdaa", "xterm": 79},
-    "aquamarine4": {"ansi": 2, "rgb": "0x458b74", "xterm": 66},
-    "azure": {"ansi": 263, "rgb": "0xf0ffff", "xterm": 15},
-    "azure1": {"ansi": 263, "rgb": "0xf0ffff", "xterm": 15},
-    "azure2": {"ansi": 263, "rgb": "0xe0eeee", "xterm": 255},
-    "azure3": {"ansi": 263, "rgb": "0xc1cdcd", "xterm": 251},
-    "azure4": {"ansi": 2, "rgb": "0x838b8b", "xterm": 102},
-    "beige": {"ansi": 263, "rgb": "0xf5f5dc", "xterm": 230},
-    "bisque": {"ansi": 263, "rgb": "0xffe4c4", "xterm": 224},
-    "bisque1": {"ansi": 263, "rgb": "0xffe4c4", "xterm": 224},
-    "bisque2": {"ansi": 263, "rgb": "0xeed5b7", "xterm": 223},
-    "bisque3": {"ansi": 261, "rgb": "0xcdb79e", "xterm": 181},
-    "bisque4": {"ansi": 2, "rgb": "0x8b7d6b", "xterm": 101},
-    "black": {"ansi": 0, "rgb": "0x000000", "xterm": 16},
-    "blanchedalmond": {"ansi": 263, "rgb": "0xffebcd", "xterm": 224},
-    "blue": {"ansi": 260, "rgb": "0x0000ff", "xterm": 21},
-    "blue1": {"ansi": 260, "rgb": "0x0000ff", "xterm": 21},
-    "blue2": {"ansi": 260, "rgb": "0x0000ee", "xterm": 12},
-    "blue3": {"ansi": 260, "rgb": "0x0000cd", "xterm": 20},
-    "blue4": {"ansi": 4, "rgb": "0x00008b", "xterm": 18},
-    "blueviolet": {"ansi": 261, "rgb": "0x8a2be2", "xterm": 92},
-    "brown": {"ansi": 1, "rgb": "0xa52a2a", "xterm": 124},
-    "brown1": {"ansi": 257, "rgb": "0xff4040", "xterm": 203},
-    "brown2": {"ansi": 257, "rgb": "0xee3b3b", "xterm": 203},
-    "brown3": {"ansi": 257, "rgb": "0xcd3333", "xterm": 167},
-    "brown4": {"ansi": 1, "rgb": "0x8b2323", "xterm": 88},
-    "burlywood": {"ansi": 259, "rgb": "0xdeb887", "xterm": 180},
-    "burlywood1": {"ansi": 259, "rgb": "0xffd39b", "xterm": 222},
-    "burlywood2": {"ansi": 259, "rgb": "0xeec591", "xterm": 222},
-    "burlywood3": {"ansi": 259, "rgb": "0xcdaa7d", "xterm": 180},
-    "burlywood4": {"ansi": 1, "rgb": "0x8b7355", "xterm": 95},
-    "cadetblue": {"ansi": 6, "rgb": "0x5f9ea0", "xterm": 73},
-    "cadetblue1": {"ansi": 263, "rgb": "0x98f5ff", "xterm": 123},
-    "cadetblue2": {"ansi": 262, "rgb": "0x8ee5ee", "xterm": 117},
-    "cadetblue3": {"ansi": 262, "rgb": "0x7ac5cd", "xterm": 116},
-    "cadetblue4": {"ansi": 2, "rgb": "0x53868b", "xterm": 66},
-    "chartreuse": {"ansi": 258, "rgb": "0x7fff00", "xterm": 118},
-    "chartreuse1": {"ansi": 258, "rgb": "0x7fff00", "xterm": 118},
-    "chartreuse2": {"ansi": 258, "rgb": "0x76ee00", "xterm": 118},
-    "chartreuse3": {"ansi": 258, "rgb": "0x66cd00", "xterm": 76},
-    "chartreuse4": {"ansi": 2, "rgb": "0x458b00", "xterm": 64},
-    "chocolate": {"ansi": 257, "rgb": "0xd2691e", "xterm": 166},
-    "chocolate1": {"ansi": 257, "rgb": "0xff7f24", "xterm": 208},
-    "chocolate2": {"ansi": 257, "rgb": "0xee7621", "xterm": 208},
-    "chocolate3": {"ansi": 257, "rgb": "0xcd661d", "xterm": 166},
-    "chocolate4": {"ansi": 2, "rgb": "0x8b4513", "xterm": 94},
-    "coral": {"ansi": 257, "rgb": "0xff7f50", "xterm": 209},
-    "coral1": {"ansi": 257, "rgb": "0xff7256", "xterm": 203},
-    "coral2": {"ansi": 257, "rgb": "0xee6a50", "xterm": 203},
-    "coral3": {"ansi": 257, "rgb": "0xcd5b45", "xterm": 167},
-    "coral4": {"ansi": 2, "rgb": "0x8b3e2f", "xterm": 94},
-    "cornflowerblue": {"ansi": 260, "rgb": "0x6495ed", "xterm": 69},
-    "cornsilk": {"ansi": 263, "rgb": "0xfff8dc", "xterm": 230},
-    "cornsilk1": {"ansi": 263, "rgb": "0xfff8dc", "xterm": 230},
-    "cornsilk2": {"ansi": 263, "rgb": "0xeee8cd", "xterm": 254},
-    "cornsilk3": {"ansi": 263, "rgb": "0xcdc8b1", "xterm": 187},
-    "cornsilk4": {"ansi": 2, "rgb": "0x8b8878", "xterm": 102},
-    "cyan": {"ansi": 262, "rgb": "0x00ffff", "xterm": 51},
-    "cyan1": {"ansi": 262, "rgb": "0x00ffff", "xterm": 51},
-    "cyan2": {"ansi": 262, "rgb": "0x00eeee", "xterm": 14},
-    "cyan3": {"ansi": 262, "rgb": "0x00cdcd", "xterm": 44},
-    "cyan4": {"ansi": 6, "rgb": "0x008b8b", "xterm": 30},
-    "darkblue": {"ansi": 4, "rgb": "0x00008b", "xterm": 18},
-    "darkcyan": {"ansi": 6, "rgb": "0x008b8b", "xterm": 30},
-    "darkgoldenrod": {"ansi": 3, "rgb": "0xb8860b", "xterm": 136},
-    "darkgoldenrod1": {"ansi": 259, "rgb": "0xffb90f", "xterm": 214},
-    "darkgoldenrod2": {"ansi": 259, "rgb": "0xeead0e", "xterm": 214},
-    "darkgoldenrod3": {"ansi": 3, "rgb": "0xcd950c", "xterm": 172},
-    "darkgoldenrod4": {"ansi": 2, "rgb": "0x8b6508", "xterm": 94},
-    "darkgray": {"ansi": 263, "rgb": "0xa9a9a9", "xterm": 248},
-    "darkgreen": {"ansi": 2, "rgb": "0x006400", "xterm": 22},
-    "darkgrey": {"ansi": 263, "rgb": "0xa9a9a9", "xterm": 248},
-    "darkkhaki": {"ansi": 3, "rgb": "0xbdb76b", "xterm": 143},
-    "darkmagenta": {"ansi": 5, "rgb": "0x8b008b", "xterm": 90},
-    "darkolivegreen": {"ansi": 256, "rgb": "0x556b2f", "xterm": 239},
-    "darkolivegreen1": {"ansi": 259, "rgb": "0xcaff70", "xterm": 191},
-    "darkolivegreen2": {"ansi": 259, "rgb": "0xbcee68", "xterm": 155},
-    "darkolivegreen3": {"ansi": 259, "rgb": "0xa2cd5a", "xterm": 149},
-    "darkolivegreen4": {"ansi": 2, "rgb": "0x6e8b3d", "xterm": 65},
-    "darkorange": {"ansi": 257, "rgb": "0xff8c00", "xterm": 208},
-    "darkorange1": {"ansi": 257, "rgb": "0xff7f00", "xterm": 208},
-    "darkorange2": {"ansi": 257, "rgb": "0xee7600", "xterm": 208},
-    "darkorange3": {"ansi": 257, "rgb": "0xcd6600", "xterm": 166},
-    "darkorange4": {"ansi": 2, "rgb": "0x8b4500", "xterm": 94},
-    "darkorchid": {"ansi": 261, "rgb": "0x9932cc", "xterm": 98},
-    "darkorchid1": {"ansi": 261, "rgb": "0xbf3eff", "xterm": 135},
-    "darkorchid2": {"ansi": 261, "rgb": "0xb23aee", "xterm": 135},
-    "darkorchid3": {"ansi": 261, "rgb": "0x9a32cd", "xterm": 98},
-    "darkorchid4": {"ansi": 5, "rgb": "0x68228b", "xterm": 54},
-    "darkred": {"ansi": 1, "rgb": "0x8b0000", "xterm": 88},
-    "darksalmon": {"ansi": 3, "rgb": "0xe9967a", "xterm": 174},
-    "darkseagreen": {"ansi": 2, "rgb": "0x8fbc8f", "xterm": 108},
-    "darkseagreen1": {"ansi": 259, "rgb": "0xc1ffc1", "xterm": 157},
-    "darkseagreen2": {"ansi": 259, "rgb": "0xb4eeb4", "xterm": 157},
-    "darkseagreen3": {"ansi": 258, "rgb": "0x9bcd9b", "xterm": 114},
-    "darkseagreen4": {"ansi": 2, "rgb": "0x698b69", "xterm": 65},
-    "darkslateblue": {"ansi": 6, "rgb": "0x483d8b", "xterm": 60},
-    "darkslategray": {"ansi": 256, "rgb": "0x2f4f4f", "xterm": 238},
-    "darkslategray1": {"ansi": 263, "rgb": "0x97ffff", "xterm": 123},
-    "darkslategray2": {"ansi": 263, "rgb": "0x8deeee", "xterm": 123},
-    "darkslategray3": {"ansi": 262, "rgb": "0x79cdcd", "xterm": 116},
-    "darkslategray4": {"ansi": 2, "rgb": "0x528b8b", "xterm": 66},
-    "darkslategrey": {"ansi": 256, "rgb": "0x2f4f4f", "xterm": 238},
-    "darkslategrey1": {"ansi": 263, "rgb": "0x97ffff", "xterm": 123},
-    "darkslategrey2": {"ansi": 263, "rgb": "0x8deeee", "xterm": 123},
-    "darkslategrey3": {"ansi": 262, "rgb": "0x79cdcd", "xterm": 116},
-    "darkslategrey4": {"ansi": 2, "rgb": "0x528b8b", "xterm": 66},
-    "darkturquoise": {"ansi": 262, "rgb": "0x00ced1", "xterm": 44},
-    "darkviolet": {"ansi": 261, "rgb": "0x9400d3", "xterm": 92},
-    "deeppink": {"ansi": 257, "rgb": "0xff1493", "xterm": 198},
-    "deeppink1": {"ansi": 257, "rgb": "0xff1493", "xterm": 198},
-    "deeppink2": {"ansi": 257, "rgb": "0xee1289", "xterm": 198},
-    "deeppink3": {"ansi": 261, "rgb": "0xcd1076", "xterm": 162},
-    "deeppink4": {"ansi": 1, "rgb": "0x8b0a50", "xterm": 89},
-    "deepskyblue": {"ansi": 260, "rgb": "0x00bfff", "xterm": 39},
-    "deepskyblue1": {"ansi": 260, "rgb": "0x00bfff", "xterm": 39},
-    "deepskyblue2": {"ansi": 260, "rgb": "0x00b2ee", "xterm": 39},
-    "deepskyblue3": {"ansi": 260, "rgb": "0x009acd", "xterm": 32},
-    "deepskyblue4": {"ansi": 4, "rgb": "0x00688b", "xterm": 24},
-    "dimgray": {"ansi": 7, "rgb": "0x696969", "xterm": 242},
-    "dimgrey": {"ansi": 7, "rgb": "0x696969", "xterm": 242},
-    "dodgerblue": {"ansi": 260, "rgb": "0x1e90ff", "xterm": 33},
-    "dodgerblue1": {"ansi": 260, "rgb": "0x1e90ff", "xterm": 33},
-    "dodgerblue2": {"ansi": 260, "rgb": "0x1c86ee", "xterm": 33},
-    "dodgerblue3": {"ansi": 260, "rgb": "0x1874cd", "xterm": 32},
-    "dodgerblue4": {"ansi": 4, "rgb": "0x104e8b", "xterm": 24},
-    "firebrick": {"ansi": 1, "rgb": "0xb22222", "xterm": 124},
-    "firebrick1": {"ansi": 257, "rgb": "0xff3030", "xterm": 203},
-    "firebrick2": {"ansi": 257, "rgb": "0xee2c2c", "xterm": 9},
-    "firebrick3": {"ansi": 1, "rgb": "0xcd2626", "xterm": 160},
-    "firebrick4": {"ansi": 1, "rgb": "0x8b1a1a", "xterm": 88},
-    "floralwhite": {"ansi": 263, "rgb": "0xfffaf0", "xterm": 15},
-    "forestgreen": {"ansi": 258, "rgb": "0x228b22", "xterm": 28},
-    "fuchsia": {"ansi": 261, "rgb": "0xff00ff", "xterm": 13},
-    "gainsboro": {"ansi": 263, "rgb": "0xdcdcdc", "xterm": 253},
-    "ghostwhite": {"ansi": 263, "rgb": "0xf8f8ff", "xterm": 15},
-    "gold": {"ansi": 259, "rgb": "0xffd700", "xterm": 220},
-    "gold1": {"ansi": 259, "rgb": "0xffd700", "xterm": 220},
-    "gold2": {"ansi": 259, "rgb": "0xeec900", "xterm": 220},
-    "gold3": {"ansi": 3, "rgb": "0xcdad00", "xterm": 178},
-    "gold4": {"ansi": 3, "rgb": "0x8b7500", "xterm": 3},
-    "goldenrod": {"ansi": 3, "rgb": "0xdaa520", "xterm": 178},
-    "goldenrod1": {"ansi": 259, "rgb": "0xffc125", "xterm": 214},
-    "goldenrod2": {"ansi": 259, "rgb": "0xeeb422", "xterm": 214},
-    "goldenrod3": {"ansi": 3, "rgb": "0xcd9b1d", "xterm": 172},
-    "goldenrod4": {"ansi": 2, "rgb": "0x8b6914", "xterm": 94},
-    "gray": {"ansi": 7, "rgb": "0xbebebe", "xterm": 7},
-    "gray0": {"ansi": 0, "rgb": "0x000000", "xterm": 16},
-    "gray1": {"ansi": 0, "rgb": "0x030303", "xterm": 0},
-    "gray10": {"ansi": 256, "rgb": "0x1a1a1a", "xterm": 234},
-    "gray100": {"ansi": 263, "rgb": "0xffffff", "xterm": 231},
-    "gray11": {"ansi": 256, "rgb": "0x1c1c1c", "xterm": 234},
-    "gray12": {"ansi": 256, "rgb": "0x1f1f1f", "xterm": 234},
-    "gray13": {"ansi": 256, "rgb": "0x212121", "xterm": 234},
-    "gray14": {"ansi": 256, "rgb": "0x242424", "xterm": 235},
-    "gray15": {"ansi": 256, "rgb": "0x262626", "xterm": 235},
-    "gray16": {"ansi": 256, "rgb": "0x292929", "xterm": 235},
-    "gray17": {"ansi": 256, "rgb": "0x2b2b2b", "xterm": 235},
-    "gray18": {"ansi": 256, "rgb": "0x2e2e2e", "xterm": 236},
-    "gray19": {"ansi": 256, "rgb": "0x303030", "xterm": 236},
-    "gray2": {"ansi": 0, "rgb": "0x050505", "xterm": 232},
-    "gray20": {"ansi": 256, "rgb": "0x333333", "xterm": 236},
-    "gray21": {"ansi": 256, "rgb": "0x363636", "xterm": 237},
-    "gray22": {"ansi": 256, "rgb": "0x383838", "xterm": 237},
-    "gray23": {"ansi": 256, "rgb": "0x3b3b3b", "xterm": 237},
-    "gray24": {"ansi": 256, "rgb": "0x3d3d3d", "xterm": 237},
-    "gray25": {"ansi": 256, "rgb": "0x404040", "xterm": 238},
-    "gray26": {"ansi": 256, "rgb": "0x424242", "xterm": 238},
-    "gray27": {"ansi": 256, "rgb": "0x454545", "xterm": 238},
-    "gray28": {"ansi": 256, "rgb": "0x474747", "xterm": 238},
-    "gray29": {"ansi": 256, "rgb": "0x4a4a4a", "xterm": 239},
-    "gray3": {"ansi": 0, "rgb": "0x080808", "xterm": 232},
-    "gray30": {"ansi": 256, "rgb": "0x4d4d4d", "xterm": 239},
-    "gray31": {"ansi": 256, "rgb": "0x4f4f4f", "xterm": 239},
-    "gray32": {"ansi": 256, "rgb": "0x525252", "xterm": 239},
-    "gray33": {"ansi": 256, "rgb": "0x545454", "xterm": 240},
-    "gray34": {"ansi": 256, "rgb": "0x575757", "xterm": 240},
-    "gray35": {"ansi": 256, "rgb": "0x595959", "xterm": 240},
-    "gray36": {"ansi": 2, "rgb": "0x5c5c5c", "xterm": 59},
-    "gray37": {"ansi": 2, "rgb": "0x5e5e5e", "xterm": 59},
-    "gray38": {"ansi": 7, "rgb": "0x616161", "xterm": 241},
-    "gray39": {"ansi": 7, "rgb": "0x636363", "xterm": 241},
-    "gray4": {"ansi": 0, "rgb": "0x0a0a0a", "xterm": 232},
-    "gray40": {"ansi": 7, "rgb": "0x666666", "xterm": 241},
-    "gray41": {"ansi": 7, "rgb": "0x696969", "xterm": 242},
-    "gray42": {"ansi": 7, "rgb": "0x6b6b6b", "xterm": 242},
-    "gray43": {"ansi": 7, "rgb": "0x6e6e6e", "xterm": 242},
-    "gray44": {"ansi": 7, "rgb": "0x707070", "xterm": 242},
-    "gray45": {"ansi": 7, "rgb": "0x737373", "xterm": 243},
-    "gray46": {"ansi": 7, "rgb": "0x757575", "xterm": 243},
-    "gray47": {"ansi": 7, "rgb": "0x787878", "xterm": 243},
-    "gray48": {"ansi": 7, "rgb": "0x7a7a7a", "xterm": 243},
-    "gray49": {"ansi": 256, "rgb": "0x7d7d7d", "xterm": 8},
-    "gray5": {"ansi": 0, "rgb": "0x0d0d0d", "xterm": 232},
-    "gray50": {"ansi": 256, "rgb": "0x7f7f7f", "xterm": 8},
-    "gray51": {"ansi": 256, "rgb": "0x828282", "xterm": 8},
-    "gray52": {"ansi": 2, "rgb": "0x858585", "xterm": 102},
-    "gray53": {"ansi": 2, "rgb": "0x878787", "xterm": 102},
-    "gray54": {"ansi": 7, "rgb": "0x8a8a8a", "xterm": 245},
-    "gray55": {"ansi": 7, "rgb": "0x8c8c8c", "xterm": 245},
-    "gray56": {"ansi": 7, "rgb": "0x8f8f8f", "xterm": 245},
-    "gray57": {"ansi": 7, "rgb": "0x919191", "xterm": 246},
-    "gray58": {"ansi": 7, "rgb": "0x949494", "xterm": 246},
-    "gray59": {"ansi": 7, "rgb": "0x969696", "xterm": 246},
-    "gray6": {"ansi": 0, "rgb": "0x0f0f0f", "xterm": 233},
-    "gray60": {"ansi": 7, "rgb": "0x999999", "xterm": 246},
-    "gray61": {"ansi": 7, "rgb": "0x9c9c9c", "xterm": 247},
-    "gray62": {"ansi": 7, "rgb": "0x9e9e9e", "xterm": 247},
-    "gray63": {"ansi": 7, "rgb": "0xa1a1a1", "xterm": 247},
-    "gray64": {"ansi": 7, "rgb": "0xa3a3a3", "xterm": 247},
-    "gray65": {"ansi": 263, "rgb": "0xa6a6a6", "xterm": 248},
-    "gray66": {"ansi": 263, "rgb": "0xa8a8a8", "xterm": 248},
-    "gray67": {"ansi": 263, "rgb": "0xababab", "xterm": 248},
-    "gray68": {"ansi": 261, "rgb": "0xadadad", "xterm": 145},
-    "gray69": {"ansi": 261, "rgb": "0xb0b0b0", "xterm": 145},
-    "gray7": {"ansi": 0, "rgb": "0x121212", "xterm": 233},
-    "gray70": {"ansi": 263, "rgb": "0xb3b3b3", "xterm": 249},
-    "gray71": {"ansi": 263, "rgb": "0xb5b5b5", "xterm": 249},
-    "gray72": {"ansi": 263, "rgb": "0xb8b8b8", "xterm": 250},
-    "gray73": {"ansi": 263, "rgb": "0xbababa", "xterm": 250},
-    "gray74": {"ansi": 263, "rgb": "0xbdbdbd", "xterm": 250},
-    "gray75": {"ansi": 7, "rgb": "0xbfbfbf", "xterm": 7},
-    "gray76": {"ansi": 7, "rgb": "0xc2c2c2", "xterm": 7},
-    "gray77": {"ansi": 263, "rgb": "0xc4c4c4", "xterm": 251},
-    "gray78": {"ansi": 263, "rgb": "0xc7c7c7", "xterm": 251},
-    "gray79": {"ansi": 263, "rgb": "0xc9c9c9", "xterm": 251},
-    "gray8": {"ansi": 0, "rgb": "0x141414", "xterm": 233},
-    "gray80": {"ansi": 263, "rgb": "0xcccccc", "xterm": 252},
-    "gray81": {"ansi": 263, "rgb": "0xcfcfcf", "xterm": 252},
-    "gray82": {"ansi": 263, "rgb": "0xd1d1d1", "xterm": 252},
-    "gray83": {"ansi": 263, "rgb": "0xd4d4d4", "xterm": 188},
-    "gray84": {"ansi": 263, "rgb": "0xd6d6d6", "xterm": 188},
-    "gray85": {"ansi": 263, "rgb": "0xd9d9d9", "xterm": 253},
-    "gray86": {"ansi": 263, "rgb": "0xdbdbdb", "xterm": 253},
-    "gray87": {"ansi": 263, "rgb": "0xdedede", "xterm": 253},
-    "gray88": {"ansi": 263, "rgb": "0xe0e0e0", "xterm": 254},
-    "gray89": {"ansi": 263, "rgb": "0xe3e3e3", "xterm": 254},
-    "gray9": {"ansi": 0, "rgb": "0x171717", "xterm": 233},
-    "gray90": {"ansi": 263, "rgb": "0xe5e5e5", "xterm": 254},
-    "gray91": {"ansi": 263, "rgb": "0xe8e8e8", "xterm": 254},
-    "gray92": {"ansi": 263, "rgb": "0xebebeb", "xterm": 255},
-    "gray93": {"ansi": 263, "rgb": "0xededed", "xterm": 255},
-    "gray94": {"ansi": 263, "rgb": "0xf0f0f0", "xterm": 255},
-    "gray95": {"ansi": 263, "rgb": "0xf2f2f2", "xterm": 255},
-    "gray96": {"ansi": 263, "rgb": "0xf5f5f5", "xterm": 255},
-    "gray97": {"ansi": 263, "rgb": "0xf7f7f7", "xterm": 15},
-    "gray98": {"ansi": 263, "rgb": "0xfafafa", "xterm": 15},
-    "gray99": {"ansi": 263, "rgb": "0xfcfcfc", "xterm": 15},
-    "green": {"ansi": 258, "rgb": "0x00ff00", "xterm": 46},
-    "green1": {"ansi": 258, "rgb": "0x00ff00", "xterm": 46},
-    "green2": {"ansi": 258, "rgb": "0x00ee00", "xterm": 10},
-    "green3": {"ansi": 258, "rgb": "0x00cd00", "xterm": 40},
-    "green4": {"ansi": 258, "rgb": "0x008b00", "xterm": 28},
-    "greenyellow": {"ansi": 259, "rgb": "0xadff2f", "xterm": 154},
-    "grey": {"ansi": 7, "rgb": "0xbebebe", "xterm": 7},
-    "grey0": {"ansi": 0, "rgb": "0x000000", "xterm": 16},
-    "grey1": {"ansi": 0, "rgb": "0x030303", "xterm": 0},
-    "grey10": {"ansi": 256, "rgb": "0x1a1a1a", "xterm": 234},
-    "grey100": {"ansi": 263, "rgb": "0xffffff", "xterm": 231},
-    "grey11": {"ansi": 256, "rgb": "0x1c1c1c", "xterm": 234},
-    "grey12": {"ansi": 256, "rgb": "0x1f1f1f", "xterm": 234},
-    "grey13": {"ansi": 256, "rgb": "0x212121", "xterm": 234},
-    "grey14": {"ansi": 256, "rgb": "0x242424", "xterm": 235},
-    "grey15": {"ansi": 256, "rgb": "0x262626", "xterm": 235},
-    "grey16": {"ansi": 256, "rgb": "0x292929", "xterm": 235},
-    "grey17": {"ansi": 256, "rgb": "0x2b2b2b", "xterm": 235},
-    "grey18": {"ansi": 256, "rgb": "0x2e2e2e", "xterm": 236},
-    "grey19": {"ansi": 256, "rgb": "0x303030", "xterm": 236},
-    "grey2": {"ansi": 0, "rgb": "0x050505", "xterm": 232},
-    "grey20": {"ansi": 256, "rgb": "0x333333", "xterm": 236},
-    "grey21": {"ansi": 256, "rgb": "0x363636", "xterm": 237},
-    "grey22": {"ansi": 256, "rgb": "0x383838", "xterm": 237},
-    "grey23": {"ansi": 256, "rgb": "0x3b3b3b", "xterm": 237},
-    "grey24": {"ansi": 256, "rgb": "0x3d3d3d", "xterm": 237},
-    "grey25": {"ansi": 256, "rgb": "0x404040", "xterm": 238},
-    "grey26": {"ansi": 256, "rgb": "0x424242", "xterm": 238},
-    "grey27": {"ansi": 256, "rgb": "0x454545", "xterm": 238},
-    "grey28": {"ansi": 256, "rgb": "0x474747", "xterm": 238},
-    "grey29": {"ansi": 256, "rgb": "0x4a4a4a", "xterm": 239},
-    "grey3": {"ansi": 0, "rgb": "0x080808", "xterm": 232},
-    "grey30": {"ansi": 256, "rgb": "0x4d4d4d", "xterm": 239},
-    "grey31": {"ansi": 256, "rgb": "0x4f4f4f", "xterm": 239},
-    "grey32": {"ansi": 256, "rgb": "0x525252", "xterm": 239},
-    "grey33": {"ansi": 256, "rgb": "0x545454", "xterm": 240},
-    "grey34": {"ansi": 256, "rgb": "0x575757", "xterm": 240},
-    "grey35": {"ansi": 256, "rgb": "0x595959", "xterm": 240},
-    "grey36": {"ansi": 2, "rgb": "0x5c5c5c", "xterm": 59},
-    "grey37": {"ansi": 2, "rgb": "0x5e5e5e", "xterm": 59},
-    "grey38": {"ansi": 7, "rgb": "0x616161", "xterm": 241},
-    "grey39": {"ansi": 7, "rgb": "0x636363", "xterm": 241},
-    "grey4": {"ansi": 0, "rgb": "0x0a0a0a", "xterm": 232},
-    "grey40": {"ansi": 7, "rgb": "0x666666", "xterm": 241},
-    "grey41": {"ansi": 7, "rgb": "0x696969", "xterm": 242},
-    "grey42": {"ansi": 7, "rgb": "0x6b6b6b", "xterm": 242},
-    "grey43": {"ansi": 7, "rgb": "0x6e6e6e", "xterm": 242},
-    "grey44": {"ansi": 7, "rgb": "0x707070", "xterm": 242},
-    "grey45": {"ansi": 7, "rgb": "0x737373", "xterm": 243},
-    "grey46": {"ansi": 7, "rgb": "0x757575", "xterm": 243},
-    "grey47": {"ansi": 7, "rgb": "0x787878", "xterm": 243},
-    "grey48": {"ansi": 7, "rgb": "0x7a7a7a", "xterm": 243},
-    "grey49": {"ansi": 256, "rgb": "0x7d7d7d", "xterm": 8},
-    "grey5": {"ansi": 0, "rgb": "0x0d0d0d", "xterm": 232},
-    "grey50": {"ansi": 256, "rgb": "0x7f7f7f", "xterm": 8},
-    "grey51": {"ansi": 256, "rgb": "0x828282", "xterm": 8},
-    "grey52": {"ansi": 2, "rgb": "0x858585", "xterm": 102},
-    "grey53": {"ansi": 2, "rgb": "0x878787", "xterm": 102},
-    "grey54": {"ansi": 7, "rgb": "0x8a8a8a", "xterm": 245},
-    "grey55": {"ansi": 7, "rgb": "0x8c8c8c", "xterm": 245},
-    "grey56": {"ansi": 7, "rgb": "0x8f8f8f", "xterm": 245},
-    "grey57": {"ansi": 7, "rgb": "0x919191", "xterm": 246},
-    "grey58": {"ansi": 7, "rgb": "0x949494", "xterm": 246},
-    "grey59": {"ansi": 7, "rgb": "0x969696", "xterm": 246},
-    "grey6": {"ansi": 0, "rgb": "0x0f0f0f", "xterm": 233},
-    "grey60": {"ansi": 7, "rgb": "0x999999", "xterm": 246},
-    "grey61": {"ansi": 7, "rgb": "0x9c9c9c", "xterm": 247},
-    "grey62": {"ansi": 7, "rgb": "0x9e9e9e", "xterm": 247},
-    "grey63": {"ansi": 7, "rgb": "0xa1a1a1", "xterm": 247},
-    "grey64": {"ansi": 7, "rgb": "0xa3a3a3", "xterm": 247},
-    "grey65": {"ansi": 263, "rgb": "0xa6a6a6", "xterm": 248},
-    "grey66": {"ansi": 263, "rgb": "0xa8a8a8", "xterm": 248},
-    "grey67": {"ansi": 263, "rgb": "0xababab", "xterm": 248},
-    "grey68": {"ansi": 261, "rgb": "0xadadad", "xterm": 145},
-    "grey69": {"ansi": 261, "rgb": "0xb0b0b0", "xterm": 145},
-    "grey7": {"ansi": 0, "rgb": "0x121212", "xterm": 233},
-    "grey70": {"ansi": 263, "rgb": "0xb3b3b3", "xterm": 249},
-    "grey71": {"ansi": 263, "rgb": "0xb5b5b5", "xterm": 249},
-    "grey72": {"ansi": 263, "rgb": "0xb8b8b8", "xterm": 250},
-    "grey73": {"ansi": 263, "rgb": "0xbababa", "xterm": 250},
-    "grey74": {"ansi": 263, "rgb": "0xbdbdbd", "xterm": 250},
-    "grey75": {"ansi": 7, "rgb": "0xbfbfbf", "xterm": 7},
-    "grey76": {"ansi": 7, "rgb": "0xc2c2c2", "xterm": 7},
-    "grey77": {"ansi": 263, "rgb": "0xc4c4c4", "xterm": 251},
-    "grey78": {"ansi": 263, "rgb": "0xc7c7c7", "xterm": 251},
-    "grey79": {"ansi": 263, "rgb": "0xc9c9c9", "xterm": 251},
-    "grey8": {"ansi": 0, "rgb": "0x141414", "xterm": 233},
-    "grey80": {"ansi": 263, "rgb": "0xcccccc", "xterm": 252},
-    "grey81": {"ansi": 263, "rgb": "0xcfcfcf", "xterm": 252},
-    "grey82": {"ansi": 263, "rgb": "0xd1d1d1", "xterm": 252},
-    "grey83": {"ansi": 263, "rgb": "0xd4d4d4", "xterm": 188},
-    "grey84": {"ansi": 263, "rgb": "0xd6d6d6", "xterm": 188},
-    "grey85": {"ansi": 263, "rgb": "0xd9d9d9", "xterm": 253},
-    "grey86": {"ansi": 263, "rgb": "0xdbdbdb", "xterm": 253},
-    "grey87": {"ansi": 263, "rgb": "0xdedede", "xterm": 253},
-    "grey88": {"ansi": 263, "rgb": "0xe0e0e0", "xterm": 254},
-    "grey89": {"ansi": 263, "rgb": "0xe3e3e3", "xterm": 254},
-    "grey9": {"ansi": 0, "rgb": "0x171717", "xterm": 233},
-    "grey90": {"ansi": 263, "rgb": "0xe5e5e5", "xterm": 254},
-    "grey91": {"ansi": 263, "rgb": "0xe8e8e8", "xterm": 254},
-    "grey92": {"ansi": 263, "rgb": "0xebebeb", "xterm": 255},
-    "grey93": {"ansi": 263, "rgb": "0xededed", "xterm": 255},
-    "grey94": {"ansi": 263, "rgb": "0xf0f0f0", "xterm": 255},
-    "grey95": {"ansi": 263, "rgb": "0xf2f2f2", "xterm": 255},
-    "grey96": {"ansi": 263, "rgb": "0xf5f5f5", "xterm": 255},
-    "grey97": {"ansi": 263, "rgb": "0xf7f7f7", "xterm": 15},
-    "grey98": {"ansi": 263, "rgb": "0xfafafa", "xterm": 15},
-    "grey99": {"ansi": 263, "rgb": "0xfcfcfc", "xterm": 15},
-    "honeydew": {"ansi": 263, "rgb": "0xf0fff0", "xterm": 255},
-    "honeydew1": {"ansi": 263, "rgb": "0xf0fff0", "xterm": 255},
-    "honeydew2": {"ansi": 263, "rgb": "0xe0eee0", "xterm": 254},
-    "honeydew3": {"ansi": 263, "rgb": "0xc1cdc1", "xterm": 251},
-    "honeydew4": {"ansi": 2, "rgb": "0x838b83", "xterm": 102},
-    "hotpink": {"ansi": 261, "rgb": "0xff69b4", "xterm": 205},
-    "hotpink1": {"ansi": 261, "rgb": "0xff6eb4", "xterm": 205},
-    "hotpink2": {"ansi": 261, "rgb": "0xee6aa7", "xterm": 205},
-    "hotpink3": {"ansi": 257, "rgb": "0xcd6090", "xterm": 168},
-    "hotpink4": {"ansi": 1, "rgb": "0x8b3a62", "xterm": 95},
-    "indianred": {"ansi": 257, "rgb": "0xcd5c5c", "xterm": 167},
-    "indianred1": {"ansi": 257, "rgb": "0xff6a6a", "xterm": 203},
-    "indianred2": {"ansi": 257, "rgb": "0xee6363", "xterm": 203},
-    "indianred3": {"ansi": 257, "rgb": "0xcd5555", "xterm": 167},
-    "indianred4": {"ansi": 1, "rgb": "0x8b3a3a", "xterm": 95},
-    "ivory": {"ansi": 263, "rgb": "0xfffff0", "xterm": 15},
-    "ivory1": {"ansi": 263, "rgb": "0xfffff0", "xterm": 15},
-    "ivory2": {"ansi": 263, "rgb": "0xeeeee0", "xterm": 255},
-    "ivory3": {"ansi": 263, "rgb": "0xcdcdc1", "xterm": 251},
-    "ivory4": {"ansi": 2, "rgb": "0x8b8b83", "xterm": 102},
-    "khaki": {"ansi": 259, "rgb": "0xf0e68c", "xterm": 222},
-    "khaki1": {"ansi": 259, "rgb": "0xfff68f", "xterm": 228},
-    "khaki2": {"ansi": 259, "rgb": "0xeee685", "xterm": 222},
-    "khaki3": {"ansi": 3, "rgb": "0xcdc673", "xterm": 185},
-    "khaki4": {"ansi": 2, "rgb": "0x8b864e", "xterm": 101},
-    "lavender": {"ansi": 263, "rgb": "0xe6e6fa", "xterm": 255},
-    "lavenderblush": {"ansi": 263, "rgb": "0xfff0f5", "xterm": 15},
-    "lavenderblush1": {"ansi": 263, "rgb": "0xfff0f5", "xterm": 15},
-    "lavenderblush2": {"ansi": 263, "rgb": "0xeee0e5", "xterm": 254},
-    "lavenderblush3": {"ansi": 263, "rgb": "0xcdc1c5", "xterm": 251},
-    "lavenderblush4": {"ansi": 2, "rgb": "0x8b8386", "xterm": 102},
-    "lawngreen": {"ansi": 258, "rgb": "0x7cfc00", "xterm": 118},
-    "lemonchiffon": {"ansi": 263, "rgb": "0xfffacd", "xterm": 230},
-    "lemonchiffon1": {"ansi": 263, "rgb": "0xfffacd", "xterm": 230},
-    "lemonchiffon2": {"ansi": 263, "rgb": "0xeee9bf", "xterm": 223},
-    "lemonchiffon3": {"ansi": 263, "rgb": "0xcdc9a5", "xterm": 187},
-    "lemonchiffon4": {"ansi": 2, "rgb": "0x8b8970", "xterm": 101},
-    "lightblue": {"ansi": 263, "rgb": "0xadd8e6", "xterm": 152},
-    "lightblue1": {"ansi": 263, "rgb": "0xbfefff", "xterm": 159},
-    "lightblue2": {"ansi": 263, "rgb": "0xb2dfee", "xterm": 153},
-    "lightblue3": {"ansi": 262, "rgb": "0x9ac0cd", "xterm": 110},
-    "lightblue4": {"ansi": 2, "rgb": "0x68838b", "xterm": 66},
-    "lightcoral": {"ansi": 261, "rgb": "0xf08080", "xterm": 210},
-    "lightcyan": {"ansi": 263, "rgb": "0xe0ffff", "xterm": 195},
-    "lightcyan1": {"ansi": 263, "rgb": "0xe0ffff", "xterm": 195},
-    "lightcyan2": {"ansi": 263, "rgb": "0xd1eeee", "xterm": 254},
-    "lightcyan3": {"ansi": 263, "rgb": "0xb4cdcd", "xterm": 152},
-    "lightcyan4": {"ansi": 2, "rgb": "0x7a8b8b", "xterm": 102},
-    "lightgoldenrod": {"ansi": 259, "rgb": "0xeedd82", "xterm": 222},
-    "lightgoldenrod1": {"ansi": 259, "rgb": "0xffec8b", "xterm": 228},
-    "lightgoldenrod2": {"ansi": 259, "rgb": "0xeedc82", "xterm": 222},
-    "lightgoldenrod3": {"ansi": 3, "rgb": "0xcdbe70", "xterm": 179},
-    "lightgoldenrod4": {"ansi": 2, "rgb": "0x8b814c", "xterm": 101},
-    "lightgoldenrodyellow": {"ansi": 263, "rgb": "0xfafad2", "xterm": 230},
-    "lightgray": {"ansi": 263, "rgb": "0xd3d3d3", "xterm": 252},
-    "lightgreen": {"ansi": 258, "rgb": "0x90ee90", "xterm": 120},
-    "lightgrey": {"ansi": 263, "rgb": "0xd3d3d3", "xterm": 252},
-    "lightpink": {"ansi": 263, "rgb": "0xffb6c1", "xterm": 217},
-    "lightpink1": {"ansi": 263, "rgb": "0xffaeb9", "xterm": 217},
-    "lightpink2": {"ansi": 263, "rgb": "0xeea2ad", "xterm": 217},
-    "lightpink3": {"ansi": 3, "rgb": "0xcd8c95", "xterm": 174},
-    "lightpink4": {"ansi": 1, "rgb": "0x8b5f65", "xterm": 95},
-    "lightsalmon": {"ansi": 263, "rgb": "0xffa07a", "xterm": 216},
-    "lightsalmon1": {"ansi": 263, "rgb": "0xffa07a", "xterm": 216},
-    "lightsalmon2": {"ansi": 257, "rgb": "0xee9572", "xterm": 209},
-    "lightsalmon3": {"ansi": 3, "rgb": "0xcd8162", "xterm": 173},
-    "lightsalmon4": {"ansi": 1, "rgb": "0x8b5742", "xterm": 95},
-    "lightseagreen": {"ansi": 262, "rgb": "0x20b2aa", "xterm": 37},
-    "lightskyblue": {"ansi": 262, "rgb": "0x87cefa", "xterm": 117},
-    "lightskyblue1": {"ansi": 263, "rgb": "0xb0e2ff", "xterm": 153},
-    "lightskyblue2": {"ansi": 263, "rgb": "0xa4d3ee", "xterm": 153},
-    "lightskyblue3": {"ansi": 262, "rgb": "0x8db6cd", "xterm": 110},
-    "lightskyblue4": {"ansi": 2, "rgb": "0x607b8b", "xterm": 66},
-    "lightslateblue": {"ansi": 261, "rgb": "0x8470ff", "xterm": 99},
-    "lightslategray": {"ansi": 2, "rgb": "0x778899", "xterm": 102},
-    "lightslategrey": {"ansi": 2, "rgb": "0x778899", "xterm": 102},
-    "lightsteelblue": {"ansi": 263, "rgb": "0xb0c4de", "xterm": 152},
-    "lightsteelblue1": {"ansi": 263, "rgb": "0xcae1ff", "xterm": 189},
-    "lightsteelblue2": {"ansi": 263, "rgb": "0xbcd2ee", "xterm": 153},
-    "lightsteelblue3": {"ansi": 261, "rgb": "0xa2b5cd", "xterm": 146},
-    "lightsteelblue4": {"ansi": 2, "rgb": "0x6e7b8b", "xterm": 66},
-    "lightyellow": {"ansi": 263, "rgb": "0xffffe0", "xterm": 230},
-    "lightyellow1": {"ansi": 263, "rgb": "0xffffe0", "xterm": 230},
-    "lightyellow2": {"ansi": 263, "rgb": "0xeeeed1", "xterm": 254},
-    "lightyellow3": {"ansi": 263, "rgb": "0xcdcdb4", "xterm": 187},
-    "lightyellow4": {"ansi": 2, "rgb": "0x8b8b7a", "xterm": 102},
-    "lime": {"ansi": 258, "rgb": "0x00ff00", "xterm": 10},
-    "limegreen": {"ansi": 258, "rgb": "0x32cd32", "xterm": 77},
-    "linen": {"ansi": 263, "rgb": "0xfaf0e6", "xterm": 255},
-    "magenta": {"ansi": 261, "rgb": "0xff00ff", "xterm": 201},
-    "magenta1": {"ansi": 261, "rgb": "0xff00ff", "xterm": 201},
-    "magenta2": {"ansi": 261, "rgb": "0xee00ee", "xterm": 13},
-    "magenta3": {"ansi": 261, "rgb": "0xcd00cd", "xterm": 164},
-    "magenta4": {"ansi": 5, "rgb": "0x8b008b", "xterm": 90},
-    "maroon": {"ansi": 257, "rgb": "0xb03060", "xterm": 131},
-    "maroon1": {"ansi": 261, "rgb": "0xff34b3", "xterm": 205},
-    "maroon2": {"ansi": 261, "rgb": "0xee30a7", "xterm": 205},
-    "maroon3": {"ansi": 261, "rgb": "0xcd2990", "xterm": 162},
-    "maroon4": {"ansi": 1, "rgb": "0x8b1c62", "xterm": 89},
-    "mediumaquamarine": {"ansi": 262, "rgb": "0x66cdaa", "xterm": 79},
-    "mediumblue": {"ansi": 260, "rgb": "0x0000cd", "xterm": 20},
-    "mediumorchid": {"ansi": 261, "rgb": "0xba55d3", "xterm": 134},
-    "mediumorchid1": {"ansi": 261, "rgb": "0xe066ff", "xterm": 171},
-    "mediumorchid2": {"ansi": 261, "rgb": "0xd15fee", "xterm": 171},
-    "mediumorchid3": {"ansi": 261, "rgb": "0xb452cd", "xterm": 134},
-    "mediumorchid4": {"ansi": 5, "rgb": "0x7a378b", "xterm": 96},
-    "mediumpurple": {"ansi": 261, "rgb": "0x9370db", "xterm": 98},
-    "mediumpurple1": {"ansi": 261, "rgb": "0xab82ff", "xterm": 141},
-    "mediumpurple2": {"ansi": 261, "rgb": "0x9f79ee", "xterm": 141},
-    "mediumpurple3": {"ansi": 261, "rgb": "0x8968cd", "xterm": 98},
-    "mediumpurple4": {"ansi": 6, "rgb": "0x5d478b", "xterm": 60},
-    "mediumseagreen": {"ansi": 2, "rgb": "0x3cb371", "xterm": 71},
-    "mediumslateblue": {"ansi": 261, "rgb": "0x7b68ee", "xterm": 99},
-    "mediumspringgreen": {"ansi": 258, "rgb": "0x00fa9a", "xterm": 48},
-    "mediumturquoise": {"ansi": 262, "rgb": "0x48d1cc", "xterm": 80},
-    "mediumvioletred": {"ansi": 261, "rgb": "0xc71585", "xterm": 162},
-    "midnightblue": {"ansi": 4, "rgb": "0x191970", "xterm": 4},
-    "mintcream": {"ansi": 263, "rgb": "0xf5fffa", "xterm": 15},
-    "mistyrose": {"ansi": 263, "rgb": "0xffe4e1", "xterm": 224},
-    "mistyrose1": {"ansi": 263, "rgb": "0xffe4e1", "xterm": 224},
-    "mistyrose2": {"ansi": 263, "rgb": "0xeed5d2", "xterm": 224},
-    "mistyrose3": {"ansi": 261, "rgb": "0xcdb7b5", "xterm": 181},
-    "mistyrose4": {"ansi": 256, "rgb": "0x8b7d7b", "xterm": 8},
-    "moccasin": {"ansi": 263, "rgb": "0xffe4b5", "xterm": 223},
-    "navajowhite": {"ansi": 263, "rgb": "0xffdead", "xterm": 223},
-    "navajowhite1": {"ansi": 263, "rgb": "0xffdead", "xterm": 223},
-    "navajowhite2": {"ansi": 263, "rgb": "0xeecfa1", "xterm": 223},
-    "navajowhite3": {"ansi": 259, "rgb": "0xcdb38b", "xterm": 180},
-    "navajowhite4": {"ansi": 2, "rgb": "0x8b795e", "xterm": 101},
-    "navy": {"ansi": 4, "rgb": "0x000080", "xterm": 4},
-    "navyblue": {"ansi": 4, "rgb": "0x000080", "xterm": 4},
-    "oldlace": {"ansi": 263, "rgb": "0xfdf5e6", "xterm": 230},
-    "olive": {"ansi": 3, "rgb": "0x808000", "xterm": 3},
-    "olivedrab": {"ansi": 2, "rgb": "0x6b8e23", "xterm": 64},
-    "olivedrab1": {"ansi": 259, "rgb": "0xc0ff3e", "xterm": 155},
-    "olivedrab2": {"ansi": 259, "rgb": "0xb3ee3a", "xterm": 155},
-    "olivedrab3": {"ansi": 258, "rgb": "0x9acd32", "xterm": 113},
-    "olivedrab4": {"ansi": 2, "rgb": "0x698b22", "xterm": 64},
-    "orange": {"ansi": 259, "rgb": "0xffa500", "xterm": 214},
-    "orange1": {"ansi": 259, "rgb": "0xffa500", "xterm": 214},
-    "orange2": {"ansi": 257, "rgb": "0xee9a00", "xterm": 208},
-    "orange3": {"ansi": 3, "rgb": "0xcd8500", "xterm": 172},
-    "orange4": {"ansi": 2, "rgb": "0x8b5a00", "xterm": 94},
-    "orangered": {"ansi": 257, "rgb": "0xff4500", "xterm": 202},
-    "orangered1": {"ansi": 257, "rgb": "0xff4500", "xterm": 202},
-    "orangered2": {"ansi": 257, "rgb": "0xee4000", "xterm": 202},
-    "orangered3": {"ansi": 257, "rgb": "0xcd3700", "xterm": 166},
-    "orangered4": {"ansi": 1, "rgb": "0x8b2500", "xterm": 88},
-    "orchid": {"ansi": 261, "rgb": "0xda70d6", "xterm": 170},
-    "orchid1": {"ansi": 261, "rgb": "0xff83fa", "xterm": 213},
-    "orchid2": {"ansi": 261, "rgb": "0xee7ae9", "xterm": 212},
-    "orchid3": {"ansi": 261, "rgb": "0xcd69c9", "xterm": 170},
-    "orchid4": {"ansi": 5, "rgb": "0x8b4789", "xterm": 96},
-    "palegoldenrod": {"ansi": 263, "rgb": "0xeee8aa", "xterm": 223},
-    "palegreen": {"ansi": 258, "rgb": "0x98fb98", "xterm": 120},
-    "palegreen1": {"ansi": 258, "rgb": "0x9aff9a", "xterm": 120},
-    "palegreen2": {"ansi": 258, "rgb": "0x90ee90", "xterm": 120},
-    "palegreen3": {"ansi": 258, "rgb": "0x7ccd7c", "xterm": 114},
-    "palegreen4": {"ansi": 2, "rgb": "0x548b54", "xterm": 65},
-    "paleturquoise": {"ansi": 263, "rgb": "0xafeeee", "xterm": 159},
-    "paleturquoise1": {"ansi": 263, "rgb": "0xbbffff", "xterm": 159},
-    "paleturquoise2": {"ansi": 263, "rgb": "0xaeeeee", "xterm": 159},
-    "paleturquoise3": {"ansi": 262, "rgb": "0x96cdcd", "xterm": 116},
-    "paleturquoise4": {"ansi": 2, "rgb": "0x668b8b", "xterm": 66},
-    "palevioletred": {"ansi": 257, "rgb": "0xdb7093", "xterm": 168},
-    "palevioletred1": {"ansi": 261, "rgb": "0xff82ab", "xterm": 211},
-    "palevioletred2": {"ansi": 261, "rgb": "0xee799f", "xterm": 211},
-    "palevioletred3": {"ansi": 257, "rgb": "0xcd6889", "xterm": 168},
-    "palevioletred4": {"ansi": 1, "rgb": "0x8b475d", "xterm": 95},
-    "papayawhip": {"ansi": 263, "rgb": "0xffefd5", "xterm": 230},
-    "peachpuff": {"ansi": 263, "rgb": "0xffdab9", "xterm": 223},
-    "peachpuff1": {"ansi": 263, "rgb": "0xffdab9", "xterm": 223},
-    "peachpuff2": {"ansi": 263, "rgb": "0xeecbad", "xterm": 223},
-    "peachpuff3": {"ansi": 259, "rgb": "0xcdaf95", "xterm": 180},
-    "peachpuff4": {"ansi": 2, "rgb": "0x8b7765", "xterm": 101},
-    "peru": {"ansi": 3, "rgb": "0xcd853f", "xterm": 173},
-    "pink": {"ansi": 263, "rgb": "0xffc0cb", "xterm": 218},
-    "pink1": {"ansi": 263, "rgb": "0xffb5c5", "xterm": 218},
-    "pink2": {"ansi": 263, "rgb": "0xeea9b8", "xterm": 217},
-    "pink3": {"ansi": 261, "rgb": "0xcd919e", "xterm": 175},
-    "pink4": {"ansi": 1, "rgb": "0x8b636c", "xterm": 95},
-    "plum": {"ansi": 261, "rgb": "0xdda0dd", "xterm": 182},
-    "plum1": {"ansi": 263, "rgb": "0xffbbff", "xterm": 219},
-    "plum2": {"ansi": 263, "rgb": "0xeeaeee", "xterm": 219},
-    "plum3": {"ansi": 261, "rgb": "0xcd96cd", "xterm": 176},
-    "plum4": {"ansi": 5, "rgb": "0x8b668b", "xterm": 96},
-    "powderblue": {"ansi": 263, "rgb": "0xb0e0e6", "xterm": 152},
-    "purple": {"ansi": 261, "rgb": "0xa020f0", "xterm": 129},
-    "purple1": {"ansi": 261, "rgb": "0x9b30ff", "xterm": 99},
-    "purple2": {"ansi": 261, "rgb": "0x912cee", "xterm": 93},
-    "purple3": {"ansi": 261, "rgb": "0x7d26cd", "xterm": 92},
-    "purple4": {"ansi": 5, "rgb": "0x551a8b", "xterm": 54},
-    "red": {"ansi": 257, "rgb": "0xff0000", "xterm": 196},
-    "red1": {"ansi": 257, "rgb": "0xff0000", "xterm": 196},
-    "red2": {"ansi": 257, "rgb": "0xee0000", "xterm": 9},
-    "red3": {"ansi": 1, "rgb": "0xcd0000", "xterm": 160},
-    "red4": {"ansi": 1, "rgb": "0x8b0000", "xterm": 88},
-    "rosybrown": {"ansi": 261, "rgb": "0xbc8f8f", "xterm": 138},
-    "rosybrown1": {"ansi": 263, "rgb": "0xffc1c1", "xterm": 217},
-    "rosybrown2": {"ansi": 263, "rgb": "0xeeb4b4", "xterm": 217},
-    "rosybrown3": {"ansi": 3, "rgb": "0xcd9b9b", "xterm": 174},
-    "rosybrown4": {"ansi": 1, "rgb": "0x8b6969", "xterm": 95},
-    "royalblue": {"ansi": 260, "rgb": "0x4169e1", "xterm": 62},
-    "royalblue1": {"ansi": 260, "rgb": "0x4876ff", "xterm": 69},
-    "royalblue2": {"ansi": 260, "rgb": "0x436eee", "xterm": 63},
-    "royalblue3": {"ansi": 260, "rgb": "0x3a5fcd", "xterm": 62},
-    "royalblue4": {"ansi": 4, "rgb": "0x27408b", "xterm": 24},
-    "saddlebrown": {"ansi": 2, "rgb": "0x8b4513", "xterm": 94},
-    "salmon": {"ansi": 257, "rgb": "0xfa8072", "xterm": 209},
-    "salmon1": {"ansi": 257, "rgb": "0xff8c69", "xterm": 209},
-    "salmon2": {"ansi": 257, "rgb": "0xee8262", "xterm": 209},
-    "salmon3": {"ansi": 257, "rgb": "0xcd7054", "xterm": 167},
-    "salmon4": {"ansi": 1, "rgb": "0x8b4c39", "xterm": 95},
-    "sandybrown": {"ansi": 259, "rgb": "0xf4a460", "xterm": 215},
-    "seagreen": {"ansi": 2, "rgb": "0x2e8b57", "xterm": 29},
-    "seagreen1": {"ansi": 258, "rgb": "0x54ff9f", "xterm": 85},
-    "seagreen2": {"ansi": 258, "rgb": "0x4eee94", "xterm": 84},
-    "seagreen3": {"ansi": 258, "rgb": "0x43cd80", "xterm": 78},
-    "seagreen4": {"ansi": 2, "rgb": "0x2e8b57", "xterm": 29},
-    "seashell": {"ansi": 263, "rgb": "0xfff5ee", "xterm": 255},
-    "seashell1": {"ansi": 263, "rgb": "0xfff5ee", "xterm": 255},
-    "seashell2": {"ansi": 263, "rgb": "0xeee5de", "xterm": 254},
-    "seashell3": {"ansi": 263, "rgb": "0xcdc5bf", "xterm": 251},
-    "seashell4": {"ansi": 2, "rgb": "0x8b8682", "xterm": 102},
-    "sienna": {"ansi": 257, "rgb": "0xa0522d", "xterm": 130},
-    "sienna1": {"ansi": 257, "rgb": "0xff8247", "xterm": 209},
-    "sienna2": {"ansi": 257, "rgb": "0xee7942", "xterm": 209},
-    "sienna3": {"ansi": 257, "rgb": "0xcd6839", "xterm": 167},
-    "sienna4": {"ansi": 2, "rgb": "0x8b4726", "xterm": 94},
-    "silver": {"ansi": 7, "rgb": "0xc0c0c0", "xterm": 7},
-    "skyblue": {"ansi": 262, "rgb": "0x87ceeb", "xterm": 116},
-    "skyblue1": {"ansi": 262, "rgb": "0x87ceff", "xterm": 117},
-    "skyblue2": {"ansi": 262, "rgb": "0x7ec0ee", "xterm": 111},
-    "skyblue3": {"ansi": 262, "rgb": "0x6ca6cd", "xterm": 74},
-    "skyblue4": {"ansi": 6, "rgb": "0x4a708b", "xterm": 60},
-    "slateblue": {"ansi": 260, "rgb": "0x6a5acd", "xterm": 62},
-    "slateblue1": {"ansi": 261, "rgb": "0x836fff", "xterm": 99},
-    "slateblue2": {"ansi": 261, "rgb": "0x7a67ee", "xterm": 99},
-    "slateblue3": {"ansi": 260, "rgb": "0x6959cd", "xterm": 62},
-    "slateblue4": {"ansi": 6, "rgb": "0x473c8b", "xterm": 60},
-    "slategray": {"ansi": 2, "rgb": "0x708090", "xterm": 66},
-    "slategray1": {"ansi": 263, "rgb": "0xc6e2ff", "xterm": 189},
-    "slategray2": {"ansi": 263, "rgb": "0xb9d3ee", "xterm": 153},
-    "slategray3": {"ansi": 261, "rgb": "0x9fb6cd", "xterm": 146},
-    "slategray4": {"ansi": 2, "rgb": "0x6c7b8b", "xterm": 66},
-    "slategrey": {"ansi": 2, "rgb": "0x708090", "xterm": 66},
-    "slategrey1": {"ansi": 263, "rgb": "0xc6e2ff", "xterm": 189},
-    "slategrey2": {"ansi": 263, "rgb": "0xb9d3ee", "xterm": 153},
-    "slategrey3": {"ansi": 261, "rgb": "0x9fb6cd", "xterm": 146},
-    "slategrey4": {"ansi": 2, "rgb": "0x6c7b8b", "xterm": 66},
-    "snow": {"ansi": 263, "rgb": "0xfffafa", "xterm": 15},
-    "snow1": {"ansi": 263, "rgb": "0xfffafa", "xterm": 15},
-    "snow2": {"ansi": 263, "rgb": "0xeee9e9", "xterm": 255},
-    "snow3": {"ansi": 263, "rgb": "0xcdc9c9", "xterm": 251},
-    "snow4": {"ansi": 7, "rgb": "0x8b8989", "xterm": 245},
-    "springgreen": {"ansi": 258, "rgb": "0x00ff7f", "xterm": 48},
-    "springgreen1": {"ansi": 258, "rgb": "0x00ff7f", "xterm": 48},
-    "springgreen2": {"ansi": 258, "rgb": "0x00ee76", "xterm": 48},
-    "springgreen3": {"ansi": 258, "rgb": "0x00cd66", "xterm": 41},
-    "springgreen4": {"ansi": 2, "rgb": "0x008b45", "xterm": 29},
-    "steelblue": {"ansi": 6, "rgb": "0x4682b4", "xterm": 67},
-    "steelblue1": {"ansi": 262, "rgb": "0x63b8ff", "xterm": 75},
-    "steelblue2": {"ansi": 262, "rgb": "0x5cacee", "xterm": 75},
-    "steelblue3": {"ansi": 6, "rgb": "0x4f94cd", "xterm": 68},
-    "steelblue4": {"ansi": 6, "rgb": "0x36648b", "xterm": 60},
-    "tan": {"ansi": 259, "rgb": "0xd2b48c", "xterm": 180},
-    "tan1": {"ansi": 259, "rgb": "0xffa54f", "xterm": 215},
-    "tan2": {"ansi": 257, "rgb": "0xee9a49", "xterm": 209},
-    "tan3": {"ansi": 3, "rgb": "0xcd853f", "xterm": 173},
-    "tan4": {"ansi": 2, "rgb": "0x8b5a2b", "xterm": 94},
-    "teal": {"ansi": 6, "rgb": "0x008080", "xterm": 6},
-    "thistle": {"ansi": 261, "rgb": "0xd8bfd8", "xterm": 182},
-    "thistle1": {"ansi": 263, "rgb": "0xffe1ff", "xterm": 225},
-    "thistle2": {"ansi": 263, "rgb": "0xeed2ee", "xterm": 254},
-    "thistle3": {"ansi": 261, "rgb": "0xcdb5cd", "xterm": 182},
-    "thistle4": {"ansi": 2, "rgb": "0x8b7b8b", "xterm": 102},
-    "tomato": {"ansi": 257, "rgb": "0xff6347", "xterm": 203},
-    "tomato1": {"ansi": 257, "rgb": "0xff6347", "xterm": 203},
-    "tomato2": {"ansi": 257, "rgb": "0xee5c42", "xterm": 203},
-    "tomato3": {"ansi": 257, "rgb": "0xcd4f39", "xterm": 167},
-    "tomato4": {"ansi": 2, "rgb": "0x8b3626", "xterm": 94},
-    "turquoise": {"ansi": 262, "rgb": "0x40e0d0", "xterm": 80},
-    "turquoise1": {"ansi": 262, "rgb": "0x00f5ff", "xterm": 14},
-    "turquoise2": {"ansi": 262, "rgb": "0x00e5ee", "xterm": 45},
-    "turquoise3": {"ansi": 262, "rgb": "0x00c5cd", "xterm": 44},
-    "turquoise4": {"ansi": 6, "rgb": "0x00868b", "xterm": 30},
-    "violet": {"ansi": 261, "rgb": "0xee82ee", "xterm": 213},
-    "violetred": {"ansi": 261, "rgb": "0xd02090", "xterm": 162},
-    "violetred1": {"ansi": 257, "rgb": "0xff3e96", "xterm": 204},
-    "violetred2": {"ansi": 257, "rgb": "0xee3a8c", "xterm": 204},
-    "violetred3": {"ansi": 257, "rgb": "0xcd3278", "xterm": 168},
-    "violetred4": {"ansi": 1, "rgb": "0x8b2252", "xterm": 89},
-    "wheat": {"ansi": 263, "rgb": "0xf5deb3", "xterm": 223},
-    "wheat1": {"ansi": 263, "rgb": "0xffe7ba", "xterm": 223},
-    "wheat2": {"ansi": 263, "rgb": "0xeed8ae", "xterm": 223},
-    "wheat3": {"ansi": 259, "rgb": "0xcdba96", "xterm": 180},
-    "wheat4": {"ansi": 2, "rgb": "0x8b7e66", "xterm": 101},
-    "white": {"ansi": 263, "rgb": "0xffffff", "xterm": 231},
-    "whitesmoke": {"ansi": 263, "rgb": "0xf5f5f5", "xterm": 255},
-    "xterm0": {"ansi": 0, "rgb": "0x000000", "xterm": 0},
-    "xterm1": {"ansi": 1, "rgb": "0x800000", "xterm": 1},
-    "xterm10": {"ansi": 258, "rgb": "0x00ff00", "xterm": 10},
-    "xterm100": {"ansi": 2, "rgb": "0x878700", "xterm": 100},
-    "xterm101": {"ansi": 2, "rgb": "0x87875f", "xterm": 101},
-    "xterm102": {"ansi": 2, "rgb": "0x878787", "xterm": 102},
-    "xterm103": {"ansi": 6, "rgb": "0x8787af", "xterm": 103},
-    "xterm104": {"ansi": 260, "rgb": "0x8787d7", "xterm": 104},
-    "xterm105": {"ansi": 260, "rgb": "0x8787ff", "xterm": 105},
-    "xterm106": {"ansi": 2, "rgb": "0x87af00", "xterm": 106},
-    "xterm107": {"ansi": 2, "rgb": "0x87af5f", "xterm": 107},
-    "xterm108": {"ansi": 2, "rgb": "0x87af87", "xterm": 108},
-    "xterm109": {"ansi": 6, "rgb": "0x87afaf", "xterm": 109},
-    "xterm11": {"ansi": 259, "rgb": "0xffff00", "xterm": 11},
-    "xterm110": {"ansi": 262, "rgb": "0x87afd7", "xterm": 110},
-    "xterm111": {"ansi": 262, "rgb": "0x87afff", "xterm": 111},
-    "xterm112": {"ansi": 258, "rgb": "0x87d700", "xterm": 112},
-    "xterm113": {"ansi": 258, "rgb": "0x87d75f", "xterm": 113},
-    "xterm114": {"ansi": 258, "rgb": "0x87d787", "xterm": 114},
-    "xterm115": {"ansi": 258, "rgb": "0x87d7af", "xterm": 115},
-    "xterm116": {"ansi": 262, "rgb": "0x87d7d7", "xterm": 116},
-    "xterm117": {"ansi": 262, "rgb": "0x87d7ff", "xterm": 117},
-    "xterm118": {"ansi": 258, "rgb": "0x87ff00", "xterm": 118},
-    "xterm119": {"ansi": 258, "rgb": "0x87ff5f", "xterm": 119},
-    "xterm12": {"ansi": 260, "rgb": "0x0000ff", "xterm": 12},
-    "xterm120": {"ansi": 258, "rgb": "0x87ff87", "xterm": 120},
-    "xterm121": {"ansi": 258, "rgb": "0x87ffaf", "xterm": 121},
-    "xterm122": {"ansi": 263, "rgb": "0x87ffd7", "xterm": 122},
-    "xterm123": {"ansi": 263, "rgb": "0x87ffff", "xterm": 123},
-    "xterm124": {"ansi": 1, "rgb": "0xaf0000", "xterm": 124},
-    "xterm125": {"ansi": 5, "rgb": "0xaf005f", "xterm": 125},
-    "xterm126": {"ansi": 5, "rgb": "0xaf0087", "xterm": 126},
-    "xterm127": {"ansi": 261, "rgb": "0xaf00af", "xterm": 127},
-    "xterm128": {"ansi": 261, "rgb": "0xaf00d7", "xterm": 128},
-    "xterm129": {"ansi": 261, "rgb": "0xaf00ff", "xterm": 129},
-    "xterm13": {"ansi": 261, "rgb": "0xff00ff", "xterm": 13},
-    "xterm130": {"ansi": 257, "rgb": "0xaf5f00", "xterm": 130},
-    "xterm131": {"ansi": 257, "rgb": "0xaf5f5f", "xterm": 131},
-    "xterm132": {"ansi": 257, "rgb": "0xaf5f87", "xterm": 132},
-    "xterm133": {"ansi": 261, "rgb": "0xaf5faf", "xterm": 133},
-    "xterm134": {"ansi": 261, "rgb": "0xaf5fd7", "xterm": 134},
-    "xterm135": {"ansi": 261, "rgb": "0xaf5fff", "xterm": 135},
-    "xterm136": {"ansi": 3, "rgb": "0xaf8700", "xterm": 136},
-    "xterm137": {"ansi": 3, "rgb": "0xaf875f", "xterm": 137},
-    "xterm138": {"ansi": 261, "rgb": "0xaf8787", "xterm": 138},
-    "xterm139": {"ansi": 261, "rgb": "0xaf87af", "xterm": 139},
-    "xterm14": {"ansi": 262, "rgb": "0x00ffff", "xterm": 14},
-    "xterm140": {"ansi": 261, "rgb": "0xaf87d7", "xterm": 140},
-    "xterm141": {"ansi": 261, "rgb": "0xaf87ff", "xterm": 141},
-    "xterm142": {"ansi": 3, "rgb": "0xafaf00", "xterm": 142},
-    "xterm143": {"ansi": 3, "rgb": "0xafaf5f", "xterm": 143},
-    "xterm144": {"ansi": 3, "rgb": "0xafaf87", "xterm": 144},
-    "xterm145": {"ansi": 261, "rgb": "0xafafaf", "xterm": 145},
-    "xterm146": {"ansi": 261, "rgb": "0xafafd7", "xterm": 146},
-    "xterm147": {"ansi": 261, "rgb": "0xafafff", "xterm": 147},
-    "xterm148": {"ansi": 259, "rgb": "0xafd700", "xterm": 148},
-    "xterm149": {"ansi": 259, "rgb": "0xafd75f", "xterm": 149},
-    "xterm15": {"ansi": 263, "rgb": "0xffffff", "xterm": 15},
-    "xterm150": {"ansi": 259, "rgb": "0xafd787", "xterm": 150},
-    "xterm151": {"ansi": 263, "rgb": "0xafd7af", "xterm": 151},
-    "xterm152": {"ansi": 263, "rgb": "0xafd7d7", "xterm": 152},
-    "xterm153": {"ansi": 263, "rgb": "0xafd7ff", "xterm": 153},
-    "xterm154": {"ansi": 259, "rgb": "0xafff00", "xterm": 154},
-    "xterm155": {"ansi": 259, "rgb": "0xafff5f", "xterm": 155},
-    "xterm156": {"ansi": 259, "rgb": "0xafff87", "xterm": 156},
-    "xterm157": {"ansi": 259, "rgb": "0xafffaf", "xterm": 157},
-    "xterm158": {"ansi": 263, "rgb": "0xafffd7", "xterm": 158},
-    "xterm159": {"ansi": 263, "rgb": "0xafffff", "xterm": 159},
-    "xterm16": {"ansi": 0, "rgb": "0x000000", "xterm": 16},
-    "xterm160": {"ansi": 1, "rgb": "0xd70000", "xterm": 160},
-    "xterm161": {"ansi": 257, "rgb": "0xd7005f", "xterm": 161},
-    "xterm162": {"ansi": 261, "rgb": "0xd70087", "xterm": 162},
-    "xterm163": {"ansi": 261, "rgb": "0xd700af", "xterm": 163},
-    "xterm164": {"ansi": 261, "rgb": "0xd700d7", "xterm": 164},
-    "xterm165": {"ansi": 261, "rgb": "0xd700ff", "xterm": 165},
-    "xterm166": {"ansi": 257, "rgb": "0xd75f00", "xterm": 166},
-    "xterm167": {"ansi": 257, "rgb": "0xd75f5f", "xterm": 167},
-    "xterm168": {"ansi": 257, "rgb": "0xd75f87", "xterm": 168},
-    "xterm169": {"ansi": 261, "rgb": "0xd75faf", "xterm": 169},
-    "xterm17": {"ansi": 4, "rgb": "0x00005f", "xterm": 17},
-    "xterm170": {"ansi": 261, "rgb": "0xd75fd7", "xterm": 170},
-    "xterm171": {"ansi": 261, "rgb": "0xd75fff", "xterm": 171},
-    "xterm172": {"ansi": 3, "rgb": "0xd78700", "xterm": 172},
-    "xterm173": {"ansi": 3, "rgb": "0xd7875f", "xterm": 173},
-    "xterm174": {"ansi": 3, "rgb": "0xd78787", "xterm": 174},
-    "xterm175": {"ansi": 261, "rgb": "0xd787af", "xterm": 175},
-    "xterm176": {"ansi": 261, "rgb": "0xd787d7", "xterm": 176},
-    "xterm177": {"ansi": 261, "rgb": "0xd787ff", "xterm": 177},
-    "xterm178": {"ansi": 3, "rgb": "0xd7af00", "xterm": 178},
-    "xterm179": {"ansi": 3, "rgb": "0xd7af5f", "xterm": 179},
-    "xterm18": {"ansi": 4, "rgb": "0x000087", "xterm": 18},
-    "xterm180": {"ansi": 259, "rgb": "0xd7af87", "xterm": 180},
-    "xterm181": {"ansi": 261, "rgb": "0xd7afaf", "xterm": 181},
-    "xterm182": {"ansi": 261, "rgb": "0xd7afd7", "xterm": 182},
-    "xterm183": {"ansi": 261, "rgb": "0xd7afff", "xterm": 183},
-    "xterm184": {"ansi": 3, "rgb": "0xd7d700", "xterm": 184},
-    "xterm185": {"ansi": 3, "rgb": "0xd7d75f", "xterm": 185},
-    "xterm186": {"ansi": 259, "rgb": "0xd7d787", "xterm": 186},
-    "xterm187": {"ansi": 263, "rgb": "0xd7d7af", "xterm": 187},
-    "xterm188": {"ansi": 263, "rgb": "0xd7d7d7", "xterm": 188},
-    "xterm189": {"ansi": 263, "rgb": "0xd7d7ff", "xterm": 189},
-    "xterm19": {"ansi": 4, "rgb": "0x0000af", "xterm": 19},
-    "xterm190": {"ansi": 259, "rgb": "0xd7ff00", "xterm": 190},
-    "xterm191": {"ansi": 259, "rgb": "0xd7ff5f", "xterm": 191},
-    "xterm192": {"ansi": 259, "rgb": "0xd7ff87", "xterm": 192},
-    "xterm193": {"ansi": 263, "rgb": "0xd7ffaf", "xterm": 193},
-    "xterm194": {"ansi": 263, "rgb": "0xd7ffd7", "xterm": 194},
-    "xterm195": {"ansi": 263, "rgb": "0xd7ffff", "xterm": 195},
-    "xterm196": {"ansi": 257, "rgb": "0xff0000", "xterm": 196},
-    "xterm197": {"ansi": 257, "rgb": "0xff005f", "xterm": 197},
-    "xterm198": {"ansi": 257, "rgb": "0xff0087", "xterm": 198},
-    "xterm199": {"ansi": 261, "rgb": "0xff00af", "xterm": 199},
-    "xterm2": {"ansi": 2, "rgb": "0x008000", "xterm": 2},
-    "xterm20": {"ansi": 260, "rgb": "0x0000d7", "xterm": 20},
-    "xterm200": {"ansi": 261, "rgb": "0xff00d7", "xterm": 200},
-    "xterm201": {"ansi": 261, "rgb": "0xff00ff", "xterm": 201},
-    "xterm202": {"ansi": 257, "rgb": "0xff5f00", "xterm": 202},
-    "xterm203": {"ansi": 257, "rgb": "0xff5f5f", "xterm": 203},
-    "xterm204": {"ansi": 257, "rgb": "0xff5f87", "xterm": 204},
-    "xterm205": {"ansi": 261, "rgb": "0xff5faf", "xterm": 205},
-    "xterm206": {"ansi": 261, "rgb": "0xff5fd7", "xterm": 206},
-    "xterm207": {"ansi": 261, "rgb": "0xff5fff", "xterm": 207},
-    "xterm208": {"ansi": 257, "rgb": "0xff8700", "xterm": 208},
-    "xterm209": {"ansi": 257, "rgb": "0xff875f", "xterm": 209},
-    "xterm21": {"ansi": 260, "rgb": "0x0000ff", "xterm": 21},
-    "xterm210": {"ansi": 261, "rgb": "0xff8787", "xterm": 210},
-    "xterm211": {"ansi": 261, "rgb": "0xff87af", "xterm": 211},
-    "xterm212": {"ansi": 261, "rgb": "0xff87d7", "xterm": 212},
-    "xterm213": {"ansi": 261, "rgb": "0xff87ff", "xterm": 213},
-    "xterm214": {"ansi": 259, "rgb": "0xffaf00", "xterm": 214},
-    "xterm215": {"ansi": 259, "rgb": "0xffaf5f", "xterm": 215},
-    "xterm216": {"ansi": 263, "rgb": "0xffaf87", "xterm": 216},
-    "xterm217": {"ansi": 263, "rgb": "0xffafaf", "xterm": 217},
-    "xterm218": {"ansi": 263, "rgb": "0xffafd7", "xterm": 218},
-    "xterm219": {"ansi": 263, "rgb": "0xffafff", "xterm": 219},
-    "xterm22": {"ansi": 2, "rgb": "0x005f00", "xterm": 22},
-    "xterm220": {"ansi": 259, "rgb": "0xffd700", "xterm": 220},
-    "xterm221": {"ansi": 259, "rgb": "0xffd75f", "xterm": 221},
-    "xterm222": {"ansi": 259, "rgb": "0xffd787", "xterm": 222},
-    "xterm223": {"ansi": 263, "rgb": "0xffd7af", "xterm": 223},
-    "xterm224": {"ansi": 263, "rgb": "0xffd7d7", "xterm": 224},
-    "xterm225": {"ansi": 263, "rgb": "0xffd7ff", "xterm": 225},
-    "xterm226": {"ansi": 259, "rgb": "0xffff00", "xterm": 226},
-    "xterm227": {"ansi": 259, "rgb": "0xffff5f", "xterm": 227},
-    "xterm228": {"ansi": 259, "rgb": "0xffff87", "xterm": 228},
-    "xterm229": {"ansi": 259, "rgb": "0xffffaf", "xterm": 229},
-    "xterm23": {"ansi": 6, "rgb": "0x005f5f", "xterm": 23},
-    "xterm230": {"ansi": 263, "rgb": "0xffffd7", "xterm": 230},
-    "xterm231": {"ansi": 263, "rgb": "0xffffff", "xterm": 231},
-    "xterm232": {"ansi": 0, "rgb": "0x080808", "xterm": 232},
-    "xterm233": {"ansi": 0, "rgb": "0x121212", "xterm": 233},
-    "xterm234": {"ansi": 256, "rgb": "0x1c1c1c", "xterm": 234},
-    "xterm235": {"ansi": 256, "rgb": "0x262626", "xterm": 235},
-    "xterm236": {"ansi": 256, "rgb": "0x303030", "xterm": 236},
-    "xterm237": {"ansi": 256, "rgb": "0x3a3a3a", "xterm": 237},
-    "xterm238": {"ansi": 256, "rgb": "0x444444", "xterm": 238},
-    "xterm239": {"ansi": 256, "rgb": "0x4e4e4e", "xterm": 239},
-    "xterm24": {"ansi": 4, "rgb": "0x005f87", "xterm": 24},
-    "xterm240": {"ansi": 256, "rgb": "0x585858", "xterm": 240},
-    "xterm241": {"ansi": 7, "rgb": "0x626262", "xterm": 241},
-    "xterm242": {"ansi": 7, "rgb": "0x6c6c6c", "xterm": 242},
-    "xterm243": {"ansi": 7, "rgb": "0x767676", "xterm": 243},
-    "xterm244": {"ansi": 7, "rgb": "0x808080", "xterm": 244},
-    "xterm245": {"ansi": 7, "rgb": "0x8a8a8a", "xterm": 245},
-    "xterm246": {"ansi": 7, "rgb": "0x949494", "xterm": 246},
-    "xterm247": {"ansi": 7, "rgb": "0x9e9e9e", "xterm": 247},
-    "xterm248": {"ansi": 263, "rgb": "0xa8a8a8", "xterm": 248},
-    "xterm249": {"ansi": 263, "rgb": "0xb2b2b2", "xterm": 249},
-    "xterm25": {"ansi": 260, "rgb": "0x005faf", "xterm": 25},
-    "xterm250": {"ansi": 263, "rgb": "0xbcbcbc", "xterm": 250},
-    "xterm251": {"ansi": 263, "rgb": "0xc6c6c6", "xterm": 251},
-    "xterm252": {"ansi": 263, "rgb": "0xd0d0d0", "xterm": 252},
-    "xterm253": {"ansi": 263, "rgb": "0xdadada", "xterm": 253},
-    "xterm254": {"ansi": 263, "rgb": "0xe4e4e4", "xterm": 254},
-    "xterm255": {"ansi": 263, "rgb": "0xeeeeee", "xterm": 255},
-    "xterm26": {"ansi": 260, "rgb": "0x005fd7", "xterm": 26},
-    "xterm27": {"ansi": 260, "rgb": "0x005fff", "xterm": 27},
-    "xterm28": {"ansi": 258, "rgb": "0x008700", "xterm": 28},
-    "xterm29": {"ansi": 2, "rgb": "0x00875f", "xterm": 29},
-    "xterm3": {"ansi": 3, "rgb": "0x808000", "xterm": 3},
-    "xterm30": {"ansi": 6, "rgb": "0x008787", "xterm": 30},
-    "xterm31": {"ansi": 260, "rgb": "0x0087af", "xterm": 31},
-    "xterm32": {"ansi": 260, "rgb": "0x0087d7", "xterm": 32},
-    "xterm33": {"ansi": 260, "rgb": "0x0087ff", "xterm": 33},
-    "xterm34": {"ansi": 258, "rgb": "0x00af00", "xterm": 34},
-    "xterm35": {"ansi": 258, "rgb": "0x00af5f", "xterm": 35},
-    "xterm36": {"ansi": 262, "rgb": "0x00af87", "xterm": 36},
-    "xterm37": {"ansi": 262, "rgb": "0x00afaf", "xterm": 37},
-    "xterm38": {"ansi": 260, "rgb": "0x00afd7", "xterm": 38},
-    "xterm39": {"ansi": 260, "rgb": "0x00afff", "xterm": 39},
-    "xterm4": {"ansi": 4, "rgb": "0x000080", "xterm": 4},
-    "xterm40": {"ansi": 258, "rgb": "0x00d700", "xterm": 40},
-    "xterm41": {"ansi": 258, "rgb": "0x00d75f", "xterm": 41},
-    "xterm42": {"ansi": 258, "rgb": "0x00d787", "xterm": 42},
-    "xterm43": {"ansi": 262, "rgb": "0x00d7af", "xterm": 43},
-    "xterm44": {"ansi": 262, "rgb": "0x00d7d7", "xterm": 44},
-    "xterm45": {"ansi": 262, "rgb": "0x00d7ff", "xterm": 45},
-    "xterm46": {"ansi": 258, "rgb": "0x00ff00", "xterm": 46},
-    "xterm47": {"ansi": 258, "rgb": "0x00ff5f", "xterm": 47},
-    "xterm48": {"ansi": 258, "rgb": "0x00ff87", "xterm": 48},
-    "xterm49": {"ansi": 262, "rgb": "0x00ffaf", "xterm": 49},
-    "xterm5": {"ansi": 5, "rgb": "0x800080", "xterm": 5},
-    "xterm50": {"ansi": 262, "rgb": "0x00ffd7", "xterm": 50},
-    "xterm51": {"ansi": 262, "rgb": "0x00ffff", "xterm": 51},
-    "xterm52": {"ansi": 1, "rgb": "0x5f0000", "xterm": 52},
-    "xterm53": {"ansi": 5, "rgb": "0x5f005f", "xterm": 53},
-    "xterm54": {"ansi": 5, "rgb": "0x5f0087", "xterm": 54},
-    "xterm55": {"ansi": 260, "rgb": "0x5f00af", "xterm": 55},
-    "xterm56": {"ansi": 260, "rgb": "0x5f00d7", "xterm": 56},
-    "xterm57": {"ansi": 260, "rgb": "0x5f00ff", "xterm": 57},
-    "xterm58": {"ansi": 2, "rgb": "0x5f5f00", "xterm": 58},
-    "xterm59": {"ansi": 2, "rgb": "0x5f5f5f", "xterm": 59},
-    "xterm6": {"ansi": 6, "rgb": "0x008080", "xterm": 6},
-    "xterm60": {"ansi": 6, "rgb": "0x5f5f87", "xterm": 60},
-    "xterm61": {"ansi": 260, "rgb": "0x5f5faf", "xterm": 61},
-    "xterm62": {"ansi": 260, "rgb": "0x5f5fd7", "xterm": 62},
-    "xterm63": {"ansi": 260, "rgb": "0x5f5fff", "xterm": 63},
-    "xterm64": {"ansi": 2, "rgb": "0x5f8700", "xterm": 64},
-    "xterm65": {"ansi": 2, "rgb": "0x5f875f", "xterm": 65},
-    "xterm66": {"ansi": 2, "rgb": "0x5f8787", "xterm": 66},
-    "xterm67": {"ansi": 6, "rgb": "0x5f87af", "xterm": 67},
-    "xterm68": {"ansi": 6, "rgb": "0x5f87d7", "xterm": 68},
-    "xterm69": {"ansi": 260, "rgb": "0x5f87ff", "xterm": 69},
-    "xterm7": {"ansi": 7, "rgb": "0xc0c0c0", "xterm": 7},
-    "xterm70": {"ansi": 258, "rgb": "0x5faf00", "xterm": 70},
-    "xterm71": {"ansi": 2, "rgb": "0x5faf5f", "xterm": 71},
-    "xterm72": {"ansi": 2, "rgb": "0x5faf87", "xterm": 72},
-    "xterm73": {"ansi": 6, "rgb": "0x5fafaf", "xterm": 73},
-    "xterm74": {"ansi": 262, "rgb": "0x5fafd7", "xterm": 74},
-    "xterm75": {"ansi": 262, "rgb": "0x5fafff", "xterm": 75},
-    "xterm76": {"ansi": 258, "rgb": "0x5fd700", "xterm": 76},
-    "xterm77": {"ansi": 258, "rgb": "0x5fd75f", "xterm": 77},
-    "xterm78": {"ansi": 258, "rgb": "0x5fd787", "xterm": 78},
-    "xterm79": {"ansi": 262, "rgb": "0x5fd7af", "xterm": 79},
-    "xterm8": {"ansi": 256, "rgb": "0x808080", "xterm": 8},
-    "xterm80": {"ansi": 262, "rgb": "0x5fd7d7", "xterm": 80},
-    "xterm81": {"ansi": 262, "rgb": "0x5fd7ff", "xterm": 81},
-    "xterm82": {"ansi": 258, "rgb": "0x5fff00", "xterm": 82},
-    "xterm83": {"ansi": 258, "rgb": "0x5fff5f", "xterm": 83},
-    "xterm84": {"ansi": 258, "rgb": "0x5fff87", "xterm": 84},
-    "xterm85": {"ansi": 258, "rgb": "0x5fffaf", "xterm": 85},
-    "xterm86": {"ansi": 262, "rgb": "0x5fffd7", "xterm": 86},
-    "xterm87": {"ansi": 262, "rgb": "0x5fffff", "xterm": 87},
-    "xterm88": {"ansi": 1, "rgb": "0x870000", "xterm": 88},
-    "xterm89": {"ansi": 1, "rgb": "0x87005f", "xterm": 89},
-    "xterm9": {"ansi": 257, "rgb": "0xff0000", "xterm": 9},
-    "xterm90": {"ansi": 5, "rgb": "0x870087", "xterm": 90},
-    "xterm91": {"ansi": 5, "rgb": "0x8700af", "xterm": 91},
-    "xterm92": {"ansi": 261, "rgb": "0x8700d7", "xterm": 92},
-    "xterm93": {"ansi": 261, "rgb": "0x8700ff", "xterm": 93},
-    "xterm94": {"ansi": 2, "rgb": "0x875f00", "xterm": 94},
-    "xterm95": {"ansi": 1, "rgb": "0x875f5f", "xterm": 95},
-    "xterm96": {"ansi": 5, "rgb": "0x875f87", "xterm": 96},
-    "xterm97": {"ansi": 5, "rgb": "0x875faf", "xterm": 97},
-    "xterm98": {"ansi": 261, "rgb": "0x875fd7", "xterm": 98},
-    "xterm99": {"ansi": 261, "rgb": "0x875fff", "xterm": 99},
-    "yellow": {"ansi": 259, "rgb": "0xffff00", "xterm": 226},
-    "yellow1": {"ansi": 259, "rgb": "0xffff00", "xterm": 226},
-    "yellow2": {"ansi": 259, "rgb": "0xeeee00", "xterm": 11},
-    "yellow3": {"ansi": 3, "rgb": "0xcdcd00", "xterm": 184},
-    "yellow4": {"ansi": 2, "rgb": "0x8b8b00", "xterm": 100},
-    "yellowgreen": {"ansi": 258, "rgb": "0x9acd32", "xterm": 113},
-}
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from rich.color import Color
+
+
+# PennMUSH color names in sorted order: name, RGB in hex, the nearest xterm color number, and the
+# nearest ANSI color (256 and up adding bold). It is kept as one string, so that importing this
+# module doesn't build a thousand dicts, and is only parsed when a color name is first looked up.
+COLOR_TABLE = """
+aliceblue f0f8ff 15 263
+antiquewhite faebd7 224 263
+antiquewhite1 ffefdb 230 263
+antiquewhite2 eedfcc 224 263
+antiquewhite3 cdc0b0 181 261
+antiquewhite4 8b8378 8 256
+aqua 00ffff 14 262
+aquamarine 7fffd4 122 263
+aquamarine1 7fffd4 122 263
+aquamarine2 76eec6 122 263
+aquamarine3 66cdaa 79 262
+aquamarine4 458b74 66 2
+azure f0ffff 15 263
+azure1 f0ffff 15 263
+azure2 e0eeee 255 263
+azure3 c1cdcd 251 263
+azure4 838b8b 102 2
+beige f5f5dc 230 263
+bisque ffe4c4 224 263
+bisque1 ffe4c4 224 263
+bisque2 eed5b7 223 263
+bisque3 cdb79e 181 261
+bisque4 8b7d6b 101 2
+black 000000 16 0
+blanchedalmond ffebcd 224 263
+blue 0000ff 21 260
+blue1 0000ff 21 260
+blue2 0000ee 12 260
+blue3 0000cd 20 260
+blue4 00008b 18 4
+blueviolet 8a2be2 92 261
+brown a52a2a 124 1
+brown1 ff4040 203 257
+brown2 ee3b3b 203 257
+brown3 cd3333 167 257
+brown4 8b2323 88 1
+burlywood deb887 180 259
+burlywood1 ffd39b 222 259
+burlywood2 eec591 222 259
+burlywood3 cdaa7d 180 259
+burlywood4 8b7355 95 1
+cadetblue 5f9ea0 73 6
+cadetblue1 98f5ff 123 263
+cadetblue2 8ee5ee 117 262
+cadetblue3 7ac5cd 116 262
+cadetblue4 53868b 66 2
+chartreuse 7fff00 118 258
+chartreuse1 7fff00 118 258
+chartreuse2 76ee00 118 258
+chartreuse3 66cd00 76 258
+chartreuse4 458b00 64 2
+chocolate d2691e 166 257
+chocolate1 ff7f24 208 257
+chocolate2 ee7621 208 257
+chocolate3 cd661d 166 257
+chocolate4 8b4513 94 2
+coral ff7f50 209 257
+coral1 ff7256 203 257
+coral2 ee6a50 203 257
+coral3 cd5b45 167 257
+coral4 8b3e2f 94 2
+cornflowerblue 6495ed 69 260
+cornsilk fff8dc 230 263
+cornsilk1 fff8dc 230 263
+cornsilk2 eee8cd 254 263
+cornsilk3 cdc8b1 187 263
+cornsilk4 8b8878 102 2
+cyan 00ffff 51 262
+cyan1 00ffff 51 262
+cyan2 00eeee 14 262
+cyan3 00cdcd 44 262
+cyan4 008b8b 30 6
+darkblue 00008b 18 4
+darkcyan 008b8b 30 6
+darkgoldenrod b8860b 136 3
+darkgoldenrod1 ffb90f 214 259
+darkgoldenrod2 eead0e 214 259
+darkgoldenrod3 cd950c 172 3
+darkgoldenrod4 8b6508 94 2
+darkgray a9a9a9 248 263
+darkgreen 006400 22 2
+darkgrey a9a9a9 248 263
+darkkhaki bdb76b 143 3
+darkmagenta 8b008b 90 5
+darkolivegreen 556b2f 239 256
+darkolivegreen1 caff70 191 259
+darkolivegreen2 bcee68 155 259
+darkolivegreen3 a2cd5a 149 259
+darkolivegreen4 6e8b3d 65 2
+darkorange ff8c00 208 257
+darkorange1 ff7f00 208 257
+darkorange2 ee7600 208 257
+darkorange3 cd6600 166 257
+darkorange4 8b4500 94 2
+darkorchid 9932cc 98 261
+darkorchid1 bf3eff 135 261
+darkorchid2 b23aee 135 261
+darkorchid3 9a32cd 98 261
+darkorchid4 68228b 54 5
+darkred 8b0000 88 1
+darksalmon e9967a 174 3
+darkseagreen 8fbc8f 108 2
+darkseagreen1 c1ffc1 157 259
+darkseagreen2 b4eeb4 157 259
+darkseagreen3 9bcd9b 114 258
+darkseagreen4 698b69 65 2
+darkslateblue 483d8b 60 6
+darkslategray 2f4f4f 238 256
+darkslategray1 97ffff 123 263
+darkslategray2 8deeee 123 263
+darkslategray3 79cdcd 116 262
+darkslategray4 528b8b 66 2
+darkslategrey 2f4f4f 238 256
+darkslategrey1 97ffff 123 263
+darkslategrey2 8deeee 123 263
+darkslategrey3 79cdcd 116 262
+darkslategrey4 528b8b 66 2
+darkturquoise 00ced1 44 262
+darkviolet 9400d3 92 261
+deeppink ff1493 198 257
+deeppink1 ff1493 198 257
+deeppink2 ee1289 198 257
+deeppink3 cd1076 162 261
+deeppink4 8b0a50 89 1
+deepskyblue 00bfff 39 260
+deepskyblue1 00bfff 39 260
+deepskyblue2 00b2ee 39 260
+deepskyblue3 009acd 32 260
+deepskyblue4 00688b 24 4
+dimgray 696969 242 7
+dimgrey 696969 242 7
+dodgerblue 1e90ff 33 260
+dodgerblue1 1e90ff 33 260
+dodgerblue2 1c86ee 33 260
+dodgerblue3 1874cd 32 260
+dodgerblue4 104e8b 24 4
+firebrick b22222 124 1
+firebrick1 ff3030 203 257
+firebrick2 ee2c2c 9 257
+firebrick3 cd2626 160 1
+firebrick4 8b1a1a 88 1
+floralwhite fffaf0 15 263
+forestgreen 228b22 28 258
+fuchsia ff00ff 13 261
+gainsboro dcdcdc 253 263
+ghostwhite f8f8ff 15 263
+gold ffd700 220 259
+gold1 ffd700 220 259
+gold2 eec900 220 259
+gold3 cdad00 178 3
+gold4 8b7500 3 3
+goldenrod daa520 178 3
+goldenrod1 ffc125 214 259
+goldenrod2 eeb422 214 259
+goldenrod3 cd9b1d 172 3
+goldenrod4 8b6914 94 2
+gray bebebe 7 7
+gray0 000000 16 0
+gray1 030303 0 0
+gray10 1a1a1a 234 256
+gray100 ffffff 231 263
+gray11 1c1c1c 234 256
+gray12 1f1f1f 234 256
+gray13 212121 234 256
+gray14 242424 235 256
+gray15 262626 235 256
+gray16 292929 235 256
+gray17 2b2b2b 235 256
+gray18 2e2e2e 236 256
+gray19 303030 236 256
+gray2 050505 232 0
+gray20 333333 236 256
+gray21 363636 237 256
+gray22 383838 237 256
+gray23 3b3b3b 237 256
+gray24 3d3d3d 237 256
+gray25 404040 238 256
+gray26 424242 238 256
+gray27 454545 238 256
+gray28 474747 238 256
+gray29 4a4a4a 239 256
+gray3 080808 232 0
+gray30 4d4d4d 239 256
+gray31 4f4f4f 239 256
+gray32 525252 239 256
+gray33 545454 240 256
+gray34 575757 240 256
+gray35 595959 240 256
+gray36 5c5c5c 59 2
+gray37 5e5e5e 59 2
+gray38 616161 241 7
+gray39 636363 241 7
+gray4 0a0a0a 232 0
+gray40 666666 241 7
+gray41 696969 242 7
+gray42 6b6b6b 242 7
+gray43 6e6e6e 242 7
+gray44 707070 242 7
+gray45 737373 243 7
+gray46 757575 243 7
+gray47 787878 243 7
+gray48 7a7a7a 243 7
+gray49 7d7d7d 8 256
+gray5 0d0d0d 232 0
+gray50 7f7f7f 8 256
+gray51 828282 8 256
+gray52 858585 102 2
+gray53 878787 102 2
+gray54 8a8a8a 245 7
+gray55 8c8c8c 245 7
+gray56 8f8f8f 245 7
+gray57 919191 246 7
+gray58 949494 246 7
+gray59 969696 246 7
+gray6 0f0f0f 233 0
+gray60 999999 246 7
+gray61 9c9c9c 247 7
+gray62 9e9e9e 247 7
+gray63 a1a1a1 247 7
+gray64 a3a3a3 247 7
+gray65 a6a6a6 248 263
+gray66 a8a8a8 248 263
+gray67 ababab 248 263
+gray68 adadad 145 261
+gray69 b0b0b0 145 261
+gray7 121212 233 0
+gray70 b3b3b3 249 263
+gray71 b5b5b5 249 263
+gray72 b8b8b8 250 263
+gray73 bababa 250 263
+gray74 bdbdbd 250 263
+gray75 bfbfbf 7 7
+gray76 c2c2c2 7 7
+gray77 c4c4c4 251 263
+gray78 c7c7c7 251 263
+gray79 c9c9c9 251 263
+gray8 141414 233 0
+gray80 cccccc 252 263
+gray81 cfcfcf 252 263
+gray82 d1d1d1 252 263
+gray83 d4d4d4 188 263
+gray84 d6d6d6 188 263
+gray85 d9d9d9 253 263
+gray86 dbdbdb 253 263
+gray87 dedede 253 263
+gray88 e0e0e0 254 263
+gray89 e3e3e3 254 263
+gray9 171717 233 0
+gray90 e5e5e5 254 263
+gray91 e8e8e8 254 263
+gray92 ebebeb 255 263
+gray93 ededed 255 263
+gray94 f0f0f0 255 263
+gray95 f2f2f2 255 263
+gray96 f5f5f5 255 263
+gray97 f7f7f7 15 263
+gray98 fafafa 15 263
+gray99 fcfcfc 15 263
+green 00ff00 46 258
+green1 00ff00 46 258
+green2 00ee00 10 258
+green3 00cd00 40 258
+green4 008b00 28 258
+greenyellow adff2f 154 259
+grey bebebe 7 7
+grey0 000000 16 0
+grey1 030303 0 0
+grey10 1a1a1a 234 256
+grey100 ffffff 231 263
+grey11 1c1c1c 234 256
+grey12 1f1f1f 234 256
+grey13 212121 234 256
+grey14 242424 235 256
+grey15 262626 235 256
+grey16 292929 235 256
+grey17 2b2b2b 235 256
+grey18 2e2e2e 236 256
+grey19 303030 236 256
+grey2 050505 232 0
+grey20 333333 236 256
+grey21 363636 237 256
+grey22 383838 237 256
+grey23 3b3b3b 237 256
+grey24 3d3d3d 237 256
+grey25 404040 238 256
+grey26 424242 238 256
+grey27 454545 238 256
+grey28 474747 238 256
+grey29 4a4a4a 239 256
+grey3 080808 232 0
+grey30 4d4d4d 239 256
+grey31 4f4f4f 239 256
+grey32 525252 239 256
+grey33 545454 240 256
+grey34 575757 240 256
+grey35 595959 240 256
+grey36 5c5c5c 59 2
+grey37 5e5e5e 59 2
+grey38 616161 241 7
+grey39 636363 241 7
+grey4 0a0a0a 232 0
+grey40 666666 241 7
+grey41 696969 242 7
+grey42 6b6b6b 242 7
+grey43 6e6e6e 242 7
+grey44 707070 242 7
+grey45 737373 243 7
+grey46 757575 243 7
+grey47 787878 243 7
+grey48 7a7a7a 243 7
+grey49 7d7d7d 8 256
+grey5 0d0d0d 232 0
+grey50 7f7f7f 8 256
+grey51 828282 8 256
+grey52 858585 102 2
+grey53 878787 102 2
+grey54 8a8a8a 245 7
+grey55 8c8c8c 245 7
+grey56 8f8f8f 245 7
+grey57 919191 246 7
+grey58 949494 246 7
+grey59 969696 246 7
+grey6 0f0f0f 233 0
+grey60 999999 246 7
+grey61 9c9c9c 247 7
+grey62 9e9e9e 247 7
+grey63 a1a1a1 247 7
+grey64 a3a3a3 247 7
+grey65 a6a6a6 248 263
+grey66 a8a8a8 248 263
+grey67 ababab 248 263
+grey68 adadad 145 261
+grey69 b0b0b0 145 261
+grey7 121212 233 0
+grey70 b3b3b3 249 263
+grey71 b5b5b5 249 263
+grey72 b8b8b8 250 263
+grey73 bababa 250 263
+grey74 bdbdbd 250 263
+grey75 bfbfbf 7 7
+grey76 c2c2c2 7 7
+grey77 c4c4c4 251 263
+grey78 c7c7c7 251 263
+grey79 c9c9c9 251 263
+grey8 141414 233 0
+grey80 cccccc 252 263
+grey81 cfcfcf 252 263
+grey82 d1d1d1 252 263
+grey83 d4d4d4 188 263
+grey84 d6d6d6 188 263
+grey85 d9d9d9 253 263
+grey86 dbdbdb 253 263
+grey87 dedede 253 263
+grey88 e0e0e0 254 263
+grey89 e3e3e3 254 263
+grey9 171717 233 0
+grey90 e5e5e5 254 263
+grey91 e8e8e8 254 263
+grey92 ebebeb 255 263
+grey93 ededed 255 263
+grey94 f0f0f0 255 263
+grey95 f2f2f2 255 263
+grey96 f5f5f5 255 263
+grey97 f7f7f7 15 263
+grey98 fafafa 15 263
+grey99 fcfcfc 15 263
+honeydew f0fff0 255 263
+honeydew1 f0fff0 255 263
+honeydew2 e0eee0 254 263
+honeydew3 c1cdc1 251 263
+honeydew4 838b83 102 2
+hotpink ff69b4 205 261
+hotpink1 ff6eb4 205 261
+hotpink2 ee6aa7 205 261
+hotpink3 cd6090 168 257
+hotpink4 8b3a62 95 1
+indianred cd5c5c 167 257
+indianred1 ff6a6a 203 257
+indianred2 ee6363 203 257
+indianred3 cd5555 167 257
+indianred4 8b3a3a 95 1
+ivory fffff0 15 263
+ivory1 fffff0 15 263
+ivory2 eeeee0 255 263
+ivory3 cdcdc1 251 263
+ivory4 8b8b83 102 2
+khaki f0e68c 222 259
+khaki1 fff68f 228 259
+khaki2 eee685 222 259
+khaki3 cdc673 185 3
+khaki4 8b864e 101 2
+lavender e6e6fa 255 263
+lavenderblush fff0f5 15 263
+lavenderblush1 fff0f5 15 263
+lavenderblush2 eee0e5 254 263
+lavenderblush3 cdc1c5 251 263
+lavenderblush4 8b8386 102 2
+lawngreen 7cfc00 118 258
+lemonchiffon fffacd 230 263
+lemonchiffon1 fffacd 230 263
+lemonchiffon2 eee9bf 223 263
+lemonchiffon3 cdc9a5 187 263
+lemonchiffon4 8b8970 101 2
+lightblue add8e6 152 263
+lightblue1 bfefff 159 263
+lightblue2 b2dfee 153 263
+lightblue3 9ac0cd 110 262
+lightblue4 68838b 66 2
+lightcoral f08080 210 261
+lightcyan e0ffff 195 263
+lightcyan1 e0ffff 195 263
+lightcyan2 d1eeee 254 263
+lightcyan3 b4cdcd 152 263
+lightcyan4 7a8b8b 102 2
+lightgoldenrod eedd82 222 259
+lightgoldenrod1 ffec8b 228 259
+lightgoldenrod2 eedc82 222 259
+lightgoldenrod3 cdbe70 179 3
+lightgoldenrod4 8b814c 101 2
+lightgoldenrodyellow fafad2 230 263
+lightgray d3d3d3 252 263
+lightgreen 90ee90 120 258
+lightgrey d3d3d3 252 263
+lightpink ffb6c1 217 263
+lightpink1 ffaeb9 217 263
+lightpink2 eea2ad 217 263
+lightpink3 cd8c95 174 3
+lightpink4 8b5f65 95 1
+lightsalmon ffa07a 216 263
+lightsalmon1 ffa07a 216 263
+lightsalmon2 ee9572 209 257
+lightsalmon3 cd8162 173 3
+lightsalmon4 8b5742 95 1
+lightseagreen 20b2aa 37 262
+lightskyblue 87cefa 117 262
+lightskyblue1 b0e2ff 153 263
+lightskyblue2 a4d3ee 153 263
+lightskyblue3 8db6cd 110 262
+lightskyblue4 607b8b 66 2
+lightslateblue 8470ff 99 261
+lightslategray 778899 102 2
+lightslategrey 778899 102 2
+lightsteelblue b0c4de 152 263
+lightsteelblue1 cae1ff 189 263
+lightsteelblue2 bcd2ee 153 263
+lightsteelblue3 a2b5cd 146 261
+lightsteelblue4 6e7b8b 66 2
+lightyellow ffffe0 230 263
+lightyellow1 ffffe0 230 263
+lightyellow2 eeeed1 254 263
+lightyellow3 cdcdb4 187 263
+lightyellow4 8b8b7a 102 2
+lime 00ff00 10 258
+limegreen 32cd32 77 258
+linen faf0e6 255 263
+magenta ff00ff 201 261
+magenta1 ff00ff 201 261
+magenta2 ee00ee 13 261
+magenta3 cd00cd 164 261
+magenta4 8b008b 90 5
+maroon b03060 131 257
+maroon1 ff34b3 205 261
+maroon2 ee30a7 205 261
+maroon3 cd2990 162 261
+maroon4 8b1c62 89 1
+mediumaquamarine 66cdaa 79 262
+mediumblue 0000cd 20 260
+mediumorchid ba55d3 134 261
+mediumorchid1 e066ff 171 261
+mediumorchid2 d15fee 171 261
+mediumorchid3 b452cd 134 261
+mediumorchid4 7a378b 96 5
+mediumpurple 9370db 98 261
+mediumpurple1 ab82ff 141 261
+mediumpurple2 9f79ee 141 261
+mediumpurple3 8968cd 98 261
+mediumpurple4 5d478b 60 6
+mediumseagreen 3cb371 71 2
+mediumslateblue 7b68ee 99 261
+mediumspringgreen 00fa9a 48 258
+mediumturquoise 48d1cc 80 262
+mediumvioletred c71585 162 261
+midnightblue 191970 4 4
+mintcream f5fffa 15 263
+mistyrose ffe4e1 224 263
+mistyrose1 ffe4e1 224 263
+mistyrose2 eed5d2 224 263
+mistyrose3 cdb7b5 181 261
+mistyrose4 8b7d7b 8 256
+moccasin ffe4b5 223 263
+navajowhite ffdead 223 263
+navajowhite1 ffdead 223 263
+navajowhite2 eecfa1 223 263
+navajowhite3 cdb38b 180 259
+navajowhite4 8b795e 101 2
+navy 000080 4 4
+navyblue 000080 4 4
+oldlace fdf5e6 230 263
+olive 808000 3 3
+olivedrab 6b8e23 64 2
+olivedrab1 c0ff3e 155 259
+olivedrab2 b3ee3a 155 259
+olivedrab3 9acd32 113 258
+olivedrab4 698b22 64 2
+orange ffa500 214 259
+orange1 ffa500 214 259
+orange2 ee9a00 208 257
+orange3 cd8500 172 3
+orange4 8b5a00 94 2
+orangered ff4500 202 257
+orangered1 ff4500 202 257
+orangered2 ee4000 202 257
+orangered3 cd3700 166 257
+orangered4 8b2500 88 1
+orchid da70d6 170 261
+orchid1 ff83fa 213 261
+orchid2 ee7ae9 212 261
+orchid3 cd69c9 170 261
+orchid4 8b4789 96 5
+palegoldenrod eee8aa 223 263
+palegreen 98fb98 120 258
+palegreen1 9aff9a 120 258
+palegreen2 90ee90 120 258
+palegreen3 7ccd7c 114 258
+palegreen4 548b54 65 2
+paleturquoise afeeee 159 263
+paleturquoise1 bbffff 159 263
+paleturquoise2 aeeeee 159 263
+paleturquoise3 96cdcd 116 262
+paleturquoise4 668b8b 66 2
+palevioletred db7093 168 257
+palevioletred1 ff82ab 211 261
+palevioletred2 ee799f 211 261
+palevioletred3 cd6889 168 257
+palevioletred4 8b475d 95 1
+papayawhip ffefd5 230 263
+peachpuff ffdab9 223 263
+peachpuff1 ffdab9 223 263
+peachpuff2 eecbad 223 263
+peachpuff3 cdaf95 180 259
+peachpuff4 8b7765 101 2
+peru cd853f 173 3
+pink ffc0cb 218 263
+pink1 ffb5c5 218 263
+pink2 eea9b8 217 263
+pink3 cd919e 175 261
+pink4 8b636c 95 1
+plum dda0dd 182 261
+plum1 ffbbff 219 263
+plum2 eeaeee 219 263
+plum3 cd96cd 176 261
+plum4 8b668b 96 5
+powderblue b0e0e6 152 263
+purple a020f0 129 261
+purple1 9b30ff 99 261
+purple2 912cee 93 261
+purple3 7d26cd 92 261
+purple4 551a8b 54 5
+red ff0000 196 257
+red1 ff0000 196 257
+red2 ee0000 9 257
+red3 cd0000 160 1
+red4 8b0000 88 1
+rosybrown bc8f8f 138 261
+rosybrown1 ffc1c1 217 263
+rosybrown2 eeb4b4 217 263
+rosybrown3 cd9b9b 174 3
+rosybrown4 8b6969 95 1
+royalblue 4169e1 62 260
+royalblue1 4876ff 69 260
+royalblue2 436eee 63 260
+royalblue3 3a5fcd 62 260
+royalblue4 27408b 24 4
+saddlebrown 8b4513 94 2
+salmon fa8072 209 257
+salmon1 ff8c69 209 257
+salmon2 ee8262 209 257
+salmon3 cd7054 167 257
+salmon4 8b4c39 95 1
+sandybrown f4a460 215 259
+seagreen 2e8b57 29 2
+seagreen1 54ff9f 85 258
+seagreen2 4eee94 84 258
+seagreen3 43cd80 78 258
+seagreen4 2e8b57 29 2
+seashell fff5ee 255 263
+seashell1 fff5ee 255 263
+seashell2 eee5de 254 263
+seashell3 cdc5bf 251 263
+seashell4 8b8682 102 2
+sienna a0522d 130 257
+sienna1 ff8247 209 257
+sienna2 ee7942 209 257
+sienna3 cd6839 167 257
+sienna4 8b4726 94 2
+silver c0c0c0 7 7
+skyblue 87ceeb 116 262
+skyblue1 87ceff 117 262
+skyblue2 7ec0ee 111 262
+skyblue3 6ca6cd 74 262
+skyblue4 4a708b 60 6
+slateblue 6a5acd 62 260
+slateblue1 836fff 99 261
+slateblue2 7a67ee 99 261
+slateblue3 6959cd 62 260
+slateblue4 473c8b 60 6
+slategray 708090 66 2
+slategray1 c6e2ff 189 263
+slategray2 b9d3ee 153 263
+slategray3 9fb6cd 146 261
+slategray4 6c7b8b 66 2
+slategrey 708090 66 2
+slategrey1 c6e2ff 189 263
+slategrey2 b9d3ee 153 263
+slategrey3 9fb6cd 146 261
+slategrey4 6c7b8b 66 2
+snow fffafa 15 263
+snow1 fffafa 15 263
+snow2 eee9e9 255 263
+snow3 cdc9c9 251 263
+snow4 8b8989 245 7
+springgreen 00ff7f 48 258
+springgreen1 00ff7f 48 258
+springgreen2 00ee76 48 258
+springgreen3 00cd66 41 258
+springgreen4 008b45 29 2
+steelblue 4682b4 67 6
+steelblue1 63b8ff 75 262
+steelblue2 5cacee 75 262
+steelblue3 4f94cd 68 6
+steelblue4 36648b 60 6
+tan d2b48c 180 259
+tan1 ffa54f 215 259
+tan2 ee9a49 209 257
+tan3 cd853f 173 3
+tan4 8b5a2b 94 2
+teal 008080 6 6
+thistle d8bfd8 182 261
+thistle1 ffe1ff 225 263
+thistle2 eed2ee 254 263
+thistle3 cdb5cd 182 261
+thistle4 8b7b8b 102 2
+tomato ff6347 203 257
+tomato1 ff6347 203 257
+tomato2 ee5c42 203 257
+tomato3 cd4f39 167 257
+tomato4 8b3626 94 2
+turquoise 40e0d0 80 262
+turquoise1 00f5ff 14 262
+turquoise2 00e5ee 45 262
+turquoise3 00c5cd 44 262
+turquoise4 00868b 30 6
+violet ee82ee 213 261
+violetred d02090 162 261
+violetred1 ff3e96 204 257
+violetred2 ee3a8c 204 257
+violetred3 cd3278 168 257
+violetred4 8b2252 89 1
+wheat f5deb3 223 263
+wheat1 ffe7ba 223 263
+wheat2 eed8ae 223 263
+wheat3 cdba96 180 259
+wheat4 8b7e66 101 2
+white ffffff 231 263
+whitesmoke f5f5f5 255 263
+xterm0 000000 0 0
+xterm1 800000 1 1
+xterm10 00ff00 10 258
+xterm100 878700 100 2
+xterm101 87875f 101 2
+xterm102 878787 102 2
+xterm103 8787af 103 6
+xterm104 8787d7 104 260
+xterm105 8787ff 105 260
+xterm106 87af00 106 2
+xterm107 87af5f 107 2
+xterm108 87af87 108 2
+xterm109 87afaf 109 6
+xterm11 ffff00 11 259
+xterm110 87afd7 110 262
+xterm111 87afff 111 262
+xterm112 87d700 112 258
+xterm113 87d75f 113 258
+xterm114 87d787 114 258
+xterm115 87d7af 115 258
+xterm116 87d7d7 116 262
+xterm117 87d7ff 117 262
+xterm118 87ff00 118 258
+xterm119 87ff5f 119 258
+xterm12 0000ff 12 260
+xterm120 87ff87 120 258
+xterm121 87ffaf 121 258
+xterm122 87ffd7 122 263
+xterm123 87ffff 123 263
+xterm124 af0000 124 1
+xterm125 af005f 125 5
+xterm126 af0087 126 5
+xterm127 af00af 127 261
+xterm128 af00d7 128 261
+xterm129 af00ff 129 261
+xterm13 ff00ff 13 261
+xterm130 af5f00 130 257
+xterm131 af5f5f 131 257
+xterm132 af5f87 132 257
+xterm133 af5faf 133 261
+xterm134 af5fd7 134 261
+xterm135 af5fff 135 261
+xterm136 af8700 136 3
+xterm137 af875f 137 3
+xterm138 af8787 138 261
+xterm139 af87af 139 261
+xterm14 00ffff 14 262
+xterm140 af87d7 140 261
+xterm141 af87ff 141 261
+xterm142 afaf00 142 3
+xterm143 afaf5f 143 3
+xterm144 afaf87 144 3
+xterm145 afafaf 145 261
+xterm146 afafd7 146 261
+xterm147 afafff 147 261
+xterm148 afd700 148 259
+xterm149 afd75f 149 259
+xterm15 ffffff 15 263
+xterm150 afd787 150 259
+xterm151 afd7af 151 263
+xterm152 afd7d7 152 263
+xterm153 afd7ff 153 263
+xterm154 afff00 154 259
+xterm155 afff5f 155 259
+xterm156 afff87 156 259
+xterm157 afffaf 157 259
+xterm158 afffd7 158 263
+xterm159 afffff 159 263
+xterm16 000000 16 0
+xterm160 d70000 160 1
+xterm161 d7005f 161 257
+xterm162 d70087 162 261
+xterm163 d700af 163 261
+xterm164 d700d7 164 261
+xterm165 d700ff 165 261
+xterm166 d75f00 166 257
+xterm167 d75f5f 167 257
+xterm168 d75f87 168 257
+xterm169 d75faf 169 261
+xterm17 00005f 17 4
+xterm170 d75fd7 170 261
+xterm171 d75fff 171 261
+xterm172 d78700 172 3
+xterm173 d7875f 173 3
+xterm174 d78787 174 3
+xterm175 d787af 175 261
+xterm176 d787d7 176 261
+xterm177 d787ff 177 261
+xterm178 d7af00 178 3
+xterm179 d7af5f 179 3
+xterm18 000087 18 4
+xterm180 d7af87 180 259
+xterm181 d7afaf 181 261
+xterm182 d7afd7 182 261
+xterm183 d7afff 183 261
+xterm184 d7d700 184 3
+xterm185 d7d75f 185 3
+xterm186 d7d787 186 259
+xterm187 d7d7af 187 263
+xterm188 d7d7d7 188 263
+xterm189 d7d7ff 189 263
+xterm19 0000af 19 4
+xterm190 d7ff00 190 259
+xterm191 d7ff5f 191 259
+xterm192 d7ff87 192 259
+xterm193 d7ffaf 193 263
+xterm194 d7ffd7 194 263
+xterm195 d7ffff 195 263
+xterm196 ff0000 196 257
+xterm197 ff005f 197 257
+xterm198 ff0087 198 257
+xterm199 ff00af 199 261
+xterm2 008000 2 2
+xterm20 0000d7 20 260
+xterm200 ff00d7 200 261
+xterm201 ff00ff 201 261
+xterm202 ff5f00 202 257
+xterm203 ff5f5f 203 257
+xterm204 ff5f87 204 257
+xterm205 ff5faf 205 261
+xterm206 ff5fd7 206 261
+xterm207 ff5fff 207 261
+xterm208 ff8700 208 257
+xterm209 ff875f 209 257
+xterm21 0000ff 21 260
+xterm210 ff8787 210 261
+xterm211 ff87af 211 261
+xterm212 ff87d7 212 261
+xterm213 ff87ff 213 261
+xterm214 ffaf00 214 259
+xterm215 ffaf5f 215 259
+xterm216 ffaf87 216 263
+xterm217 ffafaf 217 263
+xterm218 ffafd7 218 263
+xterm219 ffafff 219 263
+xterm22 005f00 22 2
+xterm220 ffd700 220 259
+xterm221 ffd75f 221 259
+xterm222 ffd787 222 259
+xterm223 ffd7af 223 263
+xterm224 ffd7d7 224 263
+xterm225 ffd7ff 225 263
+xterm226 ffff00 226 259
+xterm227 ffff5f 227 259
+xterm228 ffff87 228 259
+xterm229 ffffaf 229 259
+xterm23 005f5f 23 6
+xterm230 ffffd7 230 263
+xterm231 ffffff 231 263
+xterm232 080808 232 0
+xterm233 121212 233 0
+xterm234 1c1c1c 234 256
+xterm235 262626 235 256
+xterm236 303030 236 256
+xterm237 3a3a3a 237 256
+xterm238 444444 238 256
+xterm239 4e4e4e 239 256
+xterm24 005f87 24 4
+xterm240 585858 240 256
+xterm241 626262 241 7
+xterm242 6c6c6c 242 7
+xterm243 767676 243 7
+xterm244 808080 244 7
+xterm245 8a8a8a 245 7
+xterm246 949494 246 7
+xterm247 9e9e9e 247 7
+xterm248 a8a8a8 248 263
+xterm249 b2b2b2 249 263
+xterm25 005faf 25 260
+xterm250 bcbcbc 250 263
+xterm251 c6c6c6 251 263
+xterm252 d0d0d0 252 263
+xterm253 dadada 253 263
+xterm254 e4e4e4 254 263
+xterm255 eeeeee 255 263
+xterm26 005fd7 26 260
+xterm27 005fff 27 260
+xterm28 008700 28 258
+xterm29 00875f 29 2
+xterm3 808000 3 3
+xterm30 008787 30 6
+xterm31 0087af 31 260
+xterm32 0087d7 32 260
+xterm33 0087ff 33 260
+xterm34 00af00 34 258
+xterm35 00af5f 35 258
+xterm36 00af87 36 262
+xterm37 00afaf 37 262
+xterm38 00afd7 38 260
+xterm39 00afff 39 260
+xterm4 000080 4 4
+xterm40 00d700 40 258
+xterm41 00d75f 41 258
+xterm42 00d787 42 258
+xterm43 00d7af 43 262
+xterm44 00d7d7 44 262
+xterm45 00d7ff 45 262
+xterm46 00ff00 46 258
+xterm47 00ff5f 47 258
+xterm48 00ff87 48 258
+xterm49 00ffaf 49 262
+xterm5 800080 5 5
+xterm50 00ffd7 50 262
+xterm51 00ffff 51 262
+xterm52 5f0000 52 1
+xterm53 5f005f 53 5
+xterm54 5f0087 54 5
+xterm55 5f00af 55 260
+xterm56 5f00d7 56 260
+xterm57 5f00ff 57 260
+xterm58 5f5f00 58 2
+xterm59 5f5f5f 59 2
+xterm6 008080 6 6
+xterm60 5f5f87 60 6
+xterm61 5f5faf 61 260
+xterm62 5f5fd7 62 260
+xterm63 5f5fff 63 260
+xterm64 5f8700 64 2
+xterm65 5f875f 65 2
+xterm66 5f8787 66 2
+xterm67 5f87af 67 6
+xterm68 5f87d7 68 6
+xterm69 5f87ff 69 260
+xterm7 c0c0c0 7 7
+xterm70 5faf00 70 258
+xterm71 5faf5f 71 2
+xterm72 5faf87 72 2
+xterm73 5fafaf 73 6
+xterm74 5fafd7 74 262
+xterm75 5fafff 75 262
+xterm76 5fd700 76 258
+xterm77 5fd75f 77 258
+xterm78 5fd787 78 258
+xterm79 5fd7af 79 262
+xterm8 808080 8 256
+xterm80 5fd7d7 80 262
+xterm81 5fd7ff 81 262
+xterm82 5fff00 82 258
+xterm83 5fff5f 83 258
+xterm84 5fff87 84 258
+xterm85 5fffaf 85 258
+xterm86 5fffd7 86 262
+xterm87 5fffff 87 262
+xterm88 870000 88 1
+xterm89 87005f 89 1
+xterm9 ff0000 9 257
+xterm90 870087 90 5
+xterm91 8700af 91 5
+xterm92 8700d7 92 261
+xterm93 8700ff 93 261
+xterm94 875f00 94 2
+xterm95 875f5f 95 1
+xterm96 875f87 96 5
+xterm97 875faf 97 5
+xterm98 875fd7 98 261
+xterm99 875fff 99 261
+yellow ffff00 226 259
+yellow1 ffff00 226 259
+yellow2 eeee00 11 259
+yellow3 cdcd00 184 3
+yellow4 8b8b00 100 2
+yellowgreen 9acd32 113 258
+"""
+
+
+class ColorIndex:
+    """
+    The colors of COLOR_TABLE as parallel arrays in name order, with integer RGB, a prebuilt
+    rich Color for each name, and prefix lookups for autocompletion.
+    """
+
+    def __init__(self, table: str = COLOR_TABLE):
+        fields = table.split()
+        self.names: Tuple[str, ...] = tuple(fields[0::4])
+        self.rgb = array("L", [int(v, 16) for v in fields[1::4]])
+        self.xterm = bytes(int(v) for v in fields[2::4])
+        self.ansi = array("H", [int(v) for v in fields[3::4]])
+        self.positions: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        # Names sharing an xterm color share the Color too, through Color.from_ansi's cache.
+        self.colors: Tuple[Color, ...] = tuple(Color.from_ansi(x) for x in self.xterm)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.positions
+
+    def color(self, name: str) -> Optional[Color]:
+        """
+        The xterm Color for a lowercase color name, or None if there is no such color.
+        """
+        if (i := self.positions.get(name, None)) is None:
+            return None
+        return self.colors[i]
+
+    def truecolor(self, name: str) -> Optional[Color]:
+        """
+        The exact RGB Color for a lowercase color name, or None if there is no such color.
+        """
+        if (i := self.positions.get(name, None)) is None:
+            return None
+        rgb = self.rgb[i]
+        return Color.from_rgb(rgb >> 16, rgb >> 8 & 0xFF, rgb & 0xFF)
+
+    def complete(self, prefix: str) -> List[str]:
+        """
+        All color names starting with a lowercase prefix, in order.
+        """
+        names = self.names
+        found = list()
+        for i in range(bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            found.append(names[i])
+        return found
+
+
+@lru_cache(maxsize=None)
+def color_index() -> ColorIndex:
+    """
+    The shared ColorIndex, built on first use.
+    """
+    return ColorIndex()
+
+
+def __getattr__(name: str):
+    # COLORS used to be a dict of dicts built on import. It is still available for existing
+    # code, but is only built when first asked for.
+    if name == "COLORS":
+        index = color_index()
+        colors = {
+            color: {
+                "ansi": index.ansi[i],
+                "rgb": f"0x{index.rgb[i]:06x}",
+                "xterm": index.xterm[i],
+            }
+            for i, color in enumerate(index.names)
+        }
+        globals()["COLORS"] = colors
+        return colors
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 FG_DOWNGRADE = {
@@ -1,8 +1,11 @@
 import re
 from rich.text import Text
-from ..patches.style import MudStyle, ProtoStyle
-from rich.color import Color
-from typing import Union, List, Tuple
+from rich.style import Style
+from rich.color import Color, ColorSystem, ColorType
+from rich.control import strip_control_codes
+from .base import ProtoStyle, BaseIncrementalDecoder, measurers
+from .base import encode_runs, xterm_color, xterm_digits
+from typing import Union, List, Tuple, Dict, Optional, Iterable
 
 
 LETTERS = {
@@ -17,40 +20,53 @@ LETTERS = {
 }
 
 
-EV_REGEX = {
-    "fg_ansi_bold": re.compile(r"^(r|g|y|b|m|c|x|w)"),
-    "fg_ansi_normal": re.compile(r"^(R|G|Y|B|M|C|X|W)"),
-    "bg_ansi_bold": re.compile(r"^\[(r|g|y|b|m|c|x|w)"),
-    "bg_ansi_normal": re.compile(r"^\[(R|G|Y|B|M|C|X|W)"),
-    "fg_xterm": re.compile(r"^[0-5]{3}"),
-    "bg_xterm": re.compile(r"^\[([0-5]{3})"),
-}
+EV_TOKEN = re.compile(
+    r"\|(?:"
+    r"(?P<sub>[-_/>|])"
+    r"|(?P<reset>[nN])"
+    r"|(?P<style>[hH*u^])"
+    r"|(?P<fg_ansi_bold>[rgybmcxw])"
+    r"|(?P<fg_ansi_normal>[RGYBMCXW])"
+    r"|\[(?P<bg_ansi_bold>[rgybmcxw])"
+    r"|\[(?P<bg_ansi_normal>[RGYBMCXW])"
+    r"|(?P<fg_xterm>[0-5]{3})"
+    r"|\[(?P<bg_xterm>[0-5]{3})"
+    r")?"
+)
+
+# A | at the end of a chunk which could still turn into a longer code.
+EV_PARTIAL = re.compile(r"\|\[?[0-5]{0,2}")
+
+# The same codes as EV_TOKEN, capturing only the character substitutions, for strip().
+EV_STRIP = re.compile(
+    r"\|(?:([-_/>|])|[nNhH*u^rgybmcxwRGYBMCXW]|\[[rgybmcxwRGYBMCXW]|\[?[0-5]{3})?"
+)
 
 
-def apply_fg_ansi_bold(proto: ProtoStyle, code):
+def apply_fg_ansi_bold(proto: ProtoStyle, code: str):
     proto.bold = True
-    proto.color = LETTERS[code.group(0)]
+    proto.color = LETTERS[code]
 
 
-def apply_fg_ansi_normal(proto: ProtoStyle, code):
-    proto.color = LETTERS[code.group(0).lower()]
+def apply_fg_ansi_normal(proto: ProtoStyle, code: str):
+    proto.color = LETTERS[code.lower()]
 
 
-def apply_bg_ansi_bold(proto: ProtoStyle, code):
+def apply_bg_ansi_bold(proto: ProtoStyle, code: str):
     proto.bold = True
-    proto.bgcolor = LETTERS[code.group(0)]
+    proto.bgcolor = LETTERS[code]
 
 
-def apply_bg_ansi_normal(proto: ProtoStyle, code):
-    proto.bgcolor = LETTERS[code.group(0).lower()]
+def apply_bg_ansi_normal(proto: ProtoStyle, code: str):
+    proto.bgcolor = LETTERS[code.lower()]
 
 
-def apply_fg_xterm(proto: ProtoStyle, code):
-    pass
+def apply_fg_xterm(proto: ProtoStyle, code: str):
+    proto.color = xterm_color(code)
 
 
-def apply_bg_xterm(proto: ProtoStyle, code):
-    pass
+def apply_bg_xterm(proto: ProtoStyle, code: str):
+    proto.bgcolor = xterm_color(code)
 
 
 EV_APPLY = {
@@ -81,61 +97,193 @@ def apply_ansi_style(proto: ProtoStyle, code: str):
 CHAR_SUBS = {"-": "\t", "_": " ", "/": "\n", ">": "    ", "|": "|"}
 
 
-def decode(src: str, errors: str = "strict") -> Text:
-    current = ProtoStyle()
-    segment: str = ""
-
-    remaining = src
-    escaped: bool = False
-    segments: List[Tuple[str, MudStyle]] = list()
-
-    while len(remaining):
-        if escaped:
-            if (sub_char := CHAR_SUBS.get(remaining[0], None)) :
-                segment += sub_char
-                remaining = remaining[1:]
-            elif remaining[0] in ("n", "N"):
-                if segment:
-                    segments.append((segment, current.convert()))
-                    segment = ""
-                current = ProtoStyle(parent=current)
-                current.do_reset()
-                remaining = remaining[1:]
-            elif remaining[0] in ("h", "H", "*", "u", "^"):
-                if segment:
-                    segments.append((segment, current.convert()))
-                    segment = ""
-                current = ProtoStyle(parent=current)
-                current.inherit_ansi()
-                apply_ansi_style(current, remaining[0])
-                remaining = remaining[1:]
+class IncrementalDecoder(BaseIncrementalDecoder):
+    def decode_segments(self, src: str, final: bool) -> Tuple[List[Tuple[str, Style]], int]:
+        current = self.current
+        segment: List[str] = list()
+        segments: List[Tuple[str, Style]] = list()
+        pos = 0
+        end = len(src)
+
+        for match in EV_TOKEN.finditer(src):
+            if not final and match.lastgroup is None and EV_PARTIAL.fullmatch(src, match.start()):
+                # This might be the start of a code which was cut off, so wait for the rest of it.
+                end = match.start()
+                break
+            segment.append(src[pos : match.start()])
+            pos = match.end()
+            kind = match.lastgroup
+            if kind is None:
+                # A | that isn't followed by anything we understand is simply dropped.
+                continue
+            code = match.group(kind)
+            if kind == "sub":
+                segment.append(CHAR_SUBS[code])
+                continue
+
+            # Everything else changes the style, so close out the current segment first.
+            text = "".join(segment)
+            if text:
+                segments.append((text, current.convert()))
+            segment.clear()
+            if kind == "reset":
+                current = ProtoStyle()
             else:
-                for name, pattern in EV_REGEX.items():
-                    if (match := pattern.match(remaining)) :
-                        if segment:
-                            segments.append((segment, current.convert()))
-                            segment = ""
-                        current = ProtoStyle(parent=current)
-                        current.inherit_ansi()
-                        EV_APPLY[name](current, match)
-                        remaining = remaining[match.end(0) :]
-                        break
-            escaped = False
+                current = current.copy()
+                if kind == "style":
+                    apply_ansi_style(current, code)
+                else:
+                    EV_APPLY[kind](current, code)
+
+        segment.append(src[pos:end])
+        text = "".join(segment)
+        if text:
+            segments.append((text, current.convert()))
+
+        self.current = current
+        return segments, end
+
+
+def decode(src: str, errors: str = "strict") -> Text:
+    return IncrementalDecoder(errors).decode(src, final=True)
+
+
+def decode_many(
+    sources: Iterable[str], errors: str = "strict", separator: Optional[str] = None
+) -> Union[List[Text], Text]:
+    """
+    Decode many pieces of markup at once, sharing one decoder between them. See
+    BaseIncrementalDecoder.decode_many.
+    """
+    return IncrementalDecoder(errors).decode_many(sources, separator)
+
+
+def strip(src: str, errors: str = "strict") -> str:
+    """
+    decode(src).plain, by removing codes and substituting the characters some stand for.
+    """
+    if "|" in src:
+        # The text between codes alternates with each code's substitution, None for the rest.
+        parts = EV_STRIP.split(src)
+        parts[1::2] = map(CHAR_SUBS.get, parts[1::2])
+        src = "".join(filter(None, parts))
+    return strip_control_codes(src)
+
+
+plain_len, cell_len = measurers(strip)
+
+
+# Every color code and flag, each reset straight away, so that their Styles get interned.
+WARMUP = "".join(f"|{c}x|n|[{c}x|n" for c in "rgybmcxwRGYBMCXW") + "|hx|n|*x|n|ux|n|^x|n"
+
+
+def warmup():
+    decode(WARMUP)
+
+
+LETTERS_REVERSE = {v.number: k for k, v in LETTERS.items()}
+
+# The flags Evennia can turn on, and the codes for doing so. Only bold can be turned off again.
+FLAG_CODES = {"reverse": "|*", "underline": "|u", "blink": "|^"}
+
+
+def serialize_color(color: Optional[Color]) -> Optional[str]:
+    """
+    Convert a Color into the part of an Evennia code following | or |[. Colors outside of the
+    eight ANSI colors and the xterm color cube are downgraded to the nearest one of those.
+    """
+    if color is None or color.type == ColorType.DEFAULT:
+        return None
+    if color.type == ColorType.STANDARD and color.number in LETTERS_REVERSE:
+        return LETTERS_REVERSE[color.number].upper()
+    if color.triplet is not None:
+        from .palette import rgb_to_xterm
+
+        color = Color.from_ansi(rgb_to_xterm(*color.triplet))
+    elif color.type != ColorType.EIGHT_BIT:
+        color = color.downgrade(ColorSystem.EIGHT_BIT)
+    number = color.number
+    if number < 16:
+        return LETTERS_REVERSE[number % 8].upper()
+    if number > 231:
+        return serialize_color(color.downgrade(ColorSystem.STANDARD))
+    return xterm_digits(number)
+
+
+def is_bright(color: Optional[Color]) -> bool:
+    """
+    Whether a color is one of the eight bright ANSI colors, which Evennia only has as the bold
+    variants of the others.
+    """
+    return (
+        color is not None
+        and color.type in (ColorType.STANDARD, ColorType.EIGHT_BIT)
+        and 8 <= color.number < 16
+    )
+
+
+def style_state(style: Optional[Style]) -> Dict[str, object]:
+    """
+    Reduce a Style to what Evennia codes can express: the enabled flags, and codes for colors.
+    """
+    state = dict()
+    if not style:
+        return state
+    for flag in ("bold",) + tuple(FLAG_CODES.keys()):
+        if getattr(style, flag):
+            state[flag] = True
+    if (fg := serialize_color(style.color)) :
+        state["color"] = fg
+        if is_bright(style.color):
+            # Written as the lowercase letter, which is the color with bold.
+            state["bold"] = True
+    if (bg := serialize_color(style.bgcolor)) :
+        state["bgcolor"] = bg
+    return state
+
+
+def style_codes(state: Dict[str, object], base: Dict[str, object]) -> str:
+    """
+    The codes needed to get from the base state to the target state, assuming nothing has to be
+    turned off except bold.
+    """
+    out = list()
+    bold_on = state.get("bold", False) and not base.get("bold", False)
+    if base.get("bold", False) and not state.get("bold", False):
+        out.append("|H")
+    if (fg := state.get("color", None)) and fg != base.get("color", None):
+        if bold_on and fg.isalpha():
+            # lowercase letters are the bright colors, which turn on bold too.
+            out.append(f"|{fg.lower()}")
+            bold_on = False
         else:
-            loc = remaining.find("|")
-            if loc != -1:
-                segment += remaining[:loc]
-                remaining = remaining[loc + 1 :]
-                escaped = True
-            else:
-                segment += remaining
-                remaining = ""
+            out.append(f"|{fg}")
+    if bold_on:
+        out.append("|h")
+    if (bg := state.get("bgcolor", None)) and bg != base.get("bgcolor", None):
+        out.append(f"|[{bg}")
+    for flag, code in FLAG_CODES.items():
+        if flag in state and flag not in base:
+            out.append(code)
+    return "".join(out)
+
+
+def transition(base: Dict[str, object], state: Dict[str, object]) -> str:
+    """
+    The shortest run of codes leading from one state to another, either by adding to the current
+    state or by resetting it with |n and starting over.
+    """
+    full = "|n" + style_codes(state, dict())
+    if all(k in state or k == "bold" for k in base):
+        delta = style_codes(state, base)
+        if len(delta) <= len(full):
+            return delta
+    return full
 
-    if segment:
-        segments.append((segment, current.convert()))
 
-    return Text.assemble(*[(t, s) for t, s in segments])
+def escape(text: str) -> str:
+    return text.replace("|", "||")
 
 
-def encode(src: Text) -> str:
-    return ""
+def encode(src: Text, errors: str = "strict") -> str:
+    return encode_runs(src, style_state, transition, escape, "|n")
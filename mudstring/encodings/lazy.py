@@ -0,0 +1,113 @@
+from typing import Optional, Tuple, Union
+from rich.text import Text
+
+from . import lookup
+from .base import cell_width
+
+
+class LazyText:
+    """
+    Markup which is only decoded once its styles are needed. Much output is passed around and
+    then only checked for its length or content before being thrown away, such as by spam
+    checks and channel filters; those are answered from the plain text, which the codec's
+    strip() gets without building any styles.
+
+    Rendering it, slicing it, adding to it or using any other attribute of Text decodes it with
+    the codec's decode(), once, and from then on everything is answered from the decoded Text.
+    That Text is shared, so changing it changes this too.
+
+    Equal LazyTexts decode to equal Texts. Comparing them is answered from the source, or from
+    the plain text when the sources differ, and only decodes when the plain text is the same.
+    """
+
+    __slots__ = ("source", "codec", "errors", "_plain", "_text")
+
+    def __init__(self, source: str, codec: str = "pennmush", errors: str = "strict"):
+        self.source = source
+        self.codec = codec
+        self.errors = errors
+        self._plain: Optional[str] = None
+        self._text: Optional[Text] = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._text is not None
+
+    @property
+    def text(self) -> Text:
+        """
+        The decoded Text, decoding it on first use.
+        """
+        if self._text is None:
+            self._text = lookup(self.codec).decode(self.source, errors=self.errors)
+        return self._text
+
+    @property
+    def plain(self) -> str:
+        if self._text is not None:
+            return self._text.plain
+        if self._plain is None:
+            self._plain = lookup(self.codec).strip(self.source, errors=self.errors)
+        return self._plain
+
+    @property
+    def cell_len(self) -> int:
+        return cell_width(self.plain)
+
+    def startswith(self, prefix: Union[str, Tuple[str, ...]]) -> bool:
+        return self.plain.startswith(prefix)
+
+    def endswith(self, suffix: Union[str, Tuple[str, ...]]) -> bool:
+        return self.plain.endswith(suffix)
+
+    def __len__(self) -> int:
+        return len(self.plain)
+
+    def __bool__(self) -> bool:
+        return bool(self.plain)
+
+    def __str__(self) -> str:
+        return self.plain
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.codec} {self.source!r}>"
+
+    def __contains__(self, other: Union[str, Text, "LazyText"]) -> bool:
+        if isinstance(other, str):
+            return other in self.plain
+        return other.plain in self.plain
+
+    def __hash__(self) -> int:
+        return hash(self.plain)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyText):
+            if other.source == self.source and other.codec == self.codec:
+                return True
+            if other.plain != self.plain:
+                return False
+            return other.text == self.text
+        if isinstance(other, Text):
+            return other.plain == self.plain and other == self.text
+        return NotImplemented
+
+    def __getitem__(self, key: Union[int, slice]) -> Text:
+        return self.text[key]
+
+    def __add__(self, other: Union[str, Text, "LazyText"]) -> Text:
+        if isinstance(other, LazyText):
+            other = other.text
+        return self.text + other
+
+    def __rich_console__(self, console, options):
+        return self.text.__rich_console__(console, options)
+
+    def __rich_measure__(self, console, options):
+        return self.text.__rich_measure__(console, options)
+
+    def __getattr__(self, name: str):
+        # Only called for what isn't defined here: anything else Text has needs decoding. Slots
+        # which aren't set yet, such as while unpickling, mustn't decode.
+        if name.startswith("__") or name in LazyText.__slots__:
+            raise AttributeError(name)
+        return getattr(self.text, name)
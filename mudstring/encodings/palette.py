@@ -0,0 +1,87 @@
+from typing import Tuple
+from .colors import FG_DOWNGRADE, BG_DOWNGRADE
+
+
+# The xterm color cube level (0-5) nearest to each 0-255 channel value, rounded exactly as rich's
+# Color.downgrade does.
+CUBE_LEVELS = tuple(round(v / 95 if v < 95 else 1 + (v - 95) / 40) for v in range(256))
+
+# xterm color number -> (bold, SGR code 30-37), as lists for plain indexing.
+FG_ANSI = [FG_DOWNGRADE[i] for i in range(256)]
+BG_ANSI = [BG_DOWNGRADE[i] for i in range(256)]
+
+
+def rgb_to_xterm(red: int, green: int, blue: int) -> int:
+    """
+    The xterm 256 color number for an RGB color. The result is the same as rich's
+    Color.downgrade(ColorSystem.EIGHT_BIT), without the per-color object and cache overhead.
+    """
+    maxc = max(red, green, blue) / 255.0
+    minc = min(red, green, blue) / 255.0
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    # Nearly unsaturated colors go to the grayscale ramp, as in colorsys.rgb_to_hls.
+    if not rangec or (rangec / sumc if l <= 0.5 else rangec / (2.0 - maxc - minc)) < 0.15:
+        gray = round(l * 25.0)
+        if gray == 0:
+            return 16
+        return 231 + gray if gray < 25 else 231
+    return 16 + 36 * CUBE_LEVELS[red] + 6 * CUBE_LEVELS[green] + CUBE_LEVELS[blue]
+
+
+def xterm_to_ansi(number: int, bg: bool = False) -> Tuple[bool, int]:
+    """
+    The (bold, code) pair of the 16 color ANSI approximation of an xterm color number, with
+    codes in the 30-37 range for both foreground and background.
+    """
+    return (BG_ANSI if bg else FG_ANSI)[number]
+
+
+def rgb_to_ansi(red: int, green: int, blue: int, bg: bool = False) -> Tuple[bool, int]:
+    """
+    The (bold, code) pair for an RGB color, going through its xterm 256 color number.
+    """
+    return (BG_ANSI if bg else FG_ANSI)[rgb_to_xterm(red, green, blue)]
+
+
+def rgb_to_xterm_array(rgb):
+    """
+    Vectorized rgb_to_xterm for a NumPy array of shape (..., 3) holding 0-255 RGB values.
+    Requires NumPy, which mudstring doesn't otherwise depend on.
+
+    Returns:
+        numbers (ndarray): The xterm color numbers, of shape (...).
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.intp)
+    levels = np.array(CUBE_LEVELS, dtype=np.intp)[rgb]
+    cube = 16 + 36 * levels[..., 0] + 6 * levels[..., 1] + levels[..., 2]
+
+    maxc = rgb.max(axis=-1) / 255.0
+    minc = rgb.min(axis=-1) / 255.0
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sat = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    gray = np.rint(l * 25.0).astype(np.intp)
+    ramp = np.where(gray == 0, 16, np.where(gray == 25, 231, 231 + gray))
+    return np.where((rangec == 0) | (sat < 0.15), ramp, cube)
+
+
+def rgb_to_ansi_array(rgb, bg: bool = False):
+    """
+    Vectorized rgb_to_ansi for a NumPy array of shape (..., 3) holding 0-255 RGB values.
+    Requires NumPy.
+
+    Returns:
+        bold (ndarray): Whether each color is the bright variant, of shape (...).
+        codes (ndarray): The SGR codes, 30-37, of shape (...).
+    """
+    import numpy as np
+
+    table = np.array(BG_ANSI if bg else FG_ANSI, dtype=np.intp)
+    found = table[rgb_to_xterm_array(rgb)]
+    return found[..., 0].astype(bool), found[..., 1]
@@ -1,26 +1,39 @@
 from rich.style import Style
-from .base import ProtoStyle
+from .base import ProtoStyle, BaseIncrementalDecoder, style_runs, escape_mxp, measurers
+from rich.control import strip_control_codes
 
-from .colors import COLORS
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Dict, Optional, Iterable
 from rich.text import Text, Span
-from rich.color import Color
-import html
+from rich.color import Color, ColorType
 import re
 from enum import IntFlag, IntEnum
-from xml.etree import ElementTree
-
-
-ANSI_SECTION_MATCH = {
-    "letters": re.compile(r"^(?P<data>[a-z ]+)\b", flags=re.IGNORECASE),
-    "numbers": re.compile(r"^(?P<data>\d+)\b"),
-    "rgb": re.compile(
-        r"^<(?P<red>\d{1,3})\s+(?P<green>\d{1,3})\s+(?P<blue>\d{1,3})>(\b)?"
-    ),
-    "hex1": re.compile(r"^#(?P<data>[0-9A-F]{6})\b", flags=re.IGNORECASE),
-    "hex2": re.compile(r"^<#(?P<data>[0-9A-F]{6})>(\b)?", flags=re.IGNORECASE),
-    "name": re.compile(r"^\+(?P<data>\w+)\b", flags=re.IGNORECASE),
-}
+from functools import lru_cache
+
+
+ANSI_SECTIONS = (
+    r"(?P<letters>[a-z\s]+)\b",
+    r"(?P<numbers>\d+)\b",
+    r"(?P<rgb><(?P<red>\d{1,3})\s+(?P<green>\d{1,3})\s+(?P<blue>\d{1,3})>)",
+    r"(?P<hex1>#(?P<hex1_data>[0-9a-f]{6}))\b",
+    r"(?P<hex2><#(?P<hex2_data>[0-9a-f]{6})>)",
+    r"(?P<name>\+(?P<name_data>\w+))\b",
+)
+
+# Letters are not allowed immediately following a /, so backgrounds get their own tokenizer.
+ANSI_FG_TOKEN = re.compile("|".join(ANSI_SECTIONS), flags=re.IGNORECASE)
+ANSI_BG_TOKEN = re.compile("|".join(ANSI_SECTIONS[1:]), flags=re.IGNORECASE)
+
+
+TAG_START = "\002"
+TAG_END = "\003"
+
+# The most of an unterminated tag held back between chunks while waiting for its TAG_END. Past
+# that, its data is dropped as it arrives so that pending can't grow without limit; the tag still
+# opens or closes a style once its TAG_END comes, but without its codes.
+MAX_PENDING_TAG = 2048
+
+# A whole tag, or an unterminated one, which decode drops along with everything after it.
+TAG_STRIP = re.compile(r"\002(?:.[^\003]*\003|.*)", flags=re.DOTALL)
 
 
 STYLE_REVERSE = {1: "h", 2: "i", 4: "f", 8: "u"}
@@ -39,7 +52,7 @@ class BgMode(IntEnum):
     BG = 2
 
 
-CHAR_MAP = {"f": "flash", "h": "bold", "i": "reverse", "u": "underline"}
+CHAR_MAP = {"f": "blink", "h": "bold", "i": "reverse", "u": "underline"}
 
 
 BASE_COLOR_MAP = {
@@ -56,87 +69,66 @@ BASE_COLOR_MAP = {
 
 BASE_COLOR_REVERSE = {v: k for k, v in BASE_COLOR_MAP.items()}
 
-
-def _process_ground(
-    codes: str, bg: bool = False
-) -> Tuple[str, Tuple[str, BgMode, object, object]]:
-    matched = False
-    ground = BgMode.BG if bg else BgMode.FG
-    for k, v in ANSI_SECTION_MATCH.items():
-        if k == "letters" and ground == BgMode.BG:
-            # Letters are not allowed immediately following a /
-            continue
-        if (match := v.match(codes)) :
-            codes = codes[match.end() :]
-            matched = True
-            if k == "letters" and ground != BgMode.BG:
-                # Letters are not allowed immediately following a /
-                return codes, (
-                    k,
-                    BgMode.NONE,
-                    match.groupdict()["data"],
-                    match.group(0),
-                )
-            if k == "numbers":
-                data = match.groupdict()["data"]
-                number = abs(int(data))
-                if number > 255 or number < 0:
-                    raise ValueError(match.group(0))
-                return codes, (k, ground, number, match.group(0))
-            if k == "name":
-                return codes, (
-                    k,
-                    ground,
-                    match.groupdict()["data"].lower(),
-                    match.group(0),
-                )
-            elif k in ("hex1", "hex2"):
-                data = match.groupdict()["data"]
-                out = {
-                    "red": int(data[0:2], 16),
-                    "green": int(data[2:4], 16),
-                    "blue": int(data[4:6], 16),
-                }
-                return codes, (k, ground, out, match.group(0))
-            elif k == "rgb":
-                data = match.groupdict()
-                # hex = f"#{int(data['red']):2X}{int(data['green']):2X}{int(data['blue']):2X}"
-                data = {k: int(v) for k, v in data.items()}
-                print(f"DATA IS: {data}")
-                return codes, (k, ground, data, match.group(0))
-    if not matched:
-        raise ValueError(codes)
+CHAR_REVERSE = {v: k for k, v in CHAR_MAP.items()}
+
+# The Style attributes which PennMUSH color codes can express.
+COLOR_ATTRS = ("bold", "reverse", "blink", "underline", "color", "bgcolor")
+
+
+def _process_ground(match: re.Match, ground: BgMode) -> Tuple[str, BgMode, object, str]:
+    k = match.lastgroup
+    if k == "letters":
+        return k, BgMode.NONE, match.group(k), match.group(0)
+    if k == "numbers":
+        number = int(match.group(k))
+        if number > 255:
+            raise ValueError(match.group(0))
+        return k, ground, number, match.group(0)
+    if k == "name":
+        return k, ground, match.group("name_data").lower(), match.group(0)
+    if k == "rgb":
+        data = {c: int(match.group(c)) for c in ("red", "green", "blue")}
+        return k, ground, data, match.group(0)
+    # hex1 and hex2
+    data = match.group(f"{k}_data")
+    out = {
+        "red": int(data[0:2], 16),
+        "green": int(data[2:4], 16),
+        "blue": int(data[4:6], 16),
+    }
+    return k, ground, out, match.group(0)
 
 
 def separate_codes(codes: str, errors: str = "strict"):
-    codes = " ".join(codes.split())
-
-    while len(codes):
-        if codes[0] in ("/", "!"):
-            codes = codes[1:]
-            if not len(codes):
+    pos = 0
+    end = len(codes)
+
+    while pos < end:
+        c = codes[pos]
+        if c in ("/", "!"):
+            pos += 1
+            if pos == end:
                 # if there's nothing after a / then we just break.
                 break
-            if codes[0].isspace():
-                codes = codes[1:]
+            c = codes[pos]
+            if c.isspace():
                 # if a space immediately follows a / , then it is treated as no color.
                 # it will be ignored.
+                pos += 1
                 continue
-            elif codes[0] in ("/", "!"):
+            elif c in ("/", "!"):
                 continue
-            else:
-                remaining, result = _process_ground(codes, True)
-                codes = remaining
-                yield result
-
-        elif codes[0].isspace():
-            codes = codes[1:]
+            token, ground = ANSI_BG_TOKEN, BgMode.BG
+        elif c.isspace():
+            pos += 1
             continue
         else:
-            remaining, result = _process_ground(codes, False)
-            codes = remaining
-            yield result
-            matched = False
+            token, ground = ANSI_FG_TOKEN, BgMode.FG
+
+        if not (match := token.match(codes, pos)):
+            raise ValueError(codes[pos:])
+        pos = match.end()
+        yield _process_ground(match, ground)
 
 
 def test_separate(codes: str):
@@ -144,6 +136,10 @@ def test_separate(codes: str):
         print(code)
 
 
+def _base_color(code: int) -> Color:
+    return Color.default() if code < 0 else Color.from_ansi(code)
+
+
 def apply_color_rule(mark: ProtoStyle, rule_tuple):
     mode, g, data, original = rule_tuple
     if mode == "letters":
@@ -157,10 +153,10 @@ def apply_color_rule(mark: ProtoStyle, rule_tuple):
                 setattr(mark, bit, True)
             elif (bit := CHAR_MAP.get(c.lower(), None)) :
                 setattr(mark, bit, False)
-            elif (code := BASE_COLOR_MAP.get(c, None)) :
-                setattr(mark, "color", Color.from_ansi(code))
-            elif (code := BASE_COLOR_MAP.get(c.lower(), None)) :
-                setattr(mark, "bgcolor", Color.from_ansi(code))
+            elif (code := BASE_COLOR_MAP.get(c, None)) is not None:
+                setattr(mark, "color", _base_color(code))
+            elif (code := BASE_COLOR_MAP.get(c.lower(), None)) is not None:
+                setattr(mark, "bgcolor", _base_color(code))
             else:
                 pass  # I dunno what we got passed, but it ain't relevant.
 
@@ -168,8 +164,10 @@ def apply_color_rule(mark: ProtoStyle, rule_tuple):
         if mode == "numbers":
             setattr(mark, "color", Color.from_ansi(data))
         elif mode == "name":
-            if (found := COLORS.get(data)) :
-                setattr(mark, "color", Color.from_ansi(found["xterm"]))
+            from .colors import color_index
+
+            if (found := color_index().color(data)) is not None:
+                setattr(mark, "color", found)
         elif mode in ("rgb", "hex1", "hex2"):
             setattr(
                 mark, "color", Color.from_rgb(data["red"], data["green"], data["blue"])
@@ -178,8 +176,10 @@ def apply_color_rule(mark: ProtoStyle, rule_tuple):
         if mode == "numbers":
             setattr(mark, "bgcolor", Color.from_ansi(data))
         elif mode == "name":
-            if (found := COLORS.get(data)) :
-                setattr(mark, "bgcolor", Color.from_ansi(found["xterm"]))
+            from .colors import color_index
+
+            if (found := color_index().color(data)) is not None:
+                setattr(mark, "bgcolor", found)
         elif mode in ("rgb", "hex1", "hex2"):
             setattr(
                 mark,
@@ -193,206 +193,377 @@ def apply_rules(mark: ProtoStyle, rules: str):
         apply_color_rule(mark, res)
 
 
-def apply_mxp(mark: ProtoStyle, rules: str):
-    if " " in rules:
-        before, after = rules.split(" ", 1)
-        x = f"<{before} {after}></{before}>"
+# The characters a name may start with, as XML 1.0 defines them, and those it may go on with.
+# Colons are left out: they would be namespace prefixes, which tags never declare.
+MXP_NAME_START = (
+    r"A-Z_a-z\xC0-\xD6\xD8-\xF6\xF8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C\u200D\u2070-\u218F"
+    r"\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\U00010000-\U000EFFFF"
+)
+MXP_NAME_CHAR = MXP_NAME_START + r"\-.0-9\xB7\u0300-\u036F\u203F\u2040"
+MXP_NAME = r"[%s][%s]*" % (MXP_NAME_START, MXP_NAME_CHAR)
+MXP_WHITESPACE = str.maketrans("\t\n\r", "   ")
+# The five entities XML predefines and numeric character references; any other & is an error.
+MXP_REFERENCE = re.compile(
+    r"&(?:(?P<entity>amp|lt|gt|quot|apos)|#(?P<dec>[0-9]+)|#x(?P<hex>[0-9a-fA-F]+));|&"
+)
+MXP_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+
+
+@lru_cache(maxsize=None)
+def mxp_patterns() -> Tuple[re.Pattern, re.Pattern]:
+    """
+    The patterns for a tag's name and for each of its attributes, compiled on first use. Their
+    Unicode classes take milliseconds to compile, and most output has no MXP.
+    """
+    tag = re.compile(r"(?P<tag>%s)" % MXP_NAME)
+    attr = re.compile(
+        r"[ \t\r\n]+(?P<name>%s)[ \t\r\n]*=[ \t\r\n]*"
+        r"(?:\"(?P<dq>[^\"<]*)\"|'(?P<sq>[^'<]*)')" % MXP_NAME
+    )
+    return tag, attr
+
+
+def mxp_error(rules: str) -> Exception:
+    """
+    The error for malformed MXP tag data: ElementTree's ParseError, which callers caught when tags
+    were parsed with it. ElementTree is only imported once there is an error to raise.
+    """
+    from xml.etree.ElementTree import ParseError
+
+    return ParseError(rules)
+
+
+def unescape_reference(match: re.Match) -> str:
+    if (entity := match.group("entity")) :
+        return MXP_ENTITIES[entity]
+    if (dec := match.group("dec")) :
+        number = int(dec)
+    elif (hexa := match.group("hex")) :
+        number = int(hexa, 16)
     else:
-        x = f"<{rules}></{rules}>"
-    elem = ElementTree.fromstring(x)
-    mark.tag = elem.tag
-    mark.xml_attr = elem.attrib
-
-
-def serialize_colors(s: Style) -> str:
-    if c.reset:
-        return "n"
-
-    output = ""
-    for k, v in STYLE_REVERSE.items():
-        if k & c.bits:
-            output += v
-        if k & c.off_bits:
-            output += v.upper()
-    if c.fg_mode == 0:
-        output += BASE_COLOR_REVERSE.get(c.fg_color)
-    if c.bg_mode == 0:
-        output += BASE_COLOR_REVERSE.get(c.bg_color).upper()
-
-    letters = bool(output)
-
-    if c.fg_mode == 1:
-        if letters:
-            output += " "
-        output += str(c.fg_color)
-    if c.bg_mode == 1:
-        output += f"/{c.bg_color}"
-    return output
-
-
-def enter_tag(s: Style) -> str:
-    if isinstance(m, ColorMarkup):
-        return f"{TAG_START}c{serialize_colors(m)}{TAG_END}"
-    elif isinstance(m, MXPMarkup):
-        if m.attributes:
-            attrs = " ".join(
-                [f'{k}="{html.escape(v)}"' for k, v in m.attributes.items()]
-            )
-            return f"{TAG_START}p{m.tag} {attrs}{TAG_END}"
+        raise mxp_error(match.string)
+    # Only the characters XML allows in a document may be referred to.
+    if not (
+        number in (0x9, 0xA, 0xD)
+        or 0x20 <= number <= 0xD7FF
+        or 0xE000 <= number <= 0xFFFD
+        or 0x10000 <= number <= 0x10FFFF
+    ):
+        raise mxp_error(match.string)
+    return chr(number)
+
+
+@lru_cache(maxsize=512)
+def parse_mxp(rules: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Parse the data of a PennMUSH MXP tag, such as 'send href="look" hint="Look around"', into its
+    tag name and attributes. Attribute values may be single or double quoted, and have their line
+    endings and whitespace normalized and their references unescaped as an XML parser would.
+    Malformed data raises ElementTree's ParseError. Names may use any letters XML 1.0 allows,
+    which include some newer ones that ElementTree's expat doesn't accept yet.
+
+    Results are cached and shared, so the returned dict must not be modified.
+    """
+    mxp_tag, mxp_attr = mxp_patterns()
+    if not (match := mxp_tag.match(rules)):
+        raise mxp_error(rules)
+    attrs = dict()
+    pos = match.end()
+    while (attr := mxp_attr.match(rules, pos)) :
+        name = attr.group("name")
+        # The tag name is everything up to the first space, so one must come before attributes.
+        if name in attrs or (not attrs and " " not in rules[pos : attr.start("name")]):
+            raise mxp_error(rules)
+        value = attr.group("dq")
+        if value is None:
+            value = attr.group("sq")
+        value = value.replace("\r\n", "\n").translate(MXP_WHITESPACE)
+        if "&" in value:
+            value = MXP_REFERENCE.sub(unescape_reference, value)
+        attrs[name] = value
+        pos = attr.end()
+    if rules[pos:].strip(" \t\r\n"):
+        raise mxp_error(rules)
+    return match.group("tag"), attrs
+
+
+def apply_mxp(mark: ProtoStyle, rules: str):
+    mark.tag, mark.xml_attr = parse_mxp(rules)
+
+
+def serialize_color(color: Color, bg: bool = False) -> Tuple[bool, str]:
+    """
+    Convert a Color into a PennMUSH code.
+
+    Returns:
+        letter, code (Tuple[bool, str]): Whether the code is a letter, and the code itself.
+    """
+    if color.type == ColorType.DEFAULT:
+        return True, "D" if bg else "d"
+    if color.type == ColorType.STANDARD and color.number in BASE_COLOR_REVERSE:
+        code = BASE_COLOR_REVERSE[color.number]
+        return True, code.upper() if bg else code
+    if color.triplet:
+        return False, "#%02x%02x%02x" % color.triplet
+    return False, str(color.number)
+
+
+def serialize_colors(attrs: Dict[str, object]) -> str:
+    """
+    Turn a dictionary of color attributes (as made by style_state) into the data for a color tag.
+    """
+    letters = list()
+    for attr, code in CHAR_REVERSE.items():
+        if (value := attrs.get(attr, None)) is not None:
+            letters.append(code if value else code.upper())
+    fg = bg = ""
+    if (color := attrs.get("color", None)) is not None:
+        letter, fg = serialize_color(color)
+        if letter:
+            letters.append(fg)
+            fg = ""
+    if (color := attrs.get("bgcolor", None)) is not None:
+        letter, bg = serialize_color(color, bg=True)
+        if letter:
+            letters.append(bg)
+            bg = ""
         else:
-            return f"{TAG_START}p{m.tag}{TAG_END}"
-    else:
-        return ""
+            bg = f"/{bg}"
+    output = "".join(letters)
+    if fg and output:
+        output += " "
+    output += fg
+    if not output and bg:
+        # Tag data starting with a / would be read as a closing tag.
+        output = " "
+    return output + bg
+
+
+def style_state(style: Optional[Style]) -> Tuple[Optional[Tuple], Dict[str, object]]:
+    """
+    Split a Style into the parts PennMUSH markup can express: the MXP tag (if any) and a
+    dictionary of the color attributes which are set.
+    """
+    if not style:
+        return None, dict()
+    mxp = None
+    if (tag := getattr(style, "tag", None)) :
+        attrs = getattr(style, "xml_attr", None) or dict()
+        mxp = (tag, tuple(attrs.items()))
+    colors = dict()
+    for attr in COLOR_ATTRS:
+        if (value := getattr(style, attr)) is not None:
+            colors[attr] = value
+    return mxp, colors
 
 
-def exit_tag(s: Style) -> str:
-    if isinstance(m, ColorMarkup):
-        return f"{TAG_START}c/{TAG_END}"
-    elif isinstance(m, MXPMarkup):
-        return f"{TAG_START}p/{TAG_END}"
-    else:
-        return ""
+def enter_tag(kind: str, data) -> str:
+    if kind == "p":
+        tag, attrs = data
+        if attrs:
+            attrs = " ".join(f'{k}="{escape_mxp(v)}"' for k, v in attrs)
+            return f"{TAG_START}p{tag} {attrs}{TAG_END}"
+        return f"{TAG_START}p{tag}{TAG_END}"
+    return f"{TAG_START}c{serialize_colors(data)}{TAG_END}"
+
+
+def exit_tag(kind: str) -> str:
+    return f"{TAG_START}{kind}/{TAG_END}"
 
 
 def encode(mstring: Text, errors: str = "strict") -> str:
-    output = ""
-    tag_stack = list()
-    cur = None
-
-    for i, span in enumerate(mstring.spans):
-        if isinstance(span.style, Style):
-            if cur:
-                # we are already inside of a markup!
-                if span.style is cur:
-                    pass
-                else:
-                    # moving to a different markup.
-                    if span.style.parent is cur:
-                        # we moved into a child.
-                        output += enter_tag(span.style)
-                        tag_stack.append(span.style)
-                    else:
-                        # We left a tag and are moving into another kind of tag. It might be a parent, an ancestor,
-                        # or completely unrelated. Let's find out which, first!
-                        ancestors = cur.ancestors(reversed=True)
-                        idx = None
-
-                        if span.style in tag_stack:
-                            # We need to close out of the ancestors we no longer have. A slice accomplishes that.
-                            tags_we_left = ancestors[tag_stack.index(span.style) :]
-                            for i in range(len(tags_we_left) - 1):
-                                tag_stack.pop(-1)
-
-                            # now that we know what to leave, let's leave them.
-
-                            for tag in reversed(tags_we_left):
-                                output += exit_tag(tag)
-
-                        else:
-                            # it's not an ancestor at all, so close out of everything and rebuild.
-                            for tag in reversed(tag_stack):
-                                output += exit_tag(tag)
-                            tag_stack.clear()
-
-                            # Now to enter the new tag...
-
-                            for ancestor in span.style.ancestors(reversed=True):
-                                output += enter_tag(ancestor)
-                                tag_stack.append(ancestor)
-                            output += enter_tag(span.style)
-                            tag_stack.append(span.style)
-
-                    cur = span.style
+    output: List[str] = list()
+    plain = mstring.plain
+    # Each entry is (tag kind, mxp state, color state) after that tag was entered.
+    tag_stack: List[Tuple[str, Optional[Tuple], Dict[str, object]]] = list()
+    mxp, colors = None, dict()
+    states: Dict[int, Tuple[Optional[Tuple], Dict[str, object]]] = dict()
+
+    for start, end, style in style_runs(mstring):
+        if (state := states.get(id(style), None)) is None:
+            state = states[id(style)] = style_state(style)
+        want_mxp, want_colors = state
+
+        if want_mxp != mxp or want_colors != colors:
+            # Leave tags until we reach one the new style can be built on by only adding to it.
+            while tag_stack:
+                _, mxp, colors = tag_stack[-1]
+                if (mxp is None or mxp == want_mxp) and all(
+                    want_colors.get(k, None) == v for k, v in colors.items()
+                ):
+                    break
+                output.append(exit_tag(tag_stack.pop()[0]))
             else:
-                # We are not inside of a markup tag. Well, that changes now.
-                cur = span.style
+                mxp, colors = None, dict()
 
-                for ancestor in span.style.ancestors(reversed=True):
-                    tag_stack.append(ancestor)
-                tag_stack.append(span.style)
+            if want_mxp is not None and mxp != want_mxp:
+                # MXP tags start over from no colors.
+                mxp, colors = want_mxp, dict()
+                output.append(enter_tag("p", mxp))
+                tag_stack.append(("p", mxp, colors))
+            if (delta := {k: v for k, v in want_colors.items() if colors.get(k, None) != v}) :
+                colors = want_colors
+                output.append(enter_tag("c", delta))
+                tag_stack.append(("c", mxp, colors))
 
-                for tag in tag_stack:
-                    output += enter_tag(tag)
+        output.append(plain[start:end])
 
-        else:
-            # we are moving into a None markup...
-            if cur:
-                for tag in reversed(tag_stack):
-                    output += exit_tag(tag)
-                tag_stack.clear()
-                cur = None
+    # Finalize and exit all remaining tags.
+    for kind, _, _ in reversed(tag_stack):
+        output.append(exit_tag(kind))
+
+    return "".join(output)
+
+
+class IncrementalDecoder(BaseIncrementalDecoder):
+    def reset(self):
+        super().reset()
+        self.stack: List[ProtoStyle] = list()
+        # How much of an unterminated tag at the start of pending has been searched for its end.
+        self.searched = 0
+        # The tag type of an over-long tag whose data is being dropped, and whether it closes.
+        self.skipping: Optional[Tuple[str, bool]] = None
+
+    def decode_segments(self, src: str, final: bool) -> Tuple[List[Tuple[str, Style]], int]:
+        current = self.current
+        stack = self.stack
+        segments: List[Tuple[str, Style]] = list()
+        pos = 0
+        end = len(src)
+        searched = self.searched
+        self.searched = 0
+
+        if self.skipping is not None:
+            idx_end = src.find(TAG_END)
+            if idx_end == -1:
+                if final:
+                    self.skipping = None
+                return segments, end
+            tag, closing = self.skipping
+            self.skipping = None
+            pos = idx_end + 1
+            if closing:
+                if stack:
+                    current = stack.pop()
             else:
-                # from no markup to no markup. Just append the character.
-                pass
+                stack.append(current)
+                current = current.copy() if tag == "c" else ProtoStyle()
+
+        while pos < end:
+            idx_start = src.find(TAG_START, pos)
+            if idx_start == -1:
+                segments.append((src[pos:], current.convert()))
+                pos = end
+                break
+            if idx_start > pos:
+                segments.append((src[pos:idx_start], current.convert()))
+            pos = idx_start
 
-        # Then append this span's text
-        output += mstring.plain[span.start : span.end]
+            # encountered a TAG START. The next character is the tag type, then we hoover up all data up to TAG_END...
+            if idx_start + 1 >= end:
+                break
+            tag = src[idx_start + 1]
+            # Anything pending starts with the tag it is waiting on, already searched this far.
+            search = idx_start + max(2, searched) if idx_start == 0 else idx_start + 2
+            idx_end = src.find(TAG_END, search)
+            if idx_end == -1:
+                # The rest of the tag hasn't arrived yet; if no more is coming, it is dropped along
+                # with everything after it.
+                if final:
+                    break
+                if end - idx_start > MAX_PENDING_TAG:
+                    self.skipping = (tag, src[idx_start + 2 : idx_start + 3] == "/")
+                    pos = end
+                else:
+                    self.searched = end - idx_start
+                break
+            tag_data = src[idx_start + 2 : idx_end]
+            pos = idx_end + 1
 
-    # Finalize and exit all remaining tags.
-    for tag in reversed(tag_stack):
-        output += exit_tag(tag)
+            if tag_data and tag_data[0] == "/":
+                # A stray closing tag at the outermost level has nothing to close, so it is ignored.
+                if stack:
+                    current = stack.pop()
+                continue
+            stack.append(current)
+            if tag == "c":
+                current = current.copy()
+                apply_rules(current, tag_data)
+            else:
+                current = ProtoStyle()
+                if tag == "p":
+                    apply_mxp(current, tag_data)
 
-    return output
+        self.current = current
+        return segments, pos
 
 
 def decode(src, errors: str = "strict") -> Text:
-    current = ProtoStyle()
-    state = 0
-    remaining = src
-    segments: List[Tuple[str, Style]] = list()
-    tag = None
-
-    while len(remaining):
-        if state == 0:
-            idx_start = remaining.find("\002")
-            if idx_start != -1:
-                segments.append((remaining[:idx_start], current.convert()))
-                remaining = remaining[idx_start + 1 :]
-                state = 1
-            else:
-                segments.append((remaining, current.convert()))
-                remaining = ""
-        elif state == 1:
-            # encountered a TAG START...
-            tag = remaining[0]
-            remaining = remaining[1:]
-            state = 2
-        elif state == 2:
-            # we are inside a tag. hoover up all data up to TAG_END...
-            idx_end = remaining.find("\003")
-            opening = True
-            if idx_end != -1:
-                tag_data = remaining[:idx_end]
-                remaining = remaining[idx_end + 1 :]
-                if tag_data and tag_data[0] == "/":
-                    opening = False
-                    tag_data = tag_data[1:]
-                if opening:
-                    current = ProtoStyle(parent=current)
-                    if tag == "p":
-                        apply_mxp(current, tag_data)
-                    elif tag == "c":
-                        current.inherit_ansi()
-                        apply_rules(current, tag_data)
-                else:
-                    current = current.parent
-                state = 0
-            else:
-                # malformed data.
-                break
+    return IncrementalDecoder(errors).decode(src, final=True)
 
-    return Text.assemble(*segments)
 
+def decode_many(
+    sources: Iterable[str], errors: str = "strict", separator: Optional[str] = None
+) -> Union[List[Text], Text]:
+    """
+    Decode many pieces of markup at once, sharing one decoder between them. See
+    BaseIncrementalDecoder.decode_many.
+    """
+    return IncrementalDecoder(errors).decode_many(sources, separator)
 
-def ansi_fun_style(code: str) -> Style:
-    if code is None:
-        code = ""
-    code = code.strip()
+
+def strip(src: str, errors: str = "strict") -> str:
+    """
+    decode(src).plain, by removing tags. They aren't checked, so markup which decode would
+    reject still has its text returned.
+    """
+    if TAG_START in src:
+        src = TAG_STRIP.sub("", src)
+    return strip_control_codes(src)
+
+
+plain_len, cell_len = measurers(strip)
+
+
+@lru_cache(maxsize=512)
+def compile_ansi(code: str) -> Style:
+    """
+    Compile a PennMUSH ansi() code string into its final Style. Softcode only ever uses a
+    handful of distinct codes, so results are memoized; Styles are immutable and safe to share.
+    """
     mark = ProtoStyle()
     apply_rules(mark, code)
     return mark.convert()
 
 
+# Codes common enough to be worth compiling before they are first seen.
+WARMUP_CODES = (
+    tuple("xrgybmcw")
+    + tuple(f"h{c}" for c in "xrgybmcw")
+    + tuple("XRGYBMCW")
+    + ("n", "h", "u", "f", "i")
+)
+
+
+def warmup():
+    """
+    Compile the most common codes, interning their Styles, and the MXP patterns, and build the
+    color name index.
+    """
+    from .colors import color_index
+
+    color_index()
+    mxp_patterns()
+    for code in WARMUP_CODES:
+        compile_ansi(code)
+
+
+def ansi_fun_style(code: str) -> Style:
+    if code is None:
+        code = ""
+    return compile_ansi(code.strip())
+
+
 def ansi_fun(code: str, text: Union[Text, str]) -> Text:
     """
     This constructor is used to create a Text from a PennMUSH style ansi() call, such as: ansi(hr,texthere!)
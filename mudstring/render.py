@@ -0,0 +1,204 @@
+from functools import lru_cache
+from typing import Optional, Tuple, NamedTuple, Iterable, Dict
+from rich.color import ColorSystem
+from rich.style import Style
+from rich.text import Text
+
+from .encodings.base import style_runs, escape_mxp
+
+
+COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "truecolor": ColorSystem.TRUECOLOR,
+}
+
+# Style attribute, SGR code to turn it on, SGR code to turn it off. Some attributes share an off
+# code, so turning one of them off may mean turning the other back on.
+SGR_ATTRS = (
+    ("bold", "1", "22"),
+    ("dim", "2", "22"),
+    ("italic", "3", "23"),
+    ("underline", "4", "24"),
+    ("blink", "5", "25"),
+    ("blink2", "6", "25"),
+    ("reverse", "7", "27"),
+    ("conceal", "8", "28"),
+    ("strike", "9", "29"),
+    ("underline2", "21", "24"),
+    ("frame", "51", "54"),
+    ("encircle", "52", "54"),
+    ("overline", "53", "55"),
+)
+
+# flags, foreground codes, background codes
+SGRState = Tuple[Tuple[bool, ...], Tuple[str, ...], Tuple[str, ...]]
+
+EMPTY_STATE: SGRState = ((False,) * len(SGR_ATTRS), (), ())
+
+# Temp secure mode, so that the MXP tag following it is honored.
+MXP_SECURE = "\x1b[4z"
+
+
+class ClientProfile(NamedTuple):
+    """
+    What a client connection is capable of displaying. Clients sharing a profile receive the
+    exact same bytes.
+    """
+
+    color_system: Optional[str] = "256"
+    mxp: bool = False
+    encoding: str = "utf-8"
+
+
+@lru_cache(maxsize=1024)
+def sgr_state(style: Optional[Style], color_system: ColorSystem) -> SGRState:
+    """
+    Reduce a Style to the SGR attributes it sets, with colors downgraded to the color system.
+    """
+    if not style:
+        return EMPTY_STATE
+    flags = tuple(bool(getattr(style, attr)) for attr, _, _ in SGR_ATTRS)
+    fg = bg = ()
+    if style.color is not None:
+        fg = style.color.downgrade(color_system).get_ansi_codes(foreground=True)
+    if style.bgcolor is not None:
+        bg = style.bgcolor.downgrade(color_system).get_ansi_codes(foreground=False)
+    return flags, tuple(fg), tuple(bg)
+
+
+@lru_cache(maxsize=4096)
+def sgr_transition(prev: SGRState, state: SGRState) -> bytes:
+    """
+    The shortest SGR sequence leading from one state to another: either changing only what
+    differs, or resetting and starting over.
+    """
+    if prev == state:
+        return b""
+    prev_flags, prev_fg, prev_bg = prev
+    flags, fg, bg = state
+
+    offs = list()
+    for (_, _, off), was, now in zip(SGR_ATTRS, prev_flags, flags):
+        if was and not now and off not in offs:
+            offs.append(off)
+    delta = offs.copy()
+    for (_, on, off), was, now in zip(SGR_ATTRS, prev_flags, flags):
+        if now and (not was or off in offs):
+            delta.append(on)
+    if fg != prev_fg:
+        delta.extend(fg or ("39",))
+    if bg != prev_bg:
+        delta.extend(bg or ("49",))
+
+    full = ["0"]
+    full.extend(on for (_, on, _), now in zip(SGR_ATTRS, flags) if now)
+    full.extend(fg)
+    full.extend(bg)
+
+    codes = ";".join(delta)
+    if len(codes) > len(full_codes := ";".join(full)):
+        codes = full_codes
+    return f"\x1b[{codes}m".encode()
+
+
+@lru_cache(maxsize=1024)
+def mxp_tags(tag: str, attrs: Tuple[Tuple[str, str], ...]) -> Tuple[str, str]:
+    """
+    The secure-mode opening and closing MXP tags for a tag and its attributes.
+    """
+    if attrs:
+        data = " ".join(f'{k}="{escape_mxp(v)}"' for k, v in attrs)
+        opening = f"{MXP_SECURE}<{tag} {data}>"
+    else:
+        opening = f"{MXP_SECURE}<{tag}>"
+    return opening, f"{MXP_SECURE}</{tag}>"
+
+
+def mxp_state(style: Optional[Style]) -> Optional[Tuple[str, str]]:
+    if not style or not (tag := getattr(style, "tag", None)):
+        return None
+    attrs = getattr(style, "xml_attr", None) or dict()
+    return mxp_tags(tag, tuple(attrs.items()))
+
+
+def render_ansi(
+    text: Text,
+    color_system: Optional[str] = "truecolor",
+    buffer: Optional[bytearray] = None,
+    encoding: str = "utf-8",
+    mxp: bool = False,
+) -> bytearray:
+    """
+    Render a Text straight into ANSI SGR bytes, without going through a rich Console. Only the
+    changes between runs of text are emitted. No wrapping or justification is performed.
+
+    Args:
+        text (Text): The text to render.
+        color_system (str): 'standard', '256', 'truecolor', or None for no styling at all.
+        buffer (bytearray): Render into this buffer instead of a new one.
+        encoding (str): The encoding used for the text itself.
+        mxp (bool): Whether to emit MXP tags for styles carrying one. The text itself is then
+            entity-escaped, as MXP clients would otherwise parse any < in it.
+
+    Returns:
+        buffer (bytearray): The buffer rendered into.
+    """
+    if buffer is None:
+        buffer = bytearray()
+    if color_system is None and not mxp:
+        buffer.extend(text.plain.encode(encoding, errors="replace"))
+        return buffer
+
+    system = COLOR_SYSTEMS[color_system] if color_system else None
+    plain = text.plain
+    current = EMPTY_STATE
+    current_mxp = None
+    for start, end, style in style_runs(text):
+        if mxp and (tags := mxp_state(style)) != current_mxp:
+            if current_mxp:
+                buffer.extend(current_mxp[1].encode(encoding))
+            if tags:
+                buffer.extend(tags[0].encode(encoding, errors="replace"))
+            current_mxp = tags
+        if system:
+            state = sgr_state(style, system)
+            if state != current:
+                buffer.extend(sgr_transition(current, state))
+                current = state
+        chunk = plain[start:end]
+        if mxp:
+            chunk = escape_mxp(chunk, quote=False)
+        buffer.extend(chunk.encode(encoding, errors="replace"))
+    if current_mxp:
+        buffer.extend(current_mxp[1].encode(encoding))
+    if current != EMPTY_STATE:
+        buffer.extend(b"\x1b[0m")
+    return buffer
+
+
+def render_profiles(text: Text, profiles: Iterable[ClientProfile]) -> Dict[ClientProfile, bytes]:
+    """
+    Render one Text for many clients, such as for a channel message. Each distinct profile is
+    rendered exactly once, so the cost scales with the number of profiles rather than the number
+    of recipients; look up each recipient's bytes by their profile.
+
+    Args:
+        text (Text): The text to render.
+        profiles (Iterable[ClientProfile]): The profiles of every recipient. Duplicates are fine.
+
+    Returns:
+        rendered (Dict[ClientProfile, bytes]): The rendered bytes for each distinct profile.
+    """
+    rendered = dict()
+    for profile in profiles:
+        if profile not in rendered:
+            rendered[profile] = bytes(
+                render_ansi(
+                    text,
+                    profile.color_system,
+                    encoding=profile.encoding,
+                    mxp=profile.mxp,
+                )
+            )
+    return rendered
@@ -1,9 +1,52 @@
+from typing import Iterable, List, Optional
+
+
 class OutBuffer:
-    def __init__(self, buffer: bytearray):
-        self.buffer = buffer
+    """
+    A file-like object for a rich Console to write into, collecting encoded bytes in a bytearray.
+
+    Written fragments are gathered up and encoded all at once whenever the buffer is flushed (rich
+    flushes after every print), rather than encoding each tiny fragment separately.
+    """
+
+    def __init__(
+        self,
+        buffer: Optional[bytearray] = None,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+    ):
+        self.buffer = buffer if buffer is not None else bytearray()
+        self.encoding = encoding
+        self.errors = errors
+        self.pending: List[str] = list()
 
-    def write(self, b: str):
-        self.buffer.extend(b.encode())
+    def write(self, b: str) -> int:
+        self.pending.append(b)
+        return len(b)
+
+    def writelines(self, lines: Iterable[str]):
+        self.pending.extend(lines)
 
     def flush(self):
-        pass
+        if self.pending:
+            self.buffer.extend("".join(self.pending).encode(self.encoding, self.errors))
+            self.pending.clear()
+
+    def getbuffer(self) -> memoryview:
+        """
+        A view of everything written so far, without copying it, as io.BytesIO.getbuffer gives.
+        The bytearray cannot be resized while the view exists, so release() it before the Console
+        prints again; use drain() instead to hand the data off.
+        """
+        self.flush()
+        return memoryview(self.buffer)
+
+    def drain(self) -> bytearray:
+        """
+        Hand over everything written so far, without copying it, and start over with an empty
+        bytearray. Anything else holding a reference to the old buffer keeps the drained data.
+        """
+        self.flush()
+        data = self.buffer
+        self.buffer = bytearray()
+        return data